@@ -3,9 +3,16 @@ import os
 
 from argparse import ArgumentParser, Namespace, ArgumentTypeError
 
-from srcs.maze_config.maze import Maze
-from srcs.maze_config.parse_config import load_config
-from srcs.maze_generator.maze_generator import MazeGenerator
+from srcs.maze_bench import DEFAULT_REPEATS, DEFAULT_SIZES, DEFAULT_WARMUP
+from srcs.maze_io import RENDER_MODES
+from srcs.maze_server import DEFAULT_CAPACITY
+
+# Each mode imports what it needs (generators, solvers, renderers,
+# asyncio, process pools, compressors) when it runs, so --help and
+# --validate do not pay for generation, and generation does not pay
+# for the server or the benchmark suite. The few defaults the parser
+# shows are imported from package __init__ modules that import
+# nothing, so building the parser loads none of those modes either.
 
 
 def main() -> None:
@@ -17,23 +24,204 @@ def main() -> None:
         "and writes it to a file using a hexadecimal wall representation. "
         "It also provides a visual representation of the maze."
         ),
-        usage="venv/bin/python %(prog)s [<path>]"
+        usage=(
+            "venv/bin/python %(prog)s [<path>] [--stream [--stream-solve]] "
+            "[--cache DIR] [--render MODE [--show-path] [--show-mask]] "
+            "[--image FILE [--image-scale N]] "
+            "[--count N [--seed S] [--jobs J] [--archive ZIP]] "
+            "[--bench [--bench-sizes N ...] [--bench-output JSON]] "
+            "[--profile [--profile-dump FILE]] "
+            "[--validate FILE [--perfect | --imperfect]] "
+            "[--serve ADDRESS [--pool-size N] [--serve-config FILE ...]]"
+        )
     )
 
     parser.add_argument(
         "config_file",
         type=check_file_exists,
+        nargs="?",
         help="Path to the configuration file"
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Carve with Eller's algorithm and write each row as soon as "
+            "it is carved (memory depends on the width only, perfect "
+            "hex mazes only, no visual output)"
+        )
+    )
+
+    parser.add_argument(
+        "--stream-solve",
+        action="store_true",
+        help=(
+            "With --stream, fill in the path line in a second pass "
+            "(loads the written grid, one byte per cell)"
+        )
+    )
+
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Serve a seeded maze from the on-disk cache in DIR, generating "
+            "and storing it on a miss; the cache counters are printed to "
+            "stderr as JSON"
+        )
+    )
+
+    render = parser.add_argument_group(
+        "visual output", "How the generated maze is drawn on stdout"
+    )
+    render.add_argument(
+        "--render", choices=RENDER_MODES, default="ascii",
+        help="Drawing style (default: ascii)"
+    )
+    render.add_argument(
+        "--show-path", action="store_true",
+        help="Overlay the entry -> exit path"
+    )
+    render.add_argument(
+        "--show-mask", action="store_true",
+        help="Draw the 42 pattern apart from the walls"
+    )
+    render.add_argument(
+        "--image", metavar="FILE", default=None,
+        help="Also export the maze and its path as a .png, .pgm or .ppm "
+             "image"
+    )
+    render.add_argument(
+        "--image-scale", type=int, default=2, metavar="N",
+        help="Pixels per cell and per wall in the image (default: 2)"
+    )
+
+    batch = parser.add_argument_group(
+        "batch mode",
+        "Generate and solve many mazes from one config in worker processes"
+    )
+    batch.add_argument(
+        "--count", type=int, help="Number of mazes to generate"
+    )
+    batch.add_argument(
+        "--seed", type=int, default=0,
+        help="Base seed; maze i is seeded from (seed, i) (default: 0)"
+    )
+    batch.add_argument(
+        "--jobs", type=int, default=None,
+        help="Worker processes (default: number of CPUs)"
+    )
+    batch.add_argument(
+        "--archive", metavar="ZIP", default=None,
+        help="Collect all mazes into one zip archive instead of "
+             "numbered files"
+    )
+
+    bench = parser.add_argument_group(
+        "benchmark mode",
+        "Time every pipeline stage across sizes and algorithms and "
+        "report the results as JSON"
+    )
+    bench.add_argument(
+        "--bench", action="store_true", help="Run the benchmark suite"
+    )
+    bench.add_argument(
+        "--bench-sizes", type=int, nargs="+", metavar="N",
+        default=list(DEFAULT_SIZES),
+        help="Square maze sides to sweep (default: %(default)s)"
+    )
+    bench.add_argument(
+        "--bench-algorithms", nargs="+", metavar="NAME", default=None,
+        help="Algorithms to benchmark (default: all)"
+    )
+    bench.add_argument(
+        "--bench-repeats", type=int, default=DEFAULT_REPEATS,
+        help="Timed runs per case (default: %(default)s)"
+    )
+    bench.add_argument(
+        "--bench-warmup", type=int, default=DEFAULT_WARMUP,
+        help="Untimed runs per case (default: %(default)s)"
+    )
+    bench.add_argument(
+        "--bench-output", metavar="JSON", default=None,
+        help="Write the JSON report to a file instead of stdout"
+    )
+
+    profile = parser.add_argument_group(
+        "profiling",
+        "Measure one generation: per-stage times and work counters"
+    )
+    profile.add_argument(
+        "--profile", action="store_true",
+        help="Print a JSON report of stage times and counters to stderr"
+    )
+    profile.add_argument(
+        "--profile-dump", metavar="FILE", default=None,
+        help="Also run under cProfile and dump the stats to FILE "
+             "(read it with pstats)"
+    )
+
+    validate = parser.add_argument_group(
+        "validation mode",
+        "Check an output file instead of generating a maze"
+    )
+    validate.add_argument(
+        "--validate", metavar="FILE", default=None,
+        help="Validate a maze file (hex or binary output format); exits "
+             "with status 1 if any check fails"
+    )
+    perfect = validate.add_mutually_exclusive_group()
+    perfect.add_argument(
+        "--perfect", dest="perfect", action="store_true", default=None,
+        help="Also require exactly one route between any two cells"
+    )
+    perfect.add_argument(
+        "--imperfect", dest="perfect", action="store_false",
+        help="Only require the path to be a shortest one"
+    )
+
+    serve = parser.add_argument_group(
+        "server mode",
+        "Serve mazes over a socket from warm in-memory pools refilled by "
+        "worker processes (--jobs, --seed); see srcs/maze_server/server.py "
+        "for the JSON-lines protocol"
+    )
+    serve.add_argument(
+        "--serve", metavar="ADDRESS", default=None,
+        help="Listen on HOST:PORT, PORT or unix:PATH"
+    )
+    serve.add_argument(
+        "--pool-size", type=int, default=DEFAULT_CAPACITY, metavar="N",
+        help="Mazes kept ready per config (default: %(default)s)"
+    )
+    serve.add_argument(
+        "--serve-config", metavar="FILE", type=check_file_exists,
+        action="append", default=[],
+        help="Serve another config, named after its file; repeatable"
+    )
+
     args: Namespace = parser.parse_args()
 
+    if args.validate is None and args.config_file is None:
+        parser.error("the following arguments are required: config_file")
+
+    if args.stream_solve and not args.stream:
+        parser.error("--stream-solve requires --stream")
+
+    if args.cache is not None and (args.stream or args.count is not None):
+        parser.error("--cache cannot be combined with --stream or --count")
+
     try:
-        parsed_config : dict[str, str] = load_config(args.config_file)
-        maze : Maze = Maze(parsed_config)
-        print(maze)
-        maze_generator : MazeGenerator = MazeGenerator(maze)
-        maze_generator.debug_print_cell_walls()
+        if args.validate is not None:
+            validate_mode(args)
+        elif args.serve is not None:
+            serve_mode(args)
+        elif args.bench:
+            bench_mode(args)
+        else:
+            generate_mode(args)
 
     except Exception as e:
         print(f"[Error]: {e}", file=sys.stderr)
@@ -41,6 +229,169 @@ def main() -> None:
 
 
 
+def validate_mode(args: Namespace) -> None:
+    """
+    Check a maze file and report every failed check.
+
+    :param args: Parsed command line
+    :type args: Namespace
+    :return:
+    :rtype: None
+    :raises SystemExit: With status 1 if any check fails
+    """
+
+    from srcs.maze_io.validator import ValidationReport, validate_file
+
+    validation : ValidationReport = validate_file(args.validate, args.perfect)
+
+    for error in validation.errors:
+        print(f"{args.validate}: {error}", file=sys.stderr)
+    print(
+        f"{args.validate}: "
+        f"{'OK' if validation.ok else 'INVALID'} "
+        f"({len(validation.checks)} checks, "
+        f"{len(validation.errors)} error(s))"
+    )
+
+    if not validation.ok:
+        sys.exit(1)
+
+
+def serve_mode(args: Namespace) -> None:
+    """
+    Serve mazes from warm pools until interrupted.
+
+    :param args: Parsed command line
+    :type args: Namespace
+    :return:
+    :rtype: None
+    """
+
+    from srcs.maze_server.server import run_server
+
+    run_server(
+        [args.config_file, *args.serve_config],
+        args.serve,
+        args.pool_size,
+        args.jobs,
+        args.seed,
+        lambda address: print(f"Serving mazes on {address}", file=sys.stderr)
+    )
+
+
+def bench_mode(args: Namespace) -> None:
+    """
+    Run the benchmark suite and write its JSON report.
+
+    :param args: Parsed command line
+    :type args: Namespace
+    :return:
+    :rtype: None
+    """
+
+    from srcs.maze_bench.suite import run_benchmarks, write_report
+
+    write_report(
+        run_benchmarks(
+            args.config_file,
+            args.bench_sizes,
+            args.bench_algorithms,
+            args.bench_repeats,
+            args.bench_warmup,
+            args.seed,
+            lambda line: print(line, file=sys.stderr)
+        ),
+        args.bench_output
+    )
+
+
+def generate_mode(args: Namespace) -> None:
+    """
+    Generate one maze (or a batch, or a streamed maze) from the config.
+
+    :param args: Parsed command line
+    :type args: Namespace
+    :return:
+    :rtype: None
+    """
+
+    from srcs.maze_config.maze import Maze
+    from srcs.maze_config.parse_config import load_config
+    from srcs.maze_profile.instrument import (
+        DISABLED, Instrumentation, profiled
+    )
+
+    probe : Instrumentation = Instrumentation() if args.profile else DISABLED
+
+    with probe.stage("load_config"):
+        parsed_config : dict[str, str] = load_config(args.config_file)
+
+    if args.count is not None:
+        from srcs.maze_batch.batch import BatchReport, run_batch
+
+        report : BatchReport = run_batch(
+            parsed_config, args.count, args.seed, args.jobs, args.archive
+        )
+        print(
+            f"Generated {report.count} mazes in {report.seconds:.2f}s "
+            f"with {report.jobs} job(s): "
+            f"{report.mazes_per_second:.1f} mazes/s"
+        )
+        return
+
+    with probe.stage("validate"):
+        maze : Maze = Maze(parsed_config)
+    print(maze)
+
+    if args.stream:
+        from srcs.maze_generator.streaming import generate_streaming
+
+        generate_streaming(maze, solve=args.stream_solve)
+        return
+
+    from srcs.maze_generator.pipeline import MazePipeline
+    from srcs.maze_io.render import write_rendered
+
+    with profiled(args.profile_dump):
+        if args.cache is None:
+            from srcs.maze_generator.maze_generator import MazeGenerator
+
+            pipeline : MazePipeline = MazeGenerator(
+                maze, instrumentation=probe
+            )
+        else:
+            # A hit skips generation and solving, a miss generates and
+            # stores the maze; the output file is written either way
+            import json
+
+            from srcs.maze_io.cache import CachedMaze, MazeCache
+
+            cache : MazeCache = MazeCache(args.cache)
+            cached : CachedMaze = cache.get_or_generate(maze)
+            print(json.dumps({"cache": cache.stats()}), file=sys.stderr)
+            pipeline = MazePipeline.restore(
+                maze, cached.grid, cached.directions
+            )
+
+        probe.count("bytes_rendered", write_rendered(
+            pipeline.render(args.render, args.show_path, args.show_mask)
+        ))
+
+        if args.image:
+            from srcs.maze_io.image import export_image
+
+            with probe.stage("export_image"):
+                probe.count("image_bytes", export_image(
+                    args.image, pipeline.grid, pipeline.path,
+                    args.image_scale
+                ))
+
+    if probe.enabled:
+        import json
+
+        print(json.dumps(probe.report(), indent=2), file=sys.stderr)
+
+
 def check_file_exists(path: str) -> str:
     """
     Validates whether the given path exists, points to a regular file,
@@ -0,0 +1,80 @@
+"""
+Throughput and peak-memory table for every registered carver.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_algorithms [SIZE ...]
+
+Each SIZE is the side of a square maze with the 42 mask applied; the
+default sweep is 100 and 300. Timing and memory are measured in two
+separate runs, since tracemalloc slows the carvers down.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from srcs.maze_generator.algorithms.registry import ALGORITHMS, Carver
+from srcs.maze_generator.mask import mask_42_cells
+from srcs.maze_generator.maze_grid import MazeGrid
+
+
+DEFAULT_SIZES : tuple[int, ...] = (100, 300)
+
+
+def masked_grid(size: int) -> MazeGrid:
+    grid : MazeGrid = MazeGrid(size, size)
+    for x, y in mask_42_cells(size, size):
+        grid.block(grid.index(x, y))
+    return (grid)
+
+
+def bench_algorithm(carve: Carver, size: int, seed: int = 42) -> tuple[
+        int, float, int]:
+    """
+    Time one carve and measure its peak traced allocation.
+
+    :param carve: Carver under test
+    :type carve: Carver
+    :param size: Side of the square maze in cells
+    :type size: int
+    :param seed: Seed of the random source
+    :type seed: int
+    :return: Carved cells, elapsed seconds and peak bytes allocated by
+        the carver (the grid itself excluded)
+    :rtype: tuple[int, float, int]
+    """
+
+    grid : MazeGrid = masked_grid(size)
+    started : float = time.perf_counter()
+    carved : int = carve(grid, 0, random.Random(seed))
+    elapsed : float = time.perf_counter() - started
+
+    grid = masked_grid(size)
+    tracemalloc.start()
+    carve(grid, 0, random.Random(seed))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (carved, elapsed, peak)
+
+
+def main(argv: list[str]) -> None:
+    sizes : list[int] = [int(arg) for arg in argv] or list(DEFAULT_SIZES)
+
+    print(
+        f"{'algorithm':<12} {'size':>9} {'seconds':>9} "
+        f"{'cells/s':>10} {'peak MiB':>9}"
+    )
+    for size in sizes:
+        for name, carve in ALGORITHMS.items():
+            carved, elapsed, peak = bench_algorithm(carve, size)
+            print(
+                f"{name:<12} {f'{size}x{size}':>9} {elapsed:>9.3f} "
+                f"{carved / elapsed:>10.0f} {peak / (1 << 20):>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
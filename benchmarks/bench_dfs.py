@@ -0,0 +1,58 @@
+"""
+Throughput benchmark for the iterative DFS carver.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_dfs [SIZE ...]
+
+Each SIZE is the side of a square maze; the default sweep is
+100, 1000 and 4000. The 42 mask is left out so every cell is carved.
+"""
+
+import random
+import sys
+import time
+
+from srcs.maze_generator.algorithms.dfs import carve_dfs
+from srcs.maze_generator.maze_grid import MazeGrid
+
+
+DEFAULT_SIZES : tuple[int, ...] = (100, 1000, 4000)
+
+
+def bench_carve(size: int, seed: int = 42) -> tuple[int, float]:
+    """
+    Carve one size x size maze and time the carving only.
+
+    :param size: Side of the square maze in cells
+    :type size: int
+    :param seed: Seed of the random source
+    :type seed: int
+    :return: Number of carved cells and elapsed seconds
+    :rtype: tuple[int, float]
+    """
+
+    grid : MazeGrid = MazeGrid(size, size)
+    rng : random.Random = random.Random(seed)
+
+    started : float = time.perf_counter()
+    carved : int = carve_dfs(grid, 0, rng)
+    elapsed : float = time.perf_counter() - started
+
+    return (carved, elapsed)
+
+
+def main(argv: list[str]) -> None:
+    sizes : list[int] = [int(arg) for arg in argv] or list(DEFAULT_SIZES)
+
+    print(f"{'size':>11} {'cells':>12} {'seconds':>9} {'cells/s':>12}")
+    for size in sizes:
+        carved, elapsed = bench_carve(size)
+        print(
+            f"{f'{size}x{size}':>11} {carved:>12} "
+            f"{elapsed:>9.3f} {carved / elapsed:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,128 @@
+"""
+Incremental editing versus solving the edited maze from scratch.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_edit [SIZE ...]
+
+Each SIZE is the side of a square maze with the 42 mask applied; the
+default sweep is 100 and 250. A random sequence of wall toggles and
+block / unblock edits is applied through a MazeEditor, which repairs
+the corner to corner path after every edit, and the same sequence is
+replayed on a copy of the maze with a full A* solve after every edit.
+"""
+
+import random
+import sys
+import time
+
+from srcs.maze_generator.maze_grid import EAST, NORTH, SOUTH, WEST, MazeGrid
+from srcs.maze_solver.astar import solve_astar
+from srcs.maze_solver.incremental import MazeEditor
+
+from benchmarks.bench_solvers import build_maze
+
+
+DEFAULT_SIZES : tuple[int, ...] = (100, 250)
+EDITS : int = 100
+
+
+def random_edits(
+    grid: MazeGrid, count: int, seed: int = 7
+) -> list[tuple[str, int, int]]:
+    """
+    Draw a reproducible sequence of edits away from the entry and exit.
+
+    :param grid: The maze the edits apply to
+    :type grid: MazeGrid
+    :param count: Number of edits
+    :type count: int
+    :param seed: Seed of the sequence
+    :type seed: int
+    :return: (operation, cell, direction) triples
+    :rtype: list[tuple[str, int, int]]
+    """
+
+    rng : random.Random = random.Random(seed)
+    edits : list[tuple[str, int, int]] = []
+
+    while len(edits) < count:
+        idx : int = rng.randrange(1, len(grid) - 1)
+        x, y = grid.coords(idx)
+        direction : int = rng.choice((NORTH, EAST, SOUTH, WEST))
+        operation : str = rng.choice(
+            ("open_wall", "close_wall", "open_wall", "close_wall", "block",
+             "unblock")
+        )
+
+        if operation.endswith("_wall") and (
+            (direction == NORTH and y == 0)
+            or (direction == SOUTH and y == grid.height - 1)
+            or (direction == WEST and x == 0)
+            or (direction == EAST and x == grid.width - 1)
+        ):
+            continue
+        edits.append((operation, idx, direction))
+
+    return (edits)
+
+
+def apply(editor: MazeEditor, edit: tuple[str, int, int]) -> int:
+    operation, idx, direction = edit
+
+    try:
+        if operation == "block":
+            return (editor.block(idx))
+        if operation == "unblock":
+            return (editor.unblock(idx))
+        if operation == "open_wall":
+            return (editor.open_wall(idx, direction))
+        return (editor.close_wall(idx, direction))
+    except ValueError:
+        # Opening a wall of a blocked cell
+        return (0)
+
+
+def main(argv: list[str]) -> None:
+    sizes : list[int] = [int(arg) for arg in argv] or list(DEFAULT_SIZES)
+
+    print(
+        f"{'maze':>15} {'relabelled':>11} {'edit us':>9} "
+        f"{'resolve us':>11} {'speedup':>8}"
+    )
+    for size in sizes:
+        for loops in (False, True):
+            grid : MazeGrid = build_maze(size, loops)
+            replay : MazeGrid = MazeGrid.from_cells(
+                size, size, bytearray(grid.cells)
+            )
+            edits : list[tuple[str, int, int]] = random_edits(grid, EDITS)
+            label : str = f"{size}x{size} {'loops' if loops else 'tree'}"
+
+            editor : MazeEditor = MazeEditor(grid, 0, len(grid) - 1)
+            relabelled : int = 0
+            started : float = time.perf_counter()
+            for edit in edits:
+                relabelled += apply(editor, edit)
+                editor.path()
+            edit_seconds : float = time.perf_counter() - started
+
+            # Same edits on the copy (not timed), then a full solve each time
+            baseline : MazeEditor = MazeEditor(replay, 0, len(replay) - 1)
+            resolve_seconds : float = 0.0
+            for edit in edits:
+                apply(baseline, edit)
+                started = time.perf_counter()
+                solve_astar(replay, 0, len(replay) - 1)
+                resolve_seconds += time.perf_counter() - started
+
+            print(
+                f"{label:>15} {relabelled / EDITS:>11.1f} "
+                f"{edit_seconds / EDITS * 1e6:>9.1f} "
+                f"{resolve_seconds / EDITS * 1e6:>11.1f} "
+                f"{resolve_seconds / edit_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,83 @@
+"""
+Memory benchmark: bytes per cell of the old per-cell objects versus the
+compact MazeGrid.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_memory [SIZE ...]
+
+The "before" column rebuilds the historical layout (a list of lists of
+Cell objects with eight instance attributes each) with a local replica
+class, since Cell is now a view over MazeGrid.
+"""
+
+import sys
+import tracemalloc
+
+from typing import Callable
+
+from srcs.maze_generator.maze_grid import MazeGrid
+
+
+DEFAULT_SIZES : tuple[int, ...] = (100, 500, 1000)
+
+
+class LegacyCell:
+    """Replica of the pre-MazeGrid Cell instance layout."""
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+        self.visited = False
+        self.blocked = False
+
+        self.north = True
+        self.south = True
+        self.east = True
+        self.west = True
+
+
+def build_legacy(size: int) -> object:
+    return ([[LegacyCell(x, y) for x in range(size)] for y in range(size)])
+
+
+def build_grid(size: int) -> object:
+    return (MazeGrid(size, size))
+
+
+def measure(build: Callable[[int], object], size: int) -> float:
+    """
+    Return the traced allocation size per cell of a freshly built grid.
+
+    :param build: Grid factory taking the side of a square maze
+    :type build: Callable[[int], object]
+    :param size: Side of the square maze in cells
+    :type size: int
+    :return: Bytes allocated per cell
+    :rtype: float
+    """
+
+    tracemalloc.start()
+    grid : object = build(size)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grid
+
+    return (allocated / (size * size))
+
+
+def main(argv: list[str]) -> None:
+    sizes : list[int] = [int(arg) for arg in argv] or list(DEFAULT_SIZES)
+
+    print(f"{'size':>11} {'Cell objects':>14} {'MazeGrid':>10}")
+    for size in sizes:
+        before : float = measure(build_legacy, size)
+        after : float = measure(build_grid, size)
+        print(
+            f"{f'{size}x{size}':>11} {before:>12.1f} B {after:>8.2f} B"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+"""
+Expansion and timing table for every registered solver engine.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_solvers [SIZE ...]
+
+Each SIZE is the side of a square maze with the 42 mask applied; the
+default sweep is 100 and 500. Every engine solves corner to corner on
+a perfect maze (DFS) and on the same maze with 10% of its walls opened.
+"""
+
+import random
+import sys
+
+from srcs.maze_generator.algorithms.dfs import carve_dfs
+from srcs.maze_generator.loops import add_loops
+from srcs.maze_generator.mask import mask_42_cells
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_solver.search import ENGINES, SearchReport, search
+
+
+DEFAULT_SIZES : tuple[int, ...] = (100, 500)
+LOOP_FRACTION : float = 0.1
+
+
+def build_maze(size: int, loops: bool, seed: int = 42) -> MazeGrid:
+    grid : MazeGrid = MazeGrid(size, size)
+    for x, y in mask_42_cells(size, size):
+        grid.block(grid.index(x, y))
+
+    rng : random.Random = random.Random(seed)
+    carve_dfs(grid, 0, rng)
+    if loops:
+        add_loops(grid, LOOP_FRACTION, rng)
+    return (grid)
+
+
+def main(argv: list[str]) -> None:
+    sizes : list[int] = [int(arg) for arg in argv] or list(DEFAULT_SIZES)
+
+    print(
+        f"{'engine':<14} {'maze':>15} {'path':>8} "
+        f"{'expanded':>9} {'pushes':>9} {'seconds':>9}"
+    )
+    for size in sizes:
+        for loops in (False, True):
+            grid : MazeGrid = build_maze(size, loops)
+            label : str = f"{size}x{size} {'loops' if loops else 'tree'}"
+
+            for engine in ENGINES:
+                report : SearchReport = search(
+                    grid, 0, len(grid) - 1, engine
+                )
+                print(
+                    f"{engine:<14} {label:>15} "
+                    f"{len(report.result.path):>8} "
+                    f"{report.result.expanded:>9} "
+                    f"{report.result.pushes:>9} {report.seconds:>9.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,176 @@
+"""
+Cold-start benchmark of the a_maze_ing.py entry point.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_startup [--check] [--repeats N]
+
+Every scenario runs the entry point in a fresh interpreter under
+`python -X importtime` and reports the median wall time, the median
+total import time and the slowest top-level imports. With --check the
+run fails (exit status 1) when a scenario goes over its import budget
+or loads a module its mode should never need, so CI can guard the
+cold-start budget.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass
+
+
+ENTRY_POINT : str = "a_maze_ing.py"
+DEFAULT_REPEATS : int = 5
+SLOWEST_SHOWN : int = 5
+
+# Median total import time allowed per scenario, in milliseconds
+BUDGETS_MS : dict[str, float] = {
+    "help": 60.0,
+    "validate": 100.0,
+    "generate": 120.0,
+}
+
+# Modules a scenario must not load: they belong to other modes. lzma
+# is not listed, argparse loads it through shutil whatever the mode.
+FORBIDDEN : dict[str, tuple[str, ...]] = {
+    "help": (
+        "srcs.maze_generator", "srcs.maze_solver", "srcs.maze_config.maze",
+        "srcs.maze_io.render", "asyncio", "multiprocessing", "zipfile",
+    ),
+    "validate": (
+        "srcs.maze_generator.pipeline", "srcs.maze_io.render", "asyncio",
+        "multiprocessing", "concurrent.futures",
+    ),
+    "generate": (
+        "srcs.maze_server.pool", "srcs.maze_bench.suite",
+        "srcs.maze_io.validator", "srcs.maze_io.binary_format",
+        "srcs.maze_generator.tiled", "srcs.maze_generator.loops",
+        "srcs.maze_solver.distance", "srcs.maze_solver.incremental",
+        "asyncio", "multiprocessing", "zipfile", "cProfile",
+    ),
+}
+
+CONFIG : str = (
+    "WIDTH=20\nHEIGHT=15\nPERFECT=True\nSEED=42\nOUTPUT_FILE={output}\n"
+)
+
+
+@dataclass(frozen=True)
+class Sample:
+    seconds: float
+    import_us: int
+    modules: dict[str, int]
+
+
+def run_once(args: list[str]) -> Sample:
+    """
+    Run the entry point once under -X importtime.
+
+    :param args: Command line arguments of the entry point
+    :type args: list[str]
+    :return: Wall time, total import time and cumulative time of every
+        top-level import
+    :rtype: Sample
+    :raises RuntimeError: If the entry point fails
+    """
+
+    started : float = time.perf_counter()
+    process : subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-X", "importtime", ENTRY_POINT, *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    seconds : float = time.perf_counter() - started
+
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"{ENTRY_POINT} {' '.join(args)} failed:\n{process.stderr}"
+        )
+
+    # "import time: self [us] | cumulative | imported package", nested
+    # imports are indented, so top-level lines hold the whole cost
+    modules : dict[str, int] = {}
+    import_us : int = 0
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields : list[str] = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        name : str = fields[2].rstrip()
+        cumulative : int = int(fields[1])
+        modules[name.strip()] = cumulative
+        if not name.startswith("  "):
+            import_us += cumulative
+
+    return (Sample(seconds, import_us, modules))
+
+
+def main(argv: list[str]) -> None:
+    check : bool = "--check" in argv
+    repeats : int = (
+        int(argv[argv.index("--repeats") + 1])
+        if "--repeats" in argv else DEFAULT_REPEATS
+    )
+    failures : list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config : str = os.path.join(tmp, "startup.txt")
+        output : str = os.path.join(tmp, "maze.txt")
+        with open(config, "w", encoding="utf-8") as file:
+            file.write(CONFIG.format(output=output))
+
+        scenarios : dict[str, list[str]] = {
+            "help": ["--help"],
+            "generate": [config],
+            "validate": ["--validate", output],
+        }
+
+        print(
+            f"{'scenario':<10} {'wall ms':>9} {'import ms':>10}  "
+            f"slowest top-level imports"
+        )
+        for scenario, args in scenarios.items():
+            samples : list[Sample] = [run_once(args) for _ in range(repeats)]
+            wall_ms : float = 1e3 * statistics.median(
+                sample.seconds for sample in samples
+            )
+            import_ms : float = 1e-3 * statistics.median(
+                sample.import_us for sample in samples
+            )
+            modules : dict[str, int] = samples[-1].modules
+            slowest : list[str] = sorted(
+                (name for name in modules if "." not in name or
+                 name.startswith("srcs.")),
+                key=modules.__getitem__, reverse=True
+            )[:SLOWEST_SHOWN]
+
+            print(
+                f"{scenario:<10} {wall_ms:>9.1f} {import_ms:>10.1f}  "
+                + ", ".join(
+                    f"{name} {modules[name] / 1e3:.1f}" for name in slowest
+                )
+            )
+
+            if import_ms > BUDGETS_MS[scenario]:
+                failures.append(
+                    f"{scenario}: imports take {import_ms:.1f} ms, "
+                    f"budget {BUDGETS_MS[scenario]:.0f} ms"
+                )
+            for name in FORBIDDEN[scenario]:
+                if name in modules:
+                    failures.append(f"{scenario}: loads {name}")
+
+    for failure in failures:
+        print(f"[Budget] {failure}", file=sys.stderr)
+
+    if check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_generator import MazeGenerator
+
+# Per-task seeds are base_seed * TASK_SEED_STRIDE + task index, so two
+# batches with different base seeds never share a task seed
+TASK_SEED_STRIDE : int = 1 << 32
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    count: int
+    jobs: int
+    seconds: float
+    outputs: list[str]
+
+    @property
+    def mazes_per_second(self) -> float:
+        return (self.count / self.seconds if self.seconds else 0.0)
+
+
+def task_seed(base_seed: int, index: int) -> int:
+    """
+    Return the seed of one task of a batch.
+
+    :param base_seed: Seed of the whole batch
+    :type base_seed: int
+    :param index: Position of the task in the batch
+    :type index: int
+    :return: Seed used for that task only
+    :rtype: int
+    """
+
+    return (base_seed * TASK_SEED_STRIDE + index)
+
+
+def numbered_path(output_file: str, index: int, count: int) -> str:
+    """
+    Derive the output path of one maze of a batch.
+
+    "maze.txt" becomes "maze_007.txt", zero-padded to the width of the
+    largest index.
+
+    :param output_file: Configured output file
+    :type output_file: str
+    :param index: Position of the maze in the batch
+    :type index: int
+    :param count: Number of mazes in the batch
+    :type count: int
+    :return: Output path of that maze
+    :rtype: str
+    """
+
+    stem, ext = os.path.splitext(output_file)
+    digits : int = len(str(max(count - 1, 0)))
+    return (f"{stem}_{index:0{digits}d}{ext}")
+
+
+def _generate_one(task: tuple[dict[str, str], int, str]) -> str:
+    """
+    Worker entry point: generate, solve and write one maze.
+
+    :param task: Config dict, task seed and output path
+    :type task: tuple[dict[str, str], int, str]
+    :return: The output path
+    :rtype: str
+    """
+
+    config, seed, output_file = task
+
+    MazeGenerator(Maze({**config, "output_file": output_file}), seed)
+
+    return (output_file)
+
+
+def run_batch(
+    config: dict[str, str],
+    count: int,
+    seed: int = 0,
+    jobs: int | None = None,
+    archive: str | None = None
+) -> BatchReport:
+    """
+    Generate many mazes from one config across a process pool.
+
+    Task i is seeded with task_seed(seed, i) (a seed key in the config
+    is overridden), so a batch is reproducible whatever the number of
+    jobs. Mazes are written to numbered files next to the configured
+    output file, or, when an archive path is given, collected into one
+    zip archive.
+
+    :param config: Parsed configuration, as returned by load_config()
+    :type config: dict[str, str]
+    :param count: Number of mazes to generate
+    :type count: int
+    :param seed: Seed of the whole batch
+    :type seed: int
+    :param jobs: Worker processes, defaults to the number of CPUs
+    :type jobs: int | None
+    :param archive: Optional path of a zip archive holding all mazes
+    :type archive: str | None
+    :return: Batch summary
+    :rtype: BatchReport
+    :raises ValueError: If the config is invalid or count is not positive
+    """
+
+    if count <= 0:
+        raise ValueError(f"Maze count must be positive: {count}")
+
+    maze : Maze = Maze(config)
+    workers : int = max(1, jobs or os.cpu_count() or 1)
+    started : float = time.perf_counter()
+
+    target_dir : str | None = tempfile.mkdtemp() if archive else None
+    output_file : str = (
+        os.path.join(target_dir, os.path.basename(maze.output_file))
+        if target_dir else maze.output_file
+    )
+
+    tasks : list[tuple[dict[str, str], int, str]] = [
+        (config, task_seed(seed, index),
+         numbered_path(output_file, index, count))
+        for index in range(count)
+    ]
+
+    try:
+        outputs : list[str] = list(_run_tasks(tasks, workers))
+
+        if archive and target_dir:
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+                for path in outputs:
+                    zf.write(path, os.path.basename(path))
+            outputs = [archive]
+    finally:
+        if target_dir:
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+    return (BatchReport(
+        count, workers, time.perf_counter() - started, outputs
+    ))
+
+
+def _run_tasks(
+    tasks: list[tuple[dict[str, str], int, str]],
+    workers: int
+) -> Iterator[str]:
+    if workers == 1:
+        yield from map(_generate_one, tasks)
+        return
+
+    # A few chunks per worker keeps IPC overhead low and load balanced
+    chunksize : int = max(1, len(tasks) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generate_one, tasks, chunksize=chunksize)
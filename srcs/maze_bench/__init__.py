@@ -0,0 +1,5 @@
+# Defaults of the benchmark suite
+
+DEFAULT_SIZES : tuple[int, ...] = (25, 100, 250)
+DEFAULT_REPEATS : int = 5
+DEFAULT_WARMUP : int = 1
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import tracemalloc
+
+from typing import Callable
+
+from srcs.maze_bench import DEFAULT_REPEATS, DEFAULT_SIZES, DEFAULT_WARMUP
+from srcs.maze_config.maze import Maze
+from srcs.maze_config.parse_config import load_config
+from srcs.maze_generator.algorithms.registry import ALGORITHMS
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_profile.instrument import Instrumentation
+from srcs.maze_profile.stats import percentile
+
+
+# Bumped whenever the JSON layout changes, so CI diffs compare like
+# with like
+SCHEMA_VERSION : int = 3
+
+# Pipeline stages, in the order MazePipeline runs them, under the names
+# its instrumentation uses
+STAGES : tuple[str, ...] = (
+    "load_config",
+    "validate",
+    "init_grid",
+    "apply_42_mask",
+    "carve",
+    "add_loops",
+    "solve",
+    "path_to_dir",
+    "write_output",
+    "render",
+)
+
+
+def peak_rss_bytes() -> int:
+    """
+    Return the peak resident set size of this process so far.
+
+    This is a high-water mark over the whole process lifetime, so it
+    only fits a report-wide figure; per-case memory is measured with
+    peak_traced_bytes().
+
+    :return: Peak RSS in bytes
+    :rtype: int
+    """
+
+    peak : int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return (peak if sys.platform == "darwin" else peak * 1024)
+
+
+def peak_traced_bytes(call: Callable[[], object]) -> int:
+    """
+    Return the peak Python heap allocated while one call runs.
+
+    The call runs under tracemalloc, with its peak reset first, so the
+    figure belongs to this call only. Tracing slows allocations down,
+    so timed runs never run under it.
+
+    :param call: Work to measure
+    :type call: Callable[[], object]
+    :return: Peak traced allocation size in bytes
+    :rtype: int
+    """
+
+    tracing : bool = tracemalloc.is_tracing()
+
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    try:
+        call()
+        return (tracemalloc.get_traced_memory()[1])
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def time_pipeline(
+    config_file: str,
+    overrides: dict[str, str],
+    output_file: str,
+    seed: int
+) -> dict[str, float]:
+    """
+    Run the whole pipeline once and time every stage on its own.
+
+    Config loading and validation are timed here, like the CLI does;
+    every later stage is timed by the MazePipeline itself through an
+    Instrumentation probe, so the benchmark runs exactly what the
+    program runs (tiling, tree-index or A* solving, output format).
+    Rendering, with the path, is timed in memory; nothing is printed.
+
+    :param config_file: Configuration file, parsed on every run
+    :type config_file: str
+    :param overrides: Config keys replacing the parsed ones
+    :type overrides: dict[str, str]
+    :param output_file: Where the output is written
+    :type output_file: str
+    :param seed: Seed of the run's random source
+    :type seed: int
+    :return: Stage name -> elapsed seconds
+    :rtype: dict[str, float]
+    """
+
+    probe : Instrumentation = Instrumentation()
+
+    with probe.stage("load_config"):
+        config : dict[str, str] = load_config(config_file)
+    config.update(overrides, output_file=output_file)
+
+    with probe.stage("validate"):
+        maze : Maze = Maze(config)
+
+    pipeline : MazePipeline = MazePipeline(maze, seed, probe)
+    pipeline.write()
+    pipeline.render(show_path=True)
+
+    return (dict(probe.stages))
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    """
+    Reduce repeated stage timings to median and p95.
+
+    :param runs: One stage -> seconds dict per repeat
+    :type runs: list[dict[str, float]]
+    :return: Stage name (plus "total") -> {"median", "p95", "min",
+        "max"} in seconds
+    :rtype: dict[str, dict[str, float]]
+    """
+
+    columns : dict[str, list[float]] = {}
+    for run in runs:
+        for stage in STAGES:
+            if stage in run:
+                columns.setdefault(stage, []).append(run[stage])
+        columns.setdefault("total", []).append(sum(run.values()))
+
+    return ({
+        stage: {
+            "median": statistics.median(samples),
+            "p95": percentile(samples, 0.95),
+            "min": min(samples),
+            "max": max(samples),
+        }
+        for stage, samples in columns.items()
+    })
+
+
+def run_benchmarks(
+    config_file: str,
+    sizes: list[int] | None = None,
+    algorithms: list[str] | None = None,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = 0,
+    progress: Callable[[str], None] | None = None
+) -> dict[str, object]:
+    """
+    Benchmark the pipeline across a size sweep and every algorithm.
+
+    Every (size, algorithm) case is run warmup times untimed, then
+    repeats times, then once more under tracemalloc for its peak memory.
+    Each run uses the same seed, so repeats do identical work. Entry and
+    exit are moved to opposite corners so that every size is valid
+    whatever the config says.
+
+    :param config_file: Base configuration file
+    :type config_file: str
+    :param sizes: Square maze sides, defaults to DEFAULT_SIZES
+    :type sizes: list[int] | None
+    :param algorithms: Algorithm names, defaults to all registered
+    :type algorithms: list[str] | None
+    :param repeats: Timed runs per case
+    :type repeats: int
+    :param warmup: Untimed runs per case
+    :type warmup: int
+    :param seed: Seed of every run
+    :type seed: int
+    :param progress: Optional callback receiving one line per case
+    :type progress: Callable[[str], None] | None
+    :return: JSON-serialisable report
+    :rtype: dict[str, object]
+    :raises ValueError: If repeats is not positive or an algorithm is
+        not supported
+    """
+
+    if repeats <= 0:
+        raise ValueError(f"Benchmark repeats must be positive: {repeats}")
+
+    names : list[str] = algorithms or list(ALGORITHMS)
+    for name in names:
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {name}")
+
+    results : list[dict[str, object]] = []
+
+    with tempfile.TemporaryDirectory() as scratch:
+        output_file : str = os.path.join(scratch, "maze.txt")
+
+        for size in sizes or DEFAULT_SIZES:
+            for name in names:
+                overrides : dict[str, str] = {
+                    "width": str(size),
+                    "height": str(size),
+                    "entry": "0,0",
+                    "exit": f"{size - 1},{size - 1}",
+                    "algorithm": name,
+                }
+                runs : list[dict[str, float]] = [
+                    time_pipeline(config_file, overrides, output_file, seed)
+                    for _ in range(warmup + repeats)
+                ][warmup:]
+                stages : dict[str, dict[str, float]] = summarize(runs)
+
+                results.append({
+                    "size": size,
+                    "algorithm": name,
+                    "cells": size * size,
+                    "stages": stages,
+                    "peak_traced_bytes": peak_traced_bytes(
+                        lambda: time_pipeline(
+                            config_file, overrides, output_file, seed
+                        )
+                    ),
+                })
+
+                if progress:
+                    progress(
+                        f"{name:<12} {f'{size}x{size}':>9} "
+                        f"median {stages['total']['median']:.4f}s "
+                        f"p95 {stages['total']['p95']:.4f}s"
+                    )
+
+    return ({
+        "schema": SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "config_file": config_file,
+        "repeats": repeats,
+        "warmup": warmup,
+        "seed": seed,
+        "process_peak_rss_bytes": peak_rss_bytes(),
+        "results": results,
+    })
+
+
+def write_report(report: dict[str, object], output_file: str | None) -> None:
+    """
+    Write a benchmark report as JSON, to a file or standard output.
+
+    :param report: Output of run_benchmarks()
+    :type report: dict[str, object]
+    :param output_file: Destination file, standard output if None
+    :type output_file: str | None
+    :return:
+    :rtype: None
+    """
+
+    text : str = json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+    if output_file is None:
+        sys.stdout.write(text)
+        return
+
+    with open(output_file, "w", encoding="utf-8") as file:
+        file.write(text)
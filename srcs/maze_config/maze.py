@@ -13,16 +13,24 @@ class Maze:
     perfect: bool
     output_file: str
     algorithm: str
+    loop_fraction: float
+    seed: int | None
+    tile_size: int
+    output_format: str
+    compression: str
 
     __DEFAULT_ENTRY_POS : str = "0,0"
     __DEFAULT_SIZE : int = 20
+    __DEFAULT_LOOP_FRACTION : float = 0.1
     __MIN_MAP_SIZE_X : int = 9
     __MIN_MAP_SIZE_Y : int = 7
+    __OUTPUT_FORMATS : tuple[str, ...] = ("hex", "binary")
+    __COMPRESSIONS : tuple[str, ...] = ("none", "zlib", "lzma")
 
 
     def __init__(self, config_dict: dict[str, str]) -> None:
 
-        allowed_keys : set[str] = {"width", "height", "entry", "exit", "perfect", "output_file", "algorithm"}
+        allowed_keys : set[str] = {"width", "height", "entry", "exit", "perfect", "output_file", "algorithm", "loop_fraction", "seed", "tile_size", "output_format", "compression"}
 
         try:
             for key in config_dict.keys():
@@ -37,6 +45,11 @@ class Maze:
             self.entry = self.__parse_point(config_dict.get("entry", self.__DEFAULT_ENTRY_POS))
             self.exit  = self.__parse_point(config_dict.get("exit", f"{self.width-1},{self.height-1}"))
             self.algorithm = config_dict.get("algorithm", "dfs").lower()
+            self.loop_fraction = float(config_dict.get("loop_fraction", self.__DEFAULT_LOOP_FRACTION))
+            self.seed = int(config_dict["seed"]) if "seed" in config_dict else None
+            self.tile_size = int(config_dict.get("tile_size", 0))
+            self.output_format = config_dict.get("output_format", "hex").lower()
+            self.compression = config_dict.get("compression", "none").lower()
 
             # Check whether the attributes are valid or not
             self.__is_maze_valid()
@@ -53,7 +66,12 @@ class Maze:
             f"exit={self.exit}, "
             f"perfect={self.perfect}, "
             f"output_file='{self.output_file}', "
-            f"algorithm='{self.algorithm}')"
+            f"algorithm='{self.algorithm}', "
+            f"loop_fraction={self.loop_fraction}, "
+            f"seed={self.seed}, "
+            f"tile_size={self.tile_size}, "
+            f"output_format='{self.output_format}', "
+            f"compression='{self.compression}')"
         )
 
 
@@ -91,6 +109,10 @@ class Maze:
         - Maze dimensions satisfy the minimum size requirements.
         - Entry and exit points are within maze bounds.
         - Entry and exit points are not the same.
+        - The loop fraction is between 0 and 1.
+        - The tile size is not negative (0 disables tiled generation).
+        - The output format and compression are supported, and only the
+          binary format is compressed.
 
         :param self: The Maze instance.
         :type self: Maze
@@ -98,7 +120,9 @@ class Maze:
         :rtype: None
         :raises ValueError: If the maze size is smaller than the minimum
             allowed dimensions, if entry or exit points are out of bounds,
-            or if entry and exit points are the same.
+            if entry and exit points are the same, if the loop fraction
+            or the tile size is out of range, or if the output format or
+            compression is not supported.
         """
 
         # Size validation (for 42 pattern)
@@ -120,3 +144,26 @@ class Maze:
         if self.entry == self.exit:
             raise ValueError("Entry and exit points must be different.")
 
+        # Share of closed walls opened in imperfect mazes
+        if not 0.0 <= self.loop_fraction <= 1.0:
+            raise ValueError(
+                f"Loop fraction must be between 0 and 1: {self.loop_fraction}"
+            )
+
+        # Side of the tiles carved in parallel, 0 carves in one piece
+        if self.tile_size < 0:
+            raise ValueError(
+                f"Tile size must not be negative: {self.tile_size}"
+            )
+
+        # Output file layout
+        if self.output_format not in self.__OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output format: {self.output_format}"
+            )
+
+        if self.compression not in self.__COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {self.compression}")
+
+        if self.compression != "none" and self.output_format != "binary":
+            raise ValueError("Compression requires output_format=binary")
@@ -0,0 +1,55 @@
+import random
+
+from srcs.maze_generator.algorithms.common import (
+    link_components, mark_all_visited
+)
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+
+
+def carve_binary_tree(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a perfect maze with the binary tree algorithm.
+
+    Row by row, every cell opens either its north or its east wall at
+    random, which gives the characteristic open north row and east
+    column. A cell whose north and east neighbours are both blocked or
+    off the grid links to nothing; the few pieces this leaves around the
+    42 mask are joined afterwards by link_components().
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Unused, kept for the common carver signature
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells in the maze
+    :rtype: int
+    """
+
+    getrandbits = (rng or random).getrandbits
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_col : int = width - 1
+
+    for idx, code in enumerate(cells):
+        if code & BLOCKED:
+            continue
+
+        north : bool = idx >= width and not cells[idx - width] & BLOCKED
+        east : bool = idx % width < last_col and not cells[idx + 1] & BLOCKED
+
+        if north and (not east or getrandbits(1)):
+            cells[idx] &= ~NORTH
+            cells[idx - width] &= ~SOUTH
+        elif east:
+            cells[idx] &= ~EAST
+            cells[idx + 1] &= ~WEST
+
+    link_components(grid)
+    return (mark_all_visited(grid))
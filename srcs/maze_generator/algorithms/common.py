@@ -0,0 +1,79 @@
+from srcs.maze_generator.algorithms.union_find import UnionFind
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, SOUTH, VISITED, MazeGrid
+)
+
+# bytes.translate() table adding the visited flag to every cell that
+# is not blocked
+MARK_VISITED_TABLE : bytes = bytes(
+    code if code & BLOCKED else code | VISITED for code in range(256)
+)
+
+# bytes.translate() table reducing a cell byte to 1 (blocked) or 0
+BLOCKED_TABLE : bytes = bytes(
+    1 if code & BLOCKED else 0 for code in range(256)
+)
+
+
+def mark_all_visited(grid: MazeGrid) -> int:
+    """
+    Flag every non-blocked cell as visited.
+
+    Used by the carvers that cover the whole grid at once instead of
+    growing a tree from the start cell.
+
+    :param grid: Grid updated in place
+    :type grid: MazeGrid
+    :return: Number of non-blocked cells
+    :rtype: int
+    """
+
+    grid.cells[:] = grid.cells.translate(MARK_VISITED_TABLE)
+    return (len(grid.cells) - grid.cells.translate(BLOCKED_TABLE).count(1))
+
+
+def link_components(grid: MazeGrid) -> int:
+    """
+    Join the disconnected parts of a carved forest into one tree.
+
+    Around the 42 mask, the row-local carvers (binary tree, sidewinder)
+    can leave cells whose only candidate links are blocked, which splits
+    the maze. Every open passage is first merged into a union-find, then
+    the first wall found between two different components is opened,
+    which keeps the maze perfect.
+
+    :param grid: Carved grid updated in place
+    :type grid: MazeGrid
+    :return: Number of walls opened to join components
+    :rtype: int
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_col : int = width - 1
+    last_row : int = len(cells) - width
+    components : UnionFind = UnionFind(len(cells))
+
+    for idx, code in enumerate(cells):
+        if code & BLOCKED:
+            continue
+        if not code & EAST:
+            components.union(idx, idx + 1)
+        if not code & SOUTH:
+            components.union(idx, idx + width)
+
+    opened : int = 0
+
+    for idx, code in enumerate(cells):
+        if code & BLOCKED:
+            continue
+        if (idx % width < last_col and not cells[idx + 1] & BLOCKED
+                and components.union(idx, idx + 1)):
+            grid.remove_wall(idx, EAST)
+            opened += 1
+        if (idx < last_row and not cells[idx + width] & BLOCKED
+                and components.union(idx, idx + width)):
+            grid.remove_wall(idx, SOUTH)
+            opened += 1
+
+    return (opened)
@@ -0,0 +1,164 @@
+import random
+
+from typing import Callable, Iterator
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, VISITED, WEST, MazeGrid
+)
+
+_NO_SET : int = -1
+
+
+def eller_rows(
+    width: int,
+    height: int,
+    row_cells: Callable[[int], bytes | bytearray],
+    rng: random.Random | None = None
+) -> Iterator[bytearray]:
+    """
+    Carve a perfect maze one row at a time with Eller's algorithm.
+
+    Only the current row's set labels, the down links into the next row
+    and one look-ahead row are kept, so memory depends on the width
+    alone. Per row:
+
+    - cells entered from above keep their set, the others get new sets;
+    - neighbouring cells of different sets are randomly joined (all of
+      them on the last row);
+    - a set whose cells all sit above blocked cells would be cut off,
+      so it is joined to a neighbouring set first;
+    - every set opens at least one random link into the next row.
+
+    :param width: Maze width in cells
+    :type width: int
+    :param height: Maze height in cells
+    :type height: int
+    :param row_cells: Returns the initial cell bytes (all walls, plus the
+        blocked flag) of row y; called once per row, in order
+    :type row_cells: Callable[[int], bytes | bytearray]
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Carved cell bytes of each row, top to bottom
+    :rtype: Iterator[bytearray]
+    """
+
+    getrandbits = (rng or random).getrandbits
+    randbelow = (rng or random).randrange
+
+    labels : list[int] = [_NO_SET] * width
+    down : bytearray = bytearray(width)
+    next_label : int = 0
+    next_row : bytearray = bytearray(row_cells(0))
+
+    for y in range(height):
+        row : bytearray = next_row
+        last : bool = y == height - 1
+        next_row = bytearray(row_cells(y + 1)) if not last else bytearray()
+
+        # Set labels: inherited through a down link, otherwise fresh
+        parent : dict[int, int] = {}
+        for x in range(width):
+            if row[x] & BLOCKED:
+                labels[x] = _NO_SET
+                continue
+            if down[x]:
+                row[x] &= ~NORTH
+            else:
+                labels[x] = next_label
+                next_label += 1
+            parent[labels[x]] = labels[x]
+
+        def find(label: int) -> int:
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return (label)
+
+        def join(x: int) -> None:
+            parent[find(labels[x + 1])] = find(labels[x])
+            row[x] &= ~EAST
+            row[x + 1] &= ~WEST
+
+        # Horizontal links
+        for x in range(width - 1):
+            if (row[x] | row[x + 1]) & BLOCKED:
+                continue
+            if find(labels[x]) != find(labels[x + 1]) and (
+                    last or getrandbits(1)):
+                join(x)
+
+        down = bytearray(width)
+
+        if not last:
+            can_descend : set[int] = {
+                find(labels[x]) for x in range(width)
+                if not (row[x] | next_row[x]) & BLOCKED
+            }
+
+            # Rescue sets that have no free cell below them
+            for x in range(width - 1):
+                if (row[x] | row[x + 1]) & BLOCKED:
+                    continue
+                left : int = find(labels[x])
+                right : int = find(labels[x + 1])
+                if left != right and (left not in can_descend
+                                      or right not in can_descend):
+                    descends : bool = (left in can_descend
+                                       or right in can_descend)
+                    join(x)
+                    if descends:
+                        can_descend.add(left)
+
+            # Vertical links, at least one per set
+            members : dict[int, list[int]] = {}
+            for x in range(width):
+                if not (row[x] | next_row[x]) & BLOCKED:
+                    members.setdefault(find(labels[x]), []).append(x)
+
+            for cells in members.values():
+                chosen : list[int] = [x for x in cells if getrandbits(1)]
+                if not chosen:
+                    chosen = [cells[randbelow(len(cells))]]
+                for x in chosen:
+                    down[x] = 1
+                    row[x] &= ~SOUTH
+
+        for x in range(width):
+            if row[x] & BLOCKED:
+                continue
+            row[x] |= VISITED
+            labels[x] = find(labels[x])
+
+        yield (row)
+
+
+def carve_eller(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a perfect maze in place with Eller's algorithm.
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Unused, kept for the common carver signature
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells in the maze
+    :rtype: int
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    carved : int = 0
+
+    def row_cells(y: int) -> bytearray:
+        return (cells[y * width:(y + 1) * width])
+
+    for y, row in enumerate(eller_rows(width, grid.height, row_cells, rng)):
+        cells[y * width:(y + 1) * width] = row
+        carved += width - sum(1 for code in row if code & BLOCKED)
+
+    return (carved)
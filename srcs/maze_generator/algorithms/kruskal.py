@@ -0,0 +1,75 @@
+import random
+
+from array import array
+
+from srcs.maze_generator.algorithms.common import mark_all_visited
+from srcs.maze_generator.algorithms.union_find import UnionFind
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+
+
+def carve_kruskal(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a perfect maze with randomized Kruskal.
+
+    Every wall between two non-blocked cells is an edge, encoded as
+    2 * cell (east wall) or 2 * cell + 1 (south wall) in a flat array.
+    The edges are shuffled and a wall is opened whenever it joins two
+    different sets of the path-compressed union-find. The start cell is
+    not needed: the whole grid is covered at once.
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Unused, kept for the common carver signature
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells in the maze
+    :rtype: int
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_col : int = width - 1
+    last_row : int = len(cells) - width
+
+    edges : array[int] = array("l")
+    for idx, code in enumerate(cells):
+        if code & BLOCKED:
+            continue
+        if idx % width < last_col and not cells[idx + 1] & BLOCKED:
+            edges.append(idx << 1)
+        if idx < last_row and not cells[idx + width] & BLOCKED:
+            edges.append(idx << 1 | 1)
+
+    (rng or random).shuffle(edges)
+
+    node_count : int = mark_all_visited(grid)
+    sets : UnionFind = UnionFind(len(cells))
+    links_left : int = node_count - 1
+
+    for edge in edges:
+        if links_left <= 0:
+            break
+
+        a : int = edge >> 1
+
+        if edge & 1:
+            b : int = a + width
+            if sets.union(a, b):
+                cells[a] &= ~SOUTH
+                cells[b] &= ~NORTH
+                links_left -= 1
+        else:
+            b = a + 1
+            if sets.union(a, b):
+                cells[a] &= ~EAST
+                cells[b] &= ~WEST
+                links_left -= 1
+
+    return (node_count)
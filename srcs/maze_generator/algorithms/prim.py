@@ -0,0 +1,92 @@
+import random
+
+from array import array
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, VISITED, WEST, MazeGrid
+)
+
+# bit 6 of a cell byte, only used while Prim runs
+_IN_FRONTIER : int = 0x40
+
+
+def carve_prim(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a perfect maze with randomized Prim.
+
+    The frontier (cells next to the tree but not in it) is a flat array;
+    a random frontier cell is removed by swapping it with the last one,
+    so every step is O(1). The removed cell is joined to a random tree
+    neighbour and its own free neighbours join the frontier.
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Index of the first tree cell
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells carved, including the start cell
+    :rtype: int
+    """
+
+    source = rng or random
+    randbelow = source.randrange
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_col : int = width - 1
+    last_row : int = len(cells) - width
+    closed : int = VISITED | BLOCKED | _IN_FRONTIER
+
+    frontier : array[int] = array("l")
+
+    def expand(idx: int) -> None:
+        x : int = idx % width
+        if idx >= width and not cells[idx - width] & closed:
+            cells[idx - width] |= _IN_FRONTIER
+            frontier.append(idx - width)
+        if idx < last_row and not cells[idx + width] & closed:
+            cells[idx + width] |= _IN_FRONTIER
+            frontier.append(idx + width)
+        if x < last_col and not cells[idx + 1] & closed:
+            cells[idx + 1] |= _IN_FRONTIER
+            frontier.append(idx + 1)
+        if x > 0 and not cells[idx - 1] & closed:
+            cells[idx - 1] |= _IN_FRONTIER
+            frontier.append(idx - 1)
+
+    cells[start] |= VISITED
+    expand(start)
+    carved : int = 1
+
+    while frontier:
+        pick : int = randbelow(len(frontier))
+        current : int = frontier[pick]
+        frontier[pick] = frontier[-1]
+        frontier.pop()
+
+        # Tree neighbours as (wall of current, neighbour, its wall)
+        x : int = current % width
+        links : list[tuple[int, int, int]] = []
+
+        if current >= width and cells[current - width] & VISITED:
+            links.append((NORTH, current - width, SOUTH))
+        if current < last_row and cells[current + width] & VISITED:
+            links.append((SOUTH, current + width, NORTH))
+        if x < last_col and cells[current + 1] & VISITED:
+            links.append((EAST, current + 1, WEST))
+        if x > 0 and cells[current - 1] & VISITED:
+            links.append((WEST, current - 1, EAST))
+
+        wall, neighbor, neighbor_wall = links[randbelow(len(links))]
+
+        cells[current] = (cells[current] & ~(wall | _IN_FRONTIER)) | VISITED
+        cells[neighbor] &= ~neighbor_wall
+        carved += 1
+
+        expand(current)
+
+    return (carved)
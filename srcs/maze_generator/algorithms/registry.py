@@ -0,0 +1,42 @@
+import random
+
+from typing import Callable, Dict
+
+from srcs.maze_generator.algorithms.binary_tree import carve_binary_tree
+from srcs.maze_generator.algorithms.dfs import carve_dfs
+from srcs.maze_generator.algorithms.eller import carve_eller
+from srcs.maze_generator.algorithms.kruskal import carve_kruskal
+from srcs.maze_generator.algorithms.prim import carve_prim
+from srcs.maze_generator.algorithms.sidewinder import carve_sidewinder
+from srcs.maze_generator.algorithms.wilson import carve_wilson
+from srcs.maze_generator.maze_grid import MazeGrid
+
+# carver(grid, start, rng) -> number of cells in the carved maze
+Carver = Callable[[MazeGrid, int, random.Random | None], int]
+
+ALGORITHMS : Dict[str, Carver] = {
+    "dfs": carve_dfs,
+    "kruskal": carve_kruskal,
+    "prim": carve_prim,
+    "wilson": carve_wilson,
+    "eller": carve_eller,
+    "binary_tree": carve_binary_tree,
+    "sidewinder": carve_sidewinder,
+}
+
+
+def get_algorithm(name: str) -> Carver:
+    """
+    Return the carver registered under the given algorithm name.
+
+    :param name: Value of the 'algorithm' config key
+    :type name: str
+    :return: The carving function
+    :rtype: Carver
+    :raises ValueError: If no carver is registered under that name
+    """
+
+    if name not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {name}")
+
+    return (ALGORITHMS[name])
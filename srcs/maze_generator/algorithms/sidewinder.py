@@ -0,0 +1,69 @@
+import random
+
+from srcs.maze_generator.algorithms.common import (
+    link_components, mark_all_visited
+)
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+
+
+def carve_sidewinder(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a perfect maze with the sidewinder algorithm.
+
+    The first row is one long corridor. On every other row, cells are
+    grouped into runs by randomly opening east walls; when a run closes,
+    one random cell of the run opens its north wall. Runs also close at
+    blocked cells, and a run with no free cell above it is left for
+    link_components() to join to the rest of the maze.
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Unused, kept for the common carver signature
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells in the maze
+    :rtype: int
+    """
+
+    getrandbits = (rng or random).getrandbits
+    randbelow = (rng or random).randrange
+    cells : bytearray = grid.cells
+    width : int = grid.width
+
+    for y in range(grid.height):
+        row_start : int = y * width
+        run : list[int] = []
+
+        for idx in range(row_start, row_start + width):
+            if cells[idx] & BLOCKED:
+                continue
+
+            run.append(idx)
+            at_run_end : bool = (
+                idx == row_start + width - 1 or bool(cells[idx + 1] & BLOCKED)
+            )
+
+            if not at_run_end and (y == 0 or getrandbits(1)):
+                cells[idx] &= ~EAST
+                cells[idx + 1] &= ~WEST
+                continue
+
+            if y > 0:
+                exits : list[int] = [
+                    cell for cell in run if not cells[cell - width] & BLOCKED
+                ]
+                if exits:
+                    cell : int = exits[randbelow(len(exits))]
+                    cells[cell] &= ~NORTH
+                    cells[cell - width] &= ~SOUTH
+            run = []
+
+    link_components(grid)
+    return (mark_all_visited(grid))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from array import array
+
+
+class UnionFind:
+    """
+    Disjoint-set forest over the integers 0..size-1.
+
+    Parents live in one flat array; find() compresses paths by halving
+    and union() links by size, so long carving runs stay near-linear.
+    """
+
+    __slots__ = ("parent", "size")
+
+    parent : array[int]
+    size : array[int]
+
+    def __init__(self, size: int) -> None:
+        self.parent = array("l", range(size))
+        self.size = array("l", [1]) * size
+
+
+    def find(self, item: int) -> int:
+        """
+        Return the representative of the set containing item.
+
+        :param item: Element to look up
+        :type item: int
+        :return: Root of the element's set
+        :rtype: int
+        """
+
+        parent : array[int] = self.parent
+
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+
+        return (item)
+
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets containing a and b.
+
+        :param a: First element
+        :type a: int
+        :param b: Second element
+        :type b: int
+        :return: True if the sets were distinct and have been merged
+        :rtype: bool
+        """
+
+        root_a : int = self.find(a)
+        root_b : int = self.find(b)
+
+        if root_a == root_b:
+            return (False)
+
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return (True)
@@ -0,0 +1,99 @@
+import random
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, VISITED, WEST, MazeGrid
+)
+
+_DIR_BITS : tuple[int, ...] = (NORTH, SOUTH, EAST, WEST)
+_OPPOSITE_BITS : tuple[int, ...] = (SOUTH, NORTH, WEST, EAST)
+
+
+def carve_wilson(
+    grid: MazeGrid,
+    start: int,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Carve a uniform spanning tree with Wilson's algorithm.
+
+    The tree starts as the start cell. Every cell still outside it
+    launches a random walk that stops on the tree; the walk only keeps
+    the last exit direction of each cell it crosses (one byte per
+    cell), which erases its loops for free, and the loop-erased path is
+    then carved into the tree.
+
+    Only cells connected to the start through non-blocked cells are
+    walked from, so enclosed pockets cannot trap a walk.
+
+    :param grid: Grid carved in place
+    :type grid: MazeGrid
+    :param start: Index of the first tree cell
+    :type start: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of cells carved, including the start cell
+    :rtype: int
+    """
+
+    randbelow = (rng or random).randrange
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_col : int = width - 1
+    last_row : int = len(cells) - width
+    offsets : tuple[int, ...] = (-width, width, 1, -1)
+
+    def moves(idx: int) -> list[int]:
+        x : int = idx % width
+        result : list[int] = []
+
+        if idx >= width and not cells[idx - width] & BLOCKED:
+            result.append(0)
+        if idx < last_row and not cells[idx + width] & BLOCKED:
+            result.append(1)
+        if x < last_col and not cells[idx + 1] & BLOCKED:
+            result.append(2)
+        if x > 0 and not cells[idx - 1] & BLOCKED:
+            result.append(3)
+
+        return (result)
+
+    # Cells reachable from the start, in discovery order
+    reachable : bytearray = bytearray(len(cells))
+    reachable[start] = 1
+    targets : list[int] = [start]
+    for current in targets:
+        for direction in moves(current):
+            neighbor : int = current + offsets[direction]
+            if not reachable[neighbor]:
+                reachable[neighbor] = 1
+                targets.append(neighbor)
+
+    exit_dir : bytearray = bytearray(len(cells))
+    cells[start] |= VISITED
+    carved : int = 1
+
+    for origin in targets:
+        if cells[origin] & VISITED:
+            continue
+
+        # Random walk until the tree is hit
+        current = origin
+        while not cells[current] & VISITED:
+            options : list[int] = moves(current)
+            direction = options[randbelow(len(options))]
+            exit_dir[current] = direction
+            current += offsets[direction]
+
+        # Carve the loop-erased path
+        current = origin
+        while not cells[current] & VISITED:
+            direction = exit_dir[current]
+            neighbor = current + offsets[direction]
+            cells[current] = (
+                cells[current] & ~_DIR_BITS[direction] | VISITED
+            )
+            cells[neighbor] &= ~_OPPOSITE_BITS[direction]
+            carved += 1
+            current = neighbor
+
+    return (carved)
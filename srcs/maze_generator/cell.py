@@ -1,37 +1,112 @@
 from __future__ import annotations
 
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, VISITED, WALL_MASK, WEST, MazeGrid
+)
+
+
 class Cell:
-    x : int
-    y : int
+    """
+    Cell-style view over one byte of a MazeGrid.
 
-    visited : bool
-    blocked : bool
+    Kept for code written against the old per-cell objects: attribute
+    reads and writes go straight to the grid's bytearray, so a view
+    costs nothing until it is created and never goes stale. Built the
+    old way, Cell(x, y), the cell owns a one-cell grid of its own with
+    every wall closed, and the A* fields and ordering are unchanged.
+    """
 
-    west : bool
-    east : bool
-    north : bool
-    south : bool
+    __slots__ = ("grid", "x", "y", "_idx", "g", "h", "f", "parent")
+
+    grid : MazeGrid
+    x : int
+    y : int
+    _idx : int
 
     # ==== solve state (A*) ====
 
-    g = float("inf")
-    h = 0
-    f = float("inf")
-    parent : Cell | None = None
+    g : float
+    h : float
+    f : float
+    parent : Cell | None
 
-    def __init__(self, x: int, y: int) -> None:
+    def __init__(self, x: int, y: int, grid: MazeGrid | None = None) -> None:
         self.x = x
         self.y = y
 
-        self.visited = False
-        self.blocked = False
+        if grid is None:
+            self.grid = MazeGrid(1, 1)
+            self._idx = 0
+        else:
+            self.grid = grid
+            self._idx = grid.index(x, y)
+
+        self.g = float("inf")
+        self.h = 0
+        self.f = float("inf")
+        self.parent = None
+
+
+    def __get_flag(self, flag: int) -> bool:
+        return (bool(self.grid.cells[self._idx] & flag))
+
+
+    def __set_flag(self, flag: int, value: bool) -> None:
+        if value:
+            self.grid.cells[self._idx] |= flag
+        else:
+            self.grid.cells[self._idx] &= ~flag
+
+
+    @property
+    def north(self) -> bool:
+        return (self.__get_flag(NORTH))
+
+    @north.setter
+    def north(self, value: bool) -> None:
+        self.__set_flag(NORTH, value)
+
+    @property
+    def east(self) -> bool:
+        return (self.__get_flag(EAST))
+
+    @east.setter
+    def east(self, value: bool) -> None:
+        self.__set_flag(EAST, value)
+
+    @property
+    def south(self) -> bool:
+        return (self.__get_flag(SOUTH))
+
+    @south.setter
+    def south(self, value: bool) -> None:
+        self.__set_flag(SOUTH, value)
+
+    @property
+    def west(self) -> bool:
+        return (self.__get_flag(WEST))
+
+    @west.setter
+    def west(self, value: bool) -> None:
+        self.__set_flag(WEST, value)
+
+    @property
+    def visited(self) -> bool:
+        return (self.__get_flag(VISITED))
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self.__set_flag(VISITED, value)
+
+    @property
+    def blocked(self) -> bool:
+        return (self.__get_flag(BLOCKED))
+
+    @blocked.setter
+    def blocked(self, value: bool) -> None:
+        self.__set_flag(BLOCKED, value)
 
-        self.north = True
-        self.south = True
-        self.east  = True
-        self.west  = True
 
-    
     def __eq__(self, other: object) -> bool:
         """
         Check equality with another Cell.
@@ -43,7 +118,7 @@ class Cell:
         """
         if not isinstance(other, Cell):
             return (False)
-    
+
         return (self.x == other.x and self.y == other.y)
 
 
@@ -68,11 +143,11 @@ class Cell:
         """
 
         if self.f != other.f:
-            return self.f < other.f
-        
-        return (self.y, self.x) < (other.y, other.x)
+            return (self.f < other.f)
+
+        return ((self.y, self.x) < (other.y, other.x))
+
 
-    
     def encode_walls(self) -> str:
         """
         Encode the walls of the cell into a 4-bit integer.
@@ -86,16 +161,4 @@ class Cell:
             str: Hexadecimal representation of the wall configuration.
         """
 
-        code : int = 0
-        hex_digits : str = "0123456789ABCDEF"
-
-        if self.north:
-            code |= 1
-        if self.east:
-            code |= 2
-        if self.south:
-            code |= 4
-        if self.west:
-            code |= 8
-
-        return (hex_digits[code])
+        return ("0123456789ABCDEF"[self.grid.cells[self._idx] & WALL_MASK])
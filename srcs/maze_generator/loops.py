@@ -0,0 +1,138 @@
+import random
+import re
+
+from srcs.maze_generator.maze_grid import BLOCKED, EAST, SOUTH, MazeGrid
+
+# bytes.translate() tables reducing a cell byte to a 0/1 lane
+_EAST_CLOSED_TABLE : bytes = bytes(
+    1 if code & EAST and not code & BLOCKED else 0 for code in range(256)
+)
+_SOUTH_CLOSED_TABLE : bytes = bytes(
+    1 if code & SOUTH and not code & BLOCKED else 0 for code in range(256)
+)
+_FREE_TABLE : bytes = bytes(
+    0 if code & BLOCKED else 1 for code in range(256)
+)
+
+_LANE : re.Pattern[bytes] = re.compile(b"\x01")
+
+# Side of the smallest open area that is not allowed
+_OPEN_AREA : int = 3
+
+
+def closed_inner_walls(grid: MazeGrid) -> list[int]:
+    """
+    List every closed wall between two non-blocked cells.
+
+    The grid is turned into 0/1 byte lanes with bytes.translate() and
+    the lanes are combined as big integers (one byte per cell), so the
+    whole scan runs in C. Walls are encoded as 2 * cell for the east
+    wall and 2 * cell + 1 for the south wall of a cell.
+
+    :param grid: Carved grid
+    :type grid: MazeGrid
+    :return: Encoded walls in cell order
+    :rtype: list[int]
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    size : int = len(cells)
+
+    free : int = int.from_bytes(cells.translate(_FREE_TABLE), "little")
+    not_last_col : int = int.from_bytes(
+        (b"\x01" * (width - 1) + b"\x00") * grid.height, "little"
+    )
+
+    east : int = (
+        int.from_bytes(cells.translate(_EAST_CLOSED_TABLE), "little")
+        & (free >> 8) & not_last_col
+    )
+    south : int = (
+        int.from_bytes(cells.translate(_SOUTH_CLOSED_TABLE), "little")
+        & (free >> (8 * width))
+    )
+
+    walls : list[int] = [
+        match.start() << 1
+        for match in _LANE.finditer(east.to_bytes(size, "little"))
+    ]
+    walls.extend(
+        match.start() << 1 | 1
+        for match in _LANE.finditer(south.to_bytes(size, "little"))
+    )
+    walls.sort()
+    return (walls)
+
+
+def add_loops(
+    grid: MazeGrid,
+    fraction: float,
+    rng: random.Random | None = None
+) -> int:
+    """
+    Turn a perfect maze into an imperfect one by opening extra walls.
+
+    A random `fraction` of the closed walls between non-blocked cells
+    is opened. A wall is closed again if opening it would create a
+    fully open 3x3 area, so corridors never get wider than two cells.
+
+    :param grid: Carved grid updated in place
+    :type grid: MazeGrid
+    :param fraction: Share of closed inner walls to open, 0 to 1
+    :type fraction: float
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of walls actually opened
+    :rtype: int
+    """
+
+    candidates : list[int] = closed_inner_walls(grid)
+    count : int = round(len(candidates) * fraction)
+    opened : int = 0
+
+    for wall in (rng or random).sample(candidates, count):
+        idx : int = wall >> 1
+        direction : int = SOUTH if wall & 1 else EAST
+
+        grid.remove_wall(idx, direction)
+
+        if has_open_area(grid, idx):
+            grid.add_wall(idx, direction)
+            continue
+
+        opened += 1
+
+    return (opened)
+
+
+def has_open_area(grid: MazeGrid, idx: int) -> bool:
+    """
+    Check whether a cell belongs to a fully open 3x3 area.
+
+    :param grid: Carved grid
+    :type grid: MazeGrid
+    :param idx: Flat cell index
+    :type idx: int
+    :return: True if some 3x3 block containing the cell has no inner
+        wall
+    :rtype: bool
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    x, y = grid.coords(idx)
+    span : int = _OPEN_AREA - 1
+
+    for top in range(max(0, y - span), min(y, grid.height - _OPEN_AREA) + 1):
+        for left in range(max(0, x - span), min(x, width - _OPEN_AREA) + 1):
+            corner : int = top * width + left
+            if all(
+                not cells[corner + row * width + col] & EAST
+                and not cells[corner + col * width + row] & SOUTH
+                for row in range(_OPEN_AREA)
+                for col in range(span)
+            ):
+                return (True)
+
+    return (False)
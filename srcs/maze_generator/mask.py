@@ -0,0 +1,42 @@
+from typing import List
+
+# 42 pattern, "1" marks a blocked cell
+PATTERN_42 : List[str] = [
+    "1000111",
+    "1000001",
+    "1110111",
+    "0010100",
+    "0010111",
+]
+
+PATTERN_HEIGHT : int = len(PATTERN_42)        # 5
+PATTERN_WIDTH : int = len(PATTERN_42[0])      # 7
+
+
+def mask_42_cells(width: int, height: int) -> list[tuple[int, int]]:
+    """
+    Return the (x, y) cells covered by the '42' pattern.
+
+    The pattern is centered within a width x height maze.
+
+    :param width: Maze width in cells
+    :type width: int
+    :param height: Maze height in cells
+    :type height: int
+    :return: Coordinates of the blocked cells, row by row
+    :rtype: list[tuple[int, int]]
+    :raises ValueError: If the maze is too small to hold the pattern
+    """
+
+    if width < PATTERN_WIDTH or height < PATTERN_HEIGHT:
+        raise ValueError("Maze is too small to place the 42 pattern.")
+
+    offset_x : int = (width - PATTERN_WIDTH) // 2
+    offset_y : int = (height - PATTERN_HEIGHT) // 2
+
+    return ([
+        (offset_x + x, offset_y + y)
+        for y, row in enumerate(PATTERN_42)
+        for x, ch in enumerate(row)
+        if ch == "1"
+    ])
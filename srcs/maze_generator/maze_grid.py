@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+# ==== cell byte layout ====
+# Bits 0-3 hold the walls (same layout as the hex output format),
+# bit 4 marks a visited cell and bit 5 a blocked (42 mask) cell.
+
+NORTH : int = 0x01
+EAST : int = 0x02
+SOUTH : int = 0x04
+WEST : int = 0x08
+
+ALL_WALLS : int = NORTH | EAST | SOUTH | WEST
+WALL_MASK : int = 0x0F
+
+VISITED : int = 0x10
+BLOCKED : int = 0x20
+
+OPPOSITE : dict[int, int] = {
+    NORTH: SOUTH,
+    SOUTH: NORTH,
+    EAST: WEST,
+    WEST: EAST,
+}
+
+# bytes.translate() table stripping the flag bits from a cell byte
+WALLS_TABLE : bytes = bytes(code & WALL_MASK for code in range(256))
+
+
+class MazeGrid:
+    """
+    Compact maze grid stored as one byte per cell.
+
+    Cells live in a single contiguous bytearray indexed by
+    y * width + x; every byte holds the four wall bits plus the visited
+    and blocked flags. Wall updates always keep both sides of a shared
+    wall consistent.
+    """
+
+    __slots__ = ("width", "height", "cells")
+
+    width : int
+    height : int
+    cells : bytearray
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.cells = bytearray([ALL_WALLS]) * (width * height)
+
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, cells: bytearray) -> MazeGrid:
+        """
+        Wrap an existing cell buffer without copying it.
+
+        :param width: Maze width in cells
+        :type width: int
+        :param height: Maze height in cells
+        :type height: int
+        :param cells: One byte per cell, indexed by y * width + x
+        :type cells: bytearray
+        :return: Grid backed by the given buffer
+        :rtype: MazeGrid
+        :raises ValueError: If the buffer size does not match
+        """
+
+        if len(cells) != width * height:
+            raise ValueError(
+                f"Expected {width * height} cells, got {len(cells)}"
+            )
+
+        grid : MazeGrid = cls.__new__(cls)
+        grid.width = width
+        grid.height = height
+        grid.cells = cells
+        return (grid)
+
+
+    def __len__(self) -> int:
+        return (len(self.cells))
+
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Return the flat index of the cell at (x, y).
+
+        :param x: Column of the cell
+        :type x: int
+        :param y: Row of the cell
+        :type y: int
+        :return: Flat cell index
+        :rtype: int
+        """
+
+        return (y * self.width + x)
+
+
+    def coords(self, idx: int) -> tuple[int, int]:
+        """
+        Return the (x, y) coordinates of a flat cell index.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Column and row of the cell
+        :rtype: tuple[int, int]
+        """
+
+        y, x = divmod(idx, self.width)
+        return (x, y)
+
+
+    def walls(self, idx: int) -> int:
+        """
+        Return the 4-bit wall code of a cell.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Wall code (north=1, east=2, south=4, west=8)
+        :rtype: int
+        """
+
+        return (self.cells[idx] & WALL_MASK)
+
+
+    def is_blocked(self, idx: int) -> bool:
+        return (bool(self.cells[idx] & BLOCKED))
+
+
+    def is_visited(self, idx: int) -> bool:
+        return (bool(self.cells[idx] & VISITED))
+
+
+    def block(self, idx: int) -> None:
+        """
+        Mark a cell as blocked so it is never carved.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return:
+        :rtype: None
+        """
+
+        self.cells[idx] |= BLOCKED
+
+
+    def remove_wall(self, idx: int, direction: int) -> int:
+        """
+        Open the wall between a cell and its neighbour.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :param direction: Wall bit to open (NORTH, EAST, SOUTH or WEST)
+        :type direction: int
+        :return: Index of the neighbour on the other side of the wall
+        :rtype: int
+        :raises ValueError: If the wall is on the maze border
+        """
+
+        neighbor : int = self.neighbor(idx, direction)
+
+        self.cells[idx] &= ~direction
+        self.cells[neighbor] &= ~OPPOSITE[direction]
+
+        return (neighbor)
+
+
+    def add_wall(self, idx: int, direction: int) -> int:
+        """
+        Close the wall between a cell and its neighbour.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :param direction: Wall bit to close (NORTH, EAST, SOUTH or WEST)
+        :type direction: int
+        :return: Index of the neighbour on the other side of the wall
+        :rtype: int
+        :raises ValueError: If the wall is on the maze border
+        """
+
+        neighbor : int = self.neighbor(idx, direction)
+
+        self.cells[idx] |= direction
+        self.cells[neighbor] |= OPPOSITE[direction]
+
+        return (neighbor)
+
+
+    def neighbor(self, idx: int, direction: int) -> int:
+        """
+        Return the index of the adjacent cell in the given direction.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :param direction: Direction bit (NORTH, EAST, SOUTH or WEST)
+        :type direction: int
+        :return: Index of the adjacent cell
+        :rtype: int
+        :raises ValueError: If the neighbour would be outside the maze
+        """
+
+        x, y = self.coords(idx)
+
+        if direction == NORTH and y > 0:
+            return (idx - self.width)
+        if direction == SOUTH and y < self.height - 1:
+            return (idx + self.width)
+        if direction == EAST and x < self.width - 1:
+            return (idx + 1)
+        if direction == WEST and x > 0:
+            return (idx - 1)
+
+        raise ValueError(f"No neighbour {direction} of cell ({x}, {y})")
+
+
+    def open_neighbors(self, idx: int) -> list[int]:
+        """
+        Return the indices of all cells reachable through an open wall.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Neighbour indices in north, south, west, east order
+        :rtype: list[int]
+        """
+
+        code : int = self.cells[idx]
+        result : list[int] = []
+
+        if not code & NORTH:
+            result.append(idx - self.width)
+        if not code & SOUTH:
+            result.append(idx + self.width)
+        if not code & WEST:
+            result.append(idx - 1)
+        if not code & EAST:
+            result.append(idx + 1)
+
+        return (result)
+
+
+    def wall_codes(self) -> bytearray:
+        """
+        Return the wall codes of every cell with the flag bits removed.
+
+        :return: A new buffer (editing it leaves the grid untouched) of
+            one byte per cell, values 0-15
+        :rtype: bytearray
+        """
+
+        return (self.cells.translate(WALLS_TABLE))
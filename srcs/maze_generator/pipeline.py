@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import random
+
+from array import array
+from typing import TYPE_CHECKING
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.algorithms.registry import Carver, get_algorithm
+from srcs.maze_generator.mask import mask_42_cells
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_profile.instrument import DISABLED, Instrumentation
+from srcs.maze_solver import astar
+
+if TYPE_CHECKING:
+    # Annotations only: each step imports what it runs when it runs, so
+    # a plain generate -> write never loads the editor, the distance
+    # field or the renderer
+    from srcs.maze_solver.distance import MazeMetrics
+    from srcs.maze_solver.incremental import MazeEditor
+    from srcs.maze_solver.tree_index import TreeIndex
+
+
+class MazePipeline:
+    """
+    Lazy generate -> solve -> write / render pipeline for one maze.
+
+    Nothing runs when the pipeline is created. Each step runs the steps
+    it depends on, and its result is memoized, so asking for it again
+    is free: generate() only carves, solve() generates then solves, and
+    write() and render() also solve, since both can show the path. A
+    service can keep a pipeline in memory and serve grids, paths and
+    renders from RAM without ever touching the disk.
+
+    edit() hands out a MazeEditor on the generated grid; every edit
+    drops the memoized results, and the path is then taken from the
+    editor, which repairs it incrementally.
+    """
+
+    maze : Maze
+    seed : int | None
+    rng : random.Random | None
+    instrumentation : Instrumentation
+    tree_index : TreeIndex | None
+
+
+    def __init__(
+        self,
+        maze: Maze,
+        seed: int | None = None,
+        instrumentation: Instrumentation | None = None
+    ) -> None:
+        """
+        Prepare the pipeline of the maze described by the config.
+
+        :param maze: Validated maze configuration
+        :type maze: Maze
+        :param seed: Seed of this pipeline's random source, overrides
+            maze.seed; without any seed the global random module is used
+        :type seed: int | None
+        :param instrumentation: Optional sink for per-stage timings and
+            counters, measurement is off without it
+        :type instrumentation: Instrumentation | None
+        """
+
+        self.maze = maze
+        self.instrumentation = instrumentation or DISABLED
+        self.seed = seed if seed is not None else maze.seed
+        self.rng = self.__make_rng(self.seed)
+        self.tree_index = None
+
+        self.__grid : MazeGrid | None = None
+        self.__path : list[int] | None = None
+        self.__directions : str | None = None
+        self.__written : dict[str, int] = {}
+        self.__renders : dict[tuple[str, bool, bool], bytes] = {}
+        self.__metrics : MazeMetrics | None = None
+        self.__editor : MazeEditor | None = None
+
+    @staticmethod
+    def restore(
+        maze: Maze,
+        grid: MazeGrid,
+        directions: str
+    ) -> MazePipeline:
+        """
+        Pipeline of a maze generated and solved earlier, e.g. read back
+        from a cache: write() and render() run without carving again.
+
+        :param maze: Validated maze configuration
+        :type maze: Maze
+        :param grid: The carved grid
+        :type grid: MazeGrid
+        :param directions: Entry -> exit path as N/E/S/W letters
+        :type directions: str
+        :return: Pipeline with the generate step already done
+        :rtype: MazePipeline
+        """
+
+        pipeline : MazePipeline = MazePipeline(maze)
+        pipeline.__grid = grid
+        pipeline.__directions = directions
+        return (pipeline)
+
+    @staticmethod
+    def __make_rng(seed: int | None) -> random.Random | None:
+        """
+        Create the random source generation runs on.
+
+        With a seed, generation is a pure function of (config, seed):
+        the same seed always writes a byte-identical output file.
+
+        :param seed: Seed, or None to use the global random module
+        :type seed: int | None
+        :return: A dedicated random source, or None for the global one
+        :rtype: random.Random | None
+        """
+
+        return (random.Random(seed) if seed is not None else None)
+
+    @property
+    def grid(self) -> MazeGrid:
+        return (self.generate())
+
+    @property
+    def path(self) -> list[int]:
+        return (self.solve())
+
+    def generate(self) -> MazeGrid:
+        """
+        Build the grid, apply the 42 mask and carve the maze.
+
+        :return: The carved grid
+        :rtype: MazeGrid
+        :raises ValueError: If the algorithm is not supported
+        """
+
+        if self.__grid is not None:
+            return (self.__grid)
+
+        probe : Instrumentation = self.instrumentation
+
+        with probe.stage("init_grid"):
+            grid : MazeGrid = self.__init_grid()
+
+        with probe.stage("apply_42_mask"):
+            self.__apply_42_mask(grid)
+
+        self.__carve(grid)
+        self.__grid = grid
+        return (grid)
+
+    def solve(self) -> list[int]:
+        """
+        Find the entry -> exit path, generating the maze if needed.
+
+        :return: The path from entry to exit as a list of cell indices
+        :rtype: list[int]
+        """
+
+        if self.__path is None:
+            grid : MazeGrid = self.generate()
+            with self.instrumentation.stage("solve"):
+                self.__path = (
+                    self.__editor.path()
+                    if self.__editor is not None and self.__editor.edits
+                    else self.__solve(grid)
+                )
+            self.instrumentation.count("path_length", len(self.__path))
+
+        return (self.__path)
+
+    def directions(self) -> str:
+        """
+        Return the entry -> exit path as N/E/S/W letters.
+
+        :return: One letter per step of the path
+        :rtype: str
+        """
+
+        if self.__directions is None:
+            path : list[int] = self.solve()
+            with self.instrumentation.stage("path_to_dir"):
+                self.__directions = "".join(
+                    astar.path_to_dir(path, self.maze.width)
+                )
+
+        return (self.__directions)
+
+    def write(self, output_file: str | None = None) -> int:
+        """
+        Write the maze in the configured output format (hexadecimal
+        text, or the compact binary format).
+
+        Each destination is written at most once.
+
+        :param output_file: Destination, defaults to maze.output_file
+        :type output_file: str | None
+        :return: Number of bytes written
+        :rtype: int
+        """
+
+        destination : str = output_file or self.maze.output_file
+
+        if destination not in self.__written:
+            from srcs.maze_io.hex_format import write_hex_maze
+
+            directions : str = self.directions()
+            with self.instrumentation.stage("write_output"):
+                written : int = (
+                    self.__write_binary(destination, directions)
+                    if self.maze.output_format == "binary"
+                    else write_hex_maze(
+                        destination,
+                        self.generate(),
+                        self.maze.entry,
+                        self.maze.exit,
+                        directions
+                    )
+                )
+            self.instrumentation.count("bytes_written", written)
+            self.__written[destination] = written
+
+        return (self.__written[destination])
+
+    def __write_binary(self, destination: str, directions: str) -> int:
+        """
+        Write the maze in the compact binary format.
+
+        :param destination: Destination file path
+        :type destination: str
+        :param directions: Entry -> exit path as N/E/S/W letters
+        :type directions: str
+        :return: Number of bytes written
+        :rtype: int
+        """
+
+        # Loaded on demand: hex runs never need the compressors
+        from srcs.maze_io.binary_format import MazeInfo, write_binary_maze
+
+        return (write_binary_maze(
+            destination,
+            self.generate(),
+            self.maze.entry,
+            self.maze.exit,
+            directions,
+            MazeInfo(self.maze.perfect, self.maze.algorithm, self.seed),
+            self.maze.compression
+        ))
+
+    def render(
+        self,
+        mode: str = "ascii",
+        show_path: bool = False,
+        show_mask: bool = False
+    ) -> bytes:
+        """
+        Render the maze as text, see render_maze().
+
+        :param mode: One of "ascii", "unicode" or "halfblock"
+        :type mode: str
+        :param show_path: Whether to overlay the entry -> exit path
+        :type show_path: bool
+        :param show_mask: Whether to draw the 42 mask apart from walls
+        :type show_mask: bool
+        :return: The rendered maze
+        :rtype: bytes
+        :raises ValueError: If the mode is not supported
+        """
+
+        key : tuple[str, bool, bool] = (mode, show_path, show_mask)
+
+        if key not in self.__renders:
+            from srcs.maze_io.render import render_maze
+
+            grid : MazeGrid = self.generate()
+            path : list[int] | None = self.solve() if show_path else None
+            with self.instrumentation.stage("render"):
+                self.__renders[key] = render_maze(grid, path, mode, show_mask)
+
+        return (self.__renders[key])
+
+    def edit(self) -> MazeEditor:
+        """
+        Return the editor of the generated maze, see MazeEditor.
+
+        Edits change the grid in place and drop everything derived from
+        it (path, directions, renders, metrics, tree index and the
+        record of written files), so the next request recomputes it
+        from the edited maze.
+
+        :return: The editor, created on first call
+        :rtype: MazeEditor
+        """
+
+        if self.__editor is None:
+            from srcs.maze_solver.incremental import MazeEditor
+
+            grid : MazeGrid = self.generate()
+            with self.instrumentation.stage("init_editor"):
+                self.__editor = MazeEditor(
+                    grid,
+                    grid.index(self.maze.entry.x, self.maze.entry.y),
+                    grid.index(self.maze.exit.x, self.maze.exit.y),
+                    self.__edited
+                )
+
+        return (self.__editor)
+
+    def __edited(self) -> None:
+        self.tree_index = None
+        self.__path = None
+        self.__directions = None
+        self.__written.clear()
+        self.__renders.clear()
+        self.__metrics = None
+
+    def distance_field(self, source: int | None = None) -> array[int]:
+        """
+        Distance of every cell from a source cell, see distance_field().
+
+        Not memoized: each call is one BFS pass.
+
+        :param source: Index of the source cell, defaults to the entry
+        :type source: int | None
+        :return: int32 distance per cell, UNREACHED when unreachable
+        :rtype: array[int]
+        """
+
+        from srcs.maze_solver.distance import distance_field
+
+        grid : MazeGrid = self.generate()
+
+        if source is None:
+            source = grid.index(self.maze.entry.x, self.maze.entry.y)
+
+        with self.instrumentation.stage("distance_field"):
+            return (distance_field(grid, source))
+
+    def metrics(self) -> MazeMetrics:
+        """
+        Structure and difficulty metrics measured from the entry.
+
+        :return: Diameter, dead ends, branching factor, ...
+        :rtype: MazeMetrics
+        """
+
+        if self.__metrics is None:
+            from srcs.maze_solver.distance import maze_metrics
+
+            grid : MazeGrid = self.generate()
+            entry : int = grid.index(self.maze.entry.x, self.maze.entry.y)
+            with self.instrumentation.stage("metrics"):
+                self.__metrics = maze_metrics(grid, entry)
+
+        return (self.__metrics)
+
+    def __init_grid(self) -> MazeGrid:
+        """
+        Initialize the logical maze grid.
+
+        This method creates a compact grid (one byte per cell, every wall
+        closed) based on the maze width and height.
+
+        :return: The logical maze grid.
+        :rtype: MazeGrid
+        """
+
+        return (MazeGrid(self.maze.width, self.maze.height))
+
+    def __apply_42_mask(self, grid: MazeGrid) -> None:
+        """
+        Apply the '42' reserved area mask to the maze grid.
+
+        This method marks a predefined pattern of cells in the center
+        of the maze as blocked. Blocked cells are excluded from the
+        maze generation algorithm and cannot be visited or connected
+        by corridors.
+
+        The pattern is centered within the maze grid and applied
+        before running the maze generation algorithm.
+
+        :param grid: The grid to mask
+        :type grid: MazeGrid
+        :return: None
+        :rtype: None
+        """
+
+        for x, y in mask_42_cells(self.maze.width, self.maze.height):
+            grid.block(grid.index(x, y))
+
+    def __carve(self, grid: MazeGrid) -> None:
+        """
+        Carve the maze with the carver registered for the configured
+        algorithm, starting from the entry cell, or tile by tile across
+        worker processes when a tile size is configured. Imperfect mazes
+        then get extra openings (loops).
+
+        :param grid: The masked grid to carve
+        :type grid: MazeGrid
+        :return:
+        :rtype: None
+        :raises ValueError: If the algorithm is not supported
+        """
+
+        probe : Instrumentation = self.instrumentation
+        carve : Carver = get_algorithm(self.maze.algorithm)
+        start : int = grid.index(self.maze.entry.x, self.maze.entry.y)
+
+        with probe.stage("carve"):
+            if self.maze.tile_size:
+                # Loaded on demand: process pools and shared memory are
+                # only needed for tiled mazes
+                from srcs.maze_generator.tiled import carve_tiled
+
+                carved : int = carve_tiled(
+                    grid, self.maze.algorithm, self.maze.tile_size, self.rng
+                )
+            else:
+                carved = carve(grid, start, self.rng)
+        probe.count("cells_carved", carved)
+
+        if not self.maze.perfect:
+            from srcs.maze_generator.loops import add_loops
+
+            with probe.stage("add_loops"):
+                opened : int = add_loops(
+                    grid, self.maze.loop_fraction, self.rng
+                )
+            probe.count("loops_opened", opened)
+
+    def __solve(self, grid: MazeGrid) -> list[int]:
+        """
+        Find the entry -> exit path.
+
+        Perfect mazes are trees, so they get a TreeIndex (kept on
+        self.tree_index for further path queries) and the unique path is
+        read from it. Other mazes are solved with A*, whose expansions
+        and heap traffic are counted.
+
+        :param grid: The carved grid
+        :type grid: MazeGrid
+        :return: The path from entry to exit as a list of cell indices
+        :rtype: list[int]
+        """
+
+        entry : int = grid.index(self.maze.entry.x, self.maze.entry.y)
+        exit : int = grid.index(self.maze.exit.x, self.maze.exit.y)
+
+        if self.maze.perfect:
+            from srcs.maze_solver.tree_index import TreeIndex
+
+            self.tree_index = TreeIndex(grid, entry)
+            return (self.tree_index.path(entry, exit))
+
+        result : astar.SearchResult = astar.search_astar(grid, entry, exit)
+        self.instrumentation.count("nodes_expanded", result.expanded)
+        self.instrumentation.count("heap_pushes", result.pushes)
+        self.instrumentation.count("heap_pops", result.pops)
+        return (result.path)
@@ -0,0 +1,91 @@
+import random
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.algorithms.eller import eller_rows
+from srcs.maze_generator.mask import mask_42_cells
+from srcs.maze_generator.maze_grid import ALL_WALLS, BLOCKED, MazeGrid
+from srcs.maze_io.hex_format import (
+    append_directions, load_maze, write_hex_rows
+)
+from srcs.maze_solver import astar
+from srcs.maze_solver.tree_index import TreeIndex
+
+
+def generate_streaming(
+    maze: Maze,
+    rng: random.Random | None = None,
+    solve: bool = False
+) -> int:
+    """
+    Generate a maze with Eller's algorithm and write it row by row.
+
+    Each row is carved, encoded and written before the next one is
+    started; the 42 mask cells are blocked as their rows come up. Peak
+    memory depends only on the maze width, so arbitrarily tall mazes
+    can be produced. The configured algorithm is ignored: Eller's is
+    the only carver that works one row at a time. Rows leave as soon as
+    they are carved, so loops cannot be added afterwards and the rows
+    cannot be packed into the binary format, whose header comes first:
+    imperfect and binary configs are rejected.
+
+    The path line is left empty unless solve is set, in which case the
+    written file is loaded back and solved in a second pass (that pass
+    needs the whole grid in memory, one byte per cell).
+
+    :param maze: Validated maze configuration
+    :type maze: Maze
+    :param rng: Random source, defaults to one seeded with maze.seed, or
+        to the global random module if the config has no seed
+    :type rng: random.Random | None
+    :param solve: Whether to fill in the entry -> exit path
+    :type solve: bool
+    :return: Number of bytes written
+    :rtype: int
+    :raises ValueError: If the config asks for an imperfect maze or the
+        binary output format
+    """
+
+    if not maze.perfect:
+        raise ValueError("Streaming only generates perfect mazes")
+
+    if maze.output_format != "hex":
+        raise ValueError("Streaming only writes the hex output format")
+
+    if rng is None and maze.seed is not None:
+        rng = random.Random(maze.seed)
+
+    width : int = maze.width
+    blank_row : bytes = bytes([ALL_WALLS]) * width
+
+    masked_rows : dict[int, list[int]] = {}
+    for x, y in mask_42_cells(width, maze.height):
+        masked_rows.setdefault(y, []).append(x)
+
+    def row_cells(y: int) -> bytes | bytearray:
+        if y not in masked_rows:
+            return (blank_row)
+
+        row : bytearray = bytearray(blank_row)
+        for x in masked_rows[y]:
+            row[x] |= BLOCKED
+        return (row)
+
+    written : int = write_hex_rows(
+        maze.output_file,
+        eller_rows(width, maze.height, row_cells, rng),
+        maze.entry,
+        maze.exit
+    )
+
+    if solve:
+        with load_maze(maze.output_file) as loaded:
+            grid : MazeGrid = loaded.grid
+            entry : int = grid.index(maze.entry.x, maze.entry.y)
+            exit : int = grid.index(maze.exit.x, maze.exit.y)
+            path : list[int] = TreeIndex(grid, entry).path(entry, exit)
+
+        written += append_directions(
+            maze.output_file, "".join(astar.path_to_dir(path, width))
+        ) - 1
+
+    return (written)
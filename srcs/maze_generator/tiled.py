@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import os
+import random
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator
+
+from srcs.maze_generator.algorithms.common import BLOCKED_TABLE
+from srcs.maze_generator.algorithms.dfs import carve_dfs
+from srcs.maze_generator.algorithms.registry import Carver, get_algorithm
+from srcs.maze_generator.algorithms.union_find import UnionFind
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, SOUTH, VISITED, MazeGrid
+)
+
+# (shared memory name, grid width, x0, y0, tile width, tile height,
+# algorithm, tile seed)
+TileTask = tuple[str, int, int, int, int, int, str, int]
+
+# Number of components of a carved tile and, when there is more than
+# one, the component of each of its cells (-1 for blocked cells)
+TileResult = tuple[int, "array[int] | None"]
+
+# (x0, y0, tile width, tile height)
+Tile = tuple[int, int, int, int]
+
+# bytes.translate() table: 1 for a cell no carver has reached yet
+_UNCARVED_TABLE : bytes = bytes(
+    0 if code & (VISITED | BLOCKED) else 1 for code in range(256)
+)
+
+# bytes.translate() table: open east and south walls of a cell, so
+# every open passage is counted exactly once
+_PASSAGES_TABLE : bytes = bytes(
+    0 if code & BLOCKED
+    else (0 if code & EAST else 1) + (0 if code & SOUTH else 1)
+    for code in range(256)
+)
+
+_SEED_BITS : int = 64
+
+
+def tile_layout(width: int, height: int, tile_size: int) -> list[Tile]:
+    """
+    Split a grid into square tiles, row by row.
+
+    :param width: Maze width in cells
+    :type width: int
+    :param height: Maze height in cells
+    :type height: int
+    :param tile_size: Side of a tile; the last column and row of tiles
+        are cut to the grid
+    :type tile_size: int
+    :return: (x0, y0, tile width, tile height) of every tile
+    :rtype: list[Tile]
+    """
+
+    return ([
+        (x0, y0, min(tile_size, width - x0), min(tile_size, height - y0))
+        for y0 in range(0, height, tile_size)
+        for x0 in range(0, width, tile_size)
+    ])
+
+
+def _shared_buffer(shared: shared_memory.SharedMemory) -> memoryview:
+    """
+    Return the mapped buffer of a shared memory block.
+
+    SharedMemory.buf is typed as optional since it is dropped by
+    close(); the block is never closed while it is in use.
+
+    :param shared: An open shared memory block
+    :type shared: shared_memory.SharedMemory
+    :return: The block's buffer
+    :rtype: memoryview
+    :raises ValueError: If the block is already closed
+    """
+
+    buffer : memoryview | None = shared.buf
+
+    if buffer is None:
+        raise ValueError(f"Shared memory block {shared.name} is closed")
+
+    return (buffer)
+
+
+def _label_components(tile: MazeGrid) -> array[int]:
+    """
+    Number the connected parts of a carved tile.
+
+    :param tile: Carved tile
+    :type tile: MazeGrid
+    :return: Component of every cell, -1 for blocked cells
+    :rtype: array[int]
+    """
+
+    labels : array[int] = array("i", [-1]) * len(tile)
+    count : int = 0
+
+    for root, code in enumerate(tile.cells):
+        if code & BLOCKED or labels[root] >= 0:
+            continue
+
+        labels[root] = count
+        frontier : list[int] = [root]
+        for current in frontier:
+            for neighbor in tile.open_neighbors(current):
+                if labels[neighbor] < 0:
+                    labels[neighbor] = count
+                    frontier.append(neighbor)
+        count += 1
+
+    return (labels)
+
+
+def carve_tile(task: TileTask) -> TileResult:
+    """
+    Worker entry point: carve one tile of a shared grid in place.
+
+    The tile is copied out of the shared buffer, carved as a maze of
+    its own and copied back. Its outer walls stay closed, so tiles
+    never write each other's bytes and need no locking. Parts of the
+    tile the configured carver cannot reach (cut off by the 42 mask)
+    are carved with DFS, which leaves every tile a forest.
+
+    :param task: Shared memory name, tile geometry, algorithm and seed
+    :type task: TileTask
+    :return: Number of components and, if more than one, their labels
+    :rtype: TileResult
+    """
+
+    name, width, x0, y0, tile_width, tile_height, algorithm, seed = task
+    carve : Carver = get_algorithm(algorithm)
+    # Pool workers share the parent's resource tracker, which already
+    # knows the block, so attaching needs no extra bookkeeping
+    shared : shared_memory.SharedMemory = shared_memory.SharedMemory(name)
+
+    try:
+        buffer : memoryview = _shared_buffer(shared)
+        spans : list[slice] = [
+            slice(y * width + x0, y * width + x0 + tile_width)
+            for y in range(y0, y0 + tile_height)
+        ]
+        cells : bytearray = bytearray().join(buffer[span] for span in spans)
+        tile : MazeGrid = MazeGrid.from_cells(tile_width, tile_height, cells)
+
+        rng : random.Random = random.Random(seed)
+        start : int = cells.translate(_UNCARVED_TABLE).find(1)
+
+        if start >= 0:
+            carve(tile, start, rng)
+            while (start := cells.translate(_UNCARVED_TABLE).find(1)) >= 0:
+                carve_dfs(tile, start, rng)
+
+        for row, span in enumerate(spans):
+            buffer[span] = cells[row * tile_width:(row + 1) * tile_width]
+        del buffer
+    finally:
+        shared.close()
+
+    # A forest has as many trees as cells minus passages
+    free : int = len(cells) - cells.translate(BLOCKED_TABLE).count(1)
+    components : int = free - sum(cells.translate(_PASSAGES_TABLE))
+
+    if components <= 1:
+        return (components, None)
+
+    return (components, _label_components(tile))
+
+
+def _run_tiles(tasks: list[TileTask], workers: int) -> Iterator[TileResult]:
+    if workers == 1:
+        yield from map(carve_tile, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(carve_tile, tasks)
+
+
+def _stitch(
+    grid: MazeGrid,
+    tiles: list[Tile],
+    results: list[TileResult],
+    columns: int,
+    rng: random.Random | None
+) -> int:
+    """
+    Join the carved tiles into one tree.
+
+    Each component of each tile is one node of a union-find. The
+    borders between neighbouring tiles are visited in random order and
+    a wall of a border is opened whenever it links two components that
+    are not connected yet (randomised Kruskal on the tile graph). When
+    both tiles are a single tree, one random wall is tried first and the
+    border is only scanned if it falls on the 42 mask.
+
+    :param grid: Grid whose tiles have been carved
+    :type grid: MazeGrid
+    :param tiles: Tile layout, as returned by tile_layout()
+    :type tiles: list[Tile]
+    :param results: Result of carve_tile() for every tile
+    :type results: list[TileResult]
+    :param columns: Tiles per row of tiles
+    :type columns: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :return: Number of walls opened
+    :rtype: int
+    """
+
+    source = rng or random
+    cells : bytearray = grid.cells
+    width : int = grid.width
+
+    bases : list[int] = []
+    nodes : int = 0
+    for components, _ in results:
+        bases.append(nodes)
+        nodes += components
+    joined : UnionFind = UnionFind(nodes)
+
+    def node(tile: int, idx: int) -> int:
+        labels : array[int] | None = results[tile][1]
+        if labels is None:
+            return (bases[tile])
+        x0, y0, tile_width, _ = tiles[tile]
+        x, y = grid.coords(idx)
+        return (bases[tile] + labels[(y - y0) * tile_width + x - x0])
+
+    # (tile, neighbouring tile, first cell, step along the border,
+    # border length, wall opened from the first tile's side)
+    borders : list[tuple[int, int, int, int, int, int]] = []
+    for tile, (x0, y0, tile_width, tile_height) in enumerate(tiles):
+        if (tile + 1) % columns:
+            borders.append((
+                tile, tile + 1, grid.index(x0 + tile_width - 1, y0),
+                width, tile_height, EAST
+            ))
+        if tile + columns < len(tiles):
+            borders.append((
+                tile, tile + columns,
+                grid.index(x0, y0 + tile_height - 1),
+                1, tile_width, SOUTH
+            ))
+    source.shuffle(borders)
+
+    def link(tile: int, other: int, idx: int, wall: int) -> bool:
+        neighbor : int = idx + (1 if wall == EAST else width)
+        if cells[idx] & BLOCKED or cells[neighbor] & BLOCKED:
+            return (False)
+        if not joined.union(node(tile, idx), node(other, neighbor)):
+            return (False)
+        grid.remove_wall(idx, wall)
+        return (True)
+
+    opened : int = 0
+
+    for tile, other, first, step, length, wall in borders:
+        if results[tile][1] is None and results[other][1] is None:
+            if joined.find(bases[tile]) == joined.find(bases[other]):
+                continue
+            if link(tile, other, first + source.randrange(length) * step,
+                    wall):
+                opened += 1
+                continue
+
+        positions : list[int] = list(range(length))
+        source.shuffle(positions)
+        opened += sum(
+            link(tile, other, first + position * step, wall)
+            for position in positions
+        )
+
+    return (opened)
+
+
+def carve_tiled(
+    grid: MazeGrid,
+    algorithm: str,
+    tile_size: int,
+    rng: random.Random | None = None,
+    jobs: int | None = None
+) -> int:
+    """
+    Carve a perfect maze tile by tile across worker processes.
+
+    The grid is split into tile_size x tile_size tiles, each carved
+    independently with the configured algorithm in a process pool. The
+    cell bytes live in one multiprocessing.shared_memory block that
+    every worker writes its own tile into, so only the task tuples and
+    the (rare) component labels of tiles split by the 42 mask go
+    through pickling. A spanning-tree pass over the tile borders then
+    joins the tiles, keeping the maze perfect.
+
+    Tile seeds are drawn from rng up front, so a seeded maze does not
+    depend on the number of jobs. Blocked cells are never carved.
+
+    :param grid: Masked grid carved in place
+    :type grid: MazeGrid
+    :param algorithm: Name of the carver used inside each tile
+    :type algorithm: str
+    :param tile_size: Side of a tile in cells
+    :type tile_size: int
+    :param rng: Random source, defaults to the global random module
+    :type rng: random.Random | None
+    :param jobs: Worker processes, defaults to the number of CPUs
+    :type jobs: int | None
+    :return: Number of cells in the carved maze
+    :rtype: int
+    :raises ValueError: If the algorithm is not supported or the tile
+        size is not positive
+    """
+
+    if tile_size <= 0:
+        raise ValueError(f"Tile size must be positive: {tile_size}")
+
+    get_algorithm(algorithm)
+    source = rng or random
+    tiles : list[Tile] = tile_layout(grid.width, grid.height, tile_size)
+    columns : int = -(-grid.width // tile_size)
+    workers : int = max(1, min(jobs or os.cpu_count() or 1, len(tiles)))
+
+    shared : shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=len(grid)
+    )
+
+    try:
+        buffer : memoryview = _shared_buffer(shared)
+        buffer[:len(grid)] = grid.cells
+        tasks : list[TileTask] = [
+            (shared.name, grid.width, x0, y0, tile_width, tile_height,
+             algorithm, source.getrandbits(_SEED_BITS))
+            for x0, y0, tile_width, tile_height in tiles
+        ]
+        results : list[TileResult] = list(_run_tiles(tasks, workers))
+        grid.cells[:] = buffer[:len(grid)]
+        del buffer
+    finally:
+        shared.close()
+        shared.unlink()
+
+    _stitch(grid, tiles, results, columns, rng)
+
+    return (len(grid) - grid.cells.translate(BLOCKED_TABLE).count(1))
@@ -0,0 +1,3 @@
+# Text render modes
+
+RENDER_MODES : tuple[str, ...] = ("ascii", "unicode", "halfblock")
@@ -0,0 +1,530 @@
+from __future__ import annotations
+
+import binascii
+import lzma
+import mmap
+import struct
+import zlib
+
+from dataclasses import dataclass
+from functools import cached_property
+from types import TracebackType
+from typing import Callable, Iterator
+
+from srcs.maze_config.maze import Point
+from srcs.maze_generator.maze_grid import WALL_MASK, MazeGrid
+from srcs.maze_io.hex_format import (
+    DECODE_TABLE, HEX_TABLE, HexMaze, load_maze, restore_mask
+)
+
+# File layout: header, algorithm name (its length is in the header),
+# then the payload: the wall codes packed two cells per byte (first
+# cell in the high nibble), followed by the path packed four steps per
+# byte (first step in the two high bits, N=0 E=1 S=2 W=3). A
+# compressed payload is stored as independent blocks, each prefixed
+# with its compressed size, of at most BLOCK_BYTES raw bytes.
+#
+# Seeds that do not fit the signed 64-bit header field (Maze accepts
+# any integer, and batch task seeds grow with the base seed) are written
+# as version WIDE_SEED_VERSION: the header field is 0 and the seed
+# follows the algorithm name, as its byte count then that many bytes of
+# signed little-endian integer.
+MAGIC : bytes = b"AMZB"
+VERSION : int = 1
+WIDE_SEED_VERSION : int = 2
+_HEADER : struct.Struct = struct.Struct("<4sBBBIIIIIIQq")
+_SEED_SIZE : struct.Struct = struct.Struct("<H")
+_SEED_MIN : int = -(1 << 63)
+_SEED_MAX : int = (1 << 63) - 1
+_BLOCK_SIZE : struct.Struct = struct.Struct("<I")
+
+BLOCK_BYTES : int = 1 << 20
+
+COMPRESSIONS : tuple[str, ...] = ("none", "zlib", "lzma")
+_COMPRESSORS : dict[str, Callable[[bytes], bytes]] = {
+    "zlib": lambda block: zlib.compress(block, 6),
+    "lzma": lambda block: lzma.compress(block, preset=6),
+}
+# Compressed blocks are read in place, as slices of the mapped file
+_DECOMPRESSORS : dict[str, Callable[[bytes | memoryview], bytes]] = {
+    "zlib": zlib.decompress,
+    "lzma": lzma.decompress,
+}
+
+_FLAG_PERFECT : int = 0x01
+_FLAG_SEEDED : int = 0x02
+
+STEPS : bytes = b"NESW"
+
+# bytes.translate() tables packing / unpacking path steps
+_INVALID_STEP : int = 0xFF
+_STEP_TABLE : bytes = bytes(
+    STEPS.index(byte) if byte in STEPS else _INVALID_STEP
+    for byte in range(256)
+)
+# One table per position of a step inside its byte
+_STEP_SHIFTS : tuple[int, ...] = (6, 4, 2, 0)
+_PACK_STEP_TABLES : tuple[bytes, ...] = tuple(
+    bytes((code & 3) << shift for code in range(256))
+    for shift in _STEP_SHIFTS
+)
+_UNPACK_STEP_TABLES : tuple[bytes, ...] = tuple(
+    bytes(STEPS[(code >> shift) & 3] for code in range(256))
+    for shift in _STEP_SHIFTS
+)
+
+
+@dataclass(frozen=True)
+class MazeInfo:
+    perfect: bool
+    algorithm: str
+    seed: int | None
+
+
+def _or_lanes(lanes: list[bytes], size: int) -> bytes:
+    """
+    Bitwise OR of equally long byte strings, as big integers.
+
+    :param lanes: Byte strings of `size` bytes each
+    :type lanes: list[bytes]
+    :param size: Length of every lane
+    :type size: int
+    :return: The combined bytes
+    :rtype: bytes
+    """
+
+    combined : int = 0
+    for lane in lanes:
+        combined |= int.from_bytes(lane, "little")
+    return (combined.to_bytes(size, "little"))
+
+
+def pack_cells(cells: bytes | bytearray) -> bytes:
+    """
+    Pack the wall codes of cells two per byte; flag bits are dropped.
+
+    A packed byte is exactly two hex digits, so the cells are turned
+    into the digits of the text format and binascii.unhexlify() packs
+    them, all in C.
+
+    :param cells: Raw cell bytes
+    :type cells: bytes | bytearray
+    :return: ceil(len(cells) / 2) bytes, first cell in the high nibble
+    :rtype: bytes
+    """
+
+    digits : bytes | bytearray = cells.translate(HEX_TABLE)
+    if len(digits) % 2:
+        digits += b"0"
+    return (binascii.unhexlify(digits))
+
+
+def unpack_cells(packed: bytes | memoryview, count: int) -> bytearray:
+    """
+    Inverse of pack_cells(), through binascii.hexlify().
+
+    :param packed: Packed wall codes
+    :type packed: bytes | memoryview
+    :param count: Number of cells
+    :type count: int
+    :return: One wall code per cell
+    :rtype: bytearray
+    """
+
+    cells : bytearray = bytearray(binascii.hexlify(packed))
+    del cells[count:]
+    return (cells.translate(DECODE_TABLE))
+
+
+def pack_directions(directions: str) -> bytes:
+    """
+    Pack an N/E/S/W path four steps per byte.
+
+    :param directions: Path as N/E/S/W letters
+    :type directions: str
+    :return: ceil(len(directions) / 4) bytes
+    :rtype: bytes
+    :raises ValueError: If the path holds another letter
+    """
+
+    codes : bytes = directions.encode("ascii").translate(_STEP_TABLE)
+
+    if codes.find(_INVALID_STEP) >= 0:
+        raise ValueError(f"Invalid path step in: {directions[:32]}")
+
+    size : int = -(-len(codes) // 4)
+    codes = codes.ljust(4 * size, b"\0")
+    return (_or_lanes(
+        [codes[offset::4].translate(table)
+         for offset, table in enumerate(_PACK_STEP_TABLES)],
+        size
+    ))
+
+
+def unpack_directions(packed: bytes | memoryview, steps: int) -> str:
+    """
+    Inverse of pack_directions().
+
+    :param packed: Packed path
+    :type packed: bytes | memoryview
+    :param steps: Number of steps
+    :type steps: int
+    :return: Path as N/E/S/W letters
+    :rtype: str
+    """
+
+    packed = bytes(packed)
+    letters : bytearray = bytearray(4 * len(packed))
+    for offset, table in enumerate(_UNPACK_STEP_TABLES):
+        letters[offset::4] = packed.translate(table)
+    del letters[steps:]
+    return (letters.decode("ascii"))
+
+
+def _payload_chunks(grid: MazeGrid, directions: str) -> Iterator[bytes]:
+    """
+    Yield the raw payload in chunks of at most BLOCK_BYTES bytes.
+
+    :param grid: The maze grid
+    :type grid: MazeGrid
+    :param directions: Entry -> exit path as N/E/S/W letters
+    :type directions: str
+    :return: Packed cells, then the packed path
+    :rtype: Iterator[bytes]
+    """
+
+    cells : memoryview = memoryview(grid.cells)
+    step : int = 2 * BLOCK_BYTES
+
+    for start in range(0, len(cells), step):
+        yield (pack_cells(bytes(cells[start:start + step])))
+
+    for start in range(0, len(directions), 4 * BLOCK_BYTES):
+        yield (pack_directions(directions[start:start + 4 * BLOCK_BYTES]))
+
+
+def write_binary_maze(
+    path: str,
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    directions: str,
+    info: MazeInfo,
+    compression: str = "none"
+) -> int:
+    """
+    Write a maze in the compact binary format.
+
+    Uncompressed, about half the size of the hex text format (no
+    newlines, two cells per byte, four path steps per byte); it is
+    decoded without any text parsing.
+
+    :param path: Destination file path
+    :type path: str
+    :param grid: The maze grid
+    :type grid: MazeGrid
+    :param entry: Entry point
+    :type entry: Point
+    :param exit: Exit point
+    :type exit: Point
+    :param directions: Entry -> exit path as N/E/S/W letters
+    :type directions: str
+    :param info: Perfect flag, algorithm and seed stored in the header
+    :type info: MazeInfo
+    :param compression: "none", "zlib" or "lzma"
+    :type compression: str
+    :return: Number of bytes written
+    :rtype: int
+    :raises ValueError: If the compression is not supported or the seed
+        takes more than 65535 bytes
+    """
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    algorithm : bytes = info.algorithm.encode("ascii")
+    flags : int = (
+        (_FLAG_PERFECT if info.perfect else 0)
+        | (_FLAG_SEEDED if info.seed is not None else 0)
+    )
+    seed : int = info.seed or 0
+    wide_seed : bytes = b""
+
+    if not _SEED_MIN <= seed <= _SEED_MAX:
+        raw_seed : bytes = seed.to_bytes(
+            (seed.bit_length() + 8) // 8, "little", signed=True
+        )
+        if len(raw_seed) > 0xFFFF:
+            raise ValueError("Seed too large for the binary format")
+        wide_seed = _SEED_SIZE.pack(len(raw_seed)) + raw_seed
+        seed = 0
+
+    header : bytes = _HEADER.pack(
+        MAGIC, WIDE_SEED_VERSION if wide_seed else VERSION, flags,
+        COMPRESSIONS.index(compression), grid.width, grid.height,
+        entry.x, entry.y, exit.x, exit.y, len(directions), seed
+    )
+    compress : Callable[[bytes], bytes] | None = _COMPRESSORS.get(
+        compression
+    )
+    written : int = 0
+
+    with open(path, "wb") as file:
+        written += file.write(header)
+        written += file.write(
+            bytes([len(algorithm)]) + algorithm + wide_seed
+        )
+
+        for chunk in _payload_chunks(grid, directions):
+            if compress is not None:
+                chunk = compress(chunk)
+                written += file.write(_BLOCK_SIZE.pack(len(chunk)))
+            written += file.write(chunk)
+
+    return (written)
+
+
+class BinaryMaze:
+    """
+    Memory-mapped view of a maze written in the binary format.
+
+    Opening maps the file and reads the header only. For uncompressed
+    files the packed walls and path are read straight from the mapping
+    (packed_cells and wall_code() copy nothing); compressed payloads
+    are inflated on first access. The grid and the path are decoded
+    only when asked for.
+    """
+
+    path : str
+    width : int
+    height : int
+    entry : Point
+    exit : Point
+    info : MazeInfo
+    compression : str
+    steps : int
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        with open(path, "rb") as file:
+            self.__map : mmap.mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        try:
+            self.__parse_header()
+        except (ValueError, IndexError, struct.error):
+            self.close()
+            raise ValueError(f"Not a binary maze file: {path}")
+
+
+    def __parse_header(self) -> None:
+        (magic, version, flags, compression, width, height,
+         entry_x, entry_y, exit_x, exit_y, steps, seed) = (
+            _HEADER.unpack_from(self.__map)
+        )
+
+        if magic != MAGIC or version not in (VERSION, WIDE_SEED_VERSION):
+            raise ValueError(f"Not a binary maze file: {self.path}")
+
+        name_size : int = self.__map[_HEADER.size]
+        name_start : int = _HEADER.size + 1
+        payload_start : int = name_start + name_size
+
+        if version == WIDE_SEED_VERSION:
+            (seed_size,) = _SEED_SIZE.unpack_from(self.__map, payload_start)
+            payload_start += _SEED_SIZE.size
+            raw_seed : bytes = self.__map[
+                payload_start:payload_start + seed_size
+            ]
+            if len(raw_seed) != seed_size:
+                raise ValueError(f"Truncated seed in {self.path}")
+            seed = int.from_bytes(raw_seed, "little", signed=True)
+            payload_start += seed_size
+
+        self.width = width
+        self.height = height
+        self.entry = Point(entry_x, entry_y)
+        self.exit = Point(exit_x, exit_y)
+        self.steps = steps
+        self.compression = COMPRESSIONS[compression]
+        self.info = MazeInfo(
+            perfect=bool(flags & _FLAG_PERFECT),
+            algorithm=self.__map[
+                name_start:name_start + name_size
+            ].decode("ascii"),
+            seed=seed if flags & _FLAG_SEEDED else None,
+        )
+        self.__payload_start : int = payload_start
+        self.__cells_size : int = -(-width * height // 2)
+
+
+    @cached_property
+    def __payload(self) -> memoryview:
+        """
+        The raw payload: a view of the mapping, or the inflated blocks.
+
+        :return: Packed cells followed by the packed path
+        :rtype: memoryview
+        :raises ValueError: If a block is truncated or corrupt
+        """
+
+        view : memoryview = memoryview(self.__map)[self.__payload_start:]
+        decompress : Callable[[bytes | memoryview], bytes] | None = (
+            _DECOMPRESSORS.get(self.compression)
+        )
+
+        if decompress is None:
+            return (view)
+
+        raw : bytearray = bytearray()
+        offset : int = 0
+
+        try:
+            while offset < len(view):
+                (size,) = _BLOCK_SIZE.unpack_from(view, offset)
+                offset += _BLOCK_SIZE.size
+                raw += decompress(view[offset:offset + size])
+                offset += size
+        except (struct.error, zlib.error, lzma.LZMAError):
+            raise ValueError(f"Corrupt payload in {self.path}")
+        finally:
+            view.release()
+
+        return (memoryview(raw))
+
+
+    @property
+    def packed_cells(self) -> memoryview:
+        """
+        Wall codes packed two cells per byte, without copying them.
+
+        The view must be released before the maze is closed.
+
+        :return: ceil(width * height / 2) bytes
+        :rtype: memoryview
+        :raises ValueError: If the payload is truncated
+        """
+
+        if len(self.__payload) < self.__cells_size:
+            raise ValueError(f"Truncated maze in {self.path}")
+
+        return (self.__payload[:self.__cells_size])
+
+
+    def wall_code(self, x: int, y: int) -> int:
+        """
+        Read the wall code of one cell without decoding the grid.
+
+        :param x: Column of the cell
+        :type x: int
+        :param y: Row of the cell
+        :type y: int
+        :return: Wall code (north=1, east=2, south=4, west=8)
+        :rtype: int
+        """
+
+        idx : int = y * self.width + x
+
+        with self.packed_cells as cells:
+            byte : int = cells[idx >> 1]
+
+        return (byte & WALL_MASK if idx & 1 else byte >> 4)
+
+
+    @cached_property
+    def grid(self) -> MazeGrid:
+        """
+        Decode the packed walls into a compact grid.
+
+        Cells of the centred 42 pattern that are fully walled get the
+        blocked flag back, see restore_mask().
+
+        :return: The decoded grid
+        :rtype: MazeGrid
+        :raises ValueError: If the payload is truncated
+        """
+
+        with self.packed_cells as packed:
+            cells : bytearray = unpack_cells(
+                packed, self.width * self.height
+            )
+        restore_mask(self.width, self.height, cells)
+        return (MazeGrid.from_cells(self.width, self.height, cells))
+
+
+    @cached_property
+    def directions(self) -> str:
+        """
+        Return the stored entry -> exit path as N/E/S/W letters.
+
+        :return: The path string, empty if the file has none
+        :rtype: str
+        :raises ValueError: If the payload is truncated
+        """
+
+        end : int = self.__cells_size + -(-self.steps // 4)
+
+        if len(self.__payload) < end:
+            raise ValueError(f"Truncated path in {self.path}")
+
+        with self.__payload[self.__cells_size:end] as packed:
+            return (unpack_directions(packed, self.steps))
+
+
+    def close(self) -> None:
+        # The mapping cannot be closed while a view of it is alive
+        payload : memoryview | None = self.__dict__.pop(
+            "_BinaryMaze__payload", None
+        )
+        if payload is not None:
+            payload.release()
+        self.__map.close()
+
+
+    def __enter__(self) -> BinaryMaze:
+        return (self)
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def load_binary_maze(path: str) -> BinaryMaze:
+    """
+    Open a maze previously written with write_binary_maze().
+
+    :param path: Path of the binary maze file
+    :type path: str
+    :return: Lazily decoded maze
+    :rtype: BinaryMaze
+    :raises ValueError: If the file is not in the binary maze format
+    """
+
+    return (BinaryMaze(path))
+
+
+def open_maze(path: str) -> HexMaze | BinaryMaze:
+    """
+    Open a maze file in either output format, told apart by its magic.
+
+    :param path: Path of a hex or binary maze file
+    :type path: str
+    :return: Lazily decoded maze
+    :rtype: HexMaze | BinaryMaze
+    :raises ValueError: If the file is in neither format
+    """
+
+    with open(path, "rb") as file:
+        magic : bytes = file.read(len(MAGIC))
+
+    if magic == MAGIC:
+        return (load_binary_maze(path))
+
+    return (load_maze(path))
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_generator import MazeGenerator
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+
+# Entry layout: header, then width * height raw cell bytes, then the
+# entry -> exit path as N/E/S/W letters
+_MAGIC : bytes = b"AMZC"
+_VERSION : int = 1
+_HEADER : struct.Struct = struct.Struct("<4sBIII")
+
+_SUFFIX : str = ".bin"
+DEFAULT_MAX_BYTES : int = 256 << 20
+
+
+@dataclass(frozen=True)
+class CachedMaze:
+    grid: MazeGrid
+    directions: str
+
+
+def cache_key(maze: Maze) -> str | None:
+    """
+    Return the content address of a maze configuration.
+
+    Only the fields that shape the maze are hashed (the output file is
+    not), and equivalent configs normalise to the same text: the loop
+    fraction only counts for imperfect mazes. Unseeded configs give a
+    different maze on every run, so they have no key.
+
+    :param maze: Validated maze configuration
+    :type maze: Maze
+    :return: Hex SHA-256 of the normalised config, None without seed
+    :rtype: str | None
+    """
+
+    if maze.seed is None:
+        return (None)
+
+    normalized : str = "|".join((
+        f"v{_VERSION}",
+        f"size={maze.width}x{maze.height}",
+        f"entry={maze.entry.x},{maze.entry.y}",
+        f"exit={maze.exit.x},{maze.exit.y}",
+        f"perfect={maze.perfect}",
+        f"algorithm={maze.algorithm}",
+        f"loops={0.0 if maze.perfect else maze.loop_fraction!r}",
+        f"seed={maze.seed}",
+        # Untiled keys are unchanged from before tiling existed
+        *((f"tiles={maze.tile_size}",) if maze.tile_size else ()),
+    ))
+    return (hashlib.sha256(normalized.encode("utf-8")).hexdigest())
+
+
+class MazeCache:
+    """
+    Content-addressed on-disk cache of generated mazes.
+
+    Each entry is one binary file named after cache_key() holding the
+    compact grid and the solution path, so a hit costs a single read.
+    Entries are evicted least recently used first once the directory
+    grows past max_bytes. Hit, miss, store, eviction and bypass counts
+    are kept for scraping through stats().
+    """
+
+    directory : str
+    max_bytes : int
+    hits : int
+    misses : int
+    stores : int
+    evictions : int
+    bypasses : int
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.__entries : OrderedDict[str, int] = self.__scan()
+
+
+    def __scan(self) -> OrderedDict[str, int]:
+        """
+        Index the entries already on disk, least recently used first.
+
+        :return: Entry key -> file size, in LRU order
+        :rtype: OrderedDict[str, int]
+        """
+
+        found : list[tuple[float, str, int]] = []
+
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(_SUFFIX):
+                    stat = entry.stat()
+                    found.append((
+                        stat.st_mtime, entry.name[:-len(_SUFFIX)],
+                        stat.st_size
+                    ))
+
+        found.sort()
+        return (OrderedDict((key, size) for _, key, size in found))
+
+
+    def __path(self, key: str) -> str:
+        return (os.path.join(self.directory, key + _SUFFIX))
+
+
+    @property
+    def total_bytes(self) -> int:
+        return (sum(self.__entries.values()))
+
+
+    def get(self, maze: Maze) -> CachedMaze | None:
+        """
+        Look a maze up in the cache, counting the hit or miss.
+
+        Unreadable or corrupt entries (e.g. truncated by a crash, or
+        evicted by another process meanwhile) are dropped and count as
+        a miss. Unseeded configs are never cached and count as a bypass.
+
+        :param maze: Validated maze configuration
+        :type maze: Maze
+        :return: The cached grid and path, or None on a miss
+        :rtype: CachedMaze | None
+        """
+
+        key : str | None = cache_key(maze)
+
+        if key is None:
+            self.bypasses += 1
+            return (None)
+
+        if key not in self.__entries:
+            self.misses += 1
+            return (None)
+
+        try:
+            with open(self.__path(key), "rb") as file:
+                data : bytes = file.read()
+            cached : CachedMaze = _decode(data)
+            os.utime(self.__path(key))
+        except (OSError, ValueError):
+            self.__entries.pop(key, None)
+            try:
+                os.remove(self.__path(key))
+            except OSError:
+                pass
+            self.evictions += 1
+            self.misses += 1
+            return (None)
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return (cached)
+
+
+    def put(self, maze: Maze, grid: MazeGrid, directions: str) -> None:
+        """
+        Store a generated maze, evicting old entries if needed.
+
+        The entry is written to a temporary file and renamed, so readers
+        never see a partial entry.
+
+        :param maze: Validated maze configuration
+        :type maze: Maze
+        :param grid: The generated grid
+        :type grid: MazeGrid
+        :param directions: Entry -> exit path as N/E/S/W letters
+        :type directions: str
+        :return:
+        :rtype: None
+        """
+
+        key : str | None = cache_key(maze)
+
+        if key is None:
+            return
+
+        data : bytes = _encode(grid, directions)
+        path : str = self.__path(key)
+        partial : str = f"{path}.{os.getpid()}.tmp"
+
+        with open(partial, "wb") as file:
+            file.write(data)
+        os.replace(partial, path)
+
+        self.__entries[key] = len(data)
+        self.__entries.move_to_end(key)
+        self.stores += 1
+        self.__evict()
+
+
+    def __evict(self) -> None:
+        total : int = self.total_bytes
+
+        while total > self.max_bytes and len(self.__entries) > 1:
+            key, size = self.__entries.popitem(last=False)
+            try:
+                os.remove(self.__path(key))
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+
+
+    def get_or_generate(self, maze: Maze) -> CachedMaze:
+        """
+        Serve a maze from the cache, generating it on a miss.
+
+        Either way the configured output file is written, in the
+        configured output format, by the pipeline's write stage. On a
+        hit this is a single read of the entry plus the file write;
+        generation and solving are skipped.
+
+        :param maze: Validated maze configuration
+        :type maze: Maze
+        :return: The grid and path of the maze
+        :rtype: CachedMaze
+        """
+
+        cached : CachedMaze | None = self.get(maze)
+
+        if cached is not None:
+            MazePipeline.restore(maze, cached.grid, cached.directions).write()
+            return (cached)
+
+        generator : MazeGenerator = MazeGenerator(maze)
+        directions : str = generator.directions()
+        self.put(maze, generator.grid, directions)
+
+        return (CachedMaze(generator.grid, directions))
+
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache counters.
+
+        :return: Counter name -> value
+        :rtype: dict[str, int]
+        """
+
+        return ({
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(self.__entries),
+            "bytes": self.total_bytes,
+        })
+
+
+def _encode(grid: MazeGrid, directions: str) -> bytes:
+    path : bytes = directions.encode("ascii")
+    return (
+        _HEADER.pack(_MAGIC, _VERSION, grid.width, grid.height, len(path))
+        + bytes(grid.cells) + path
+    )
+
+
+def _decode(data: bytes) -> CachedMaze:
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated maze cache entry")
+
+    magic, version, width, height, path_len = _HEADER.unpack_from(data)
+
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a maze cache entry")
+
+    start : int = _HEADER.size
+    end : int = start + width * height
+
+    if len(data) != end + path_len:
+        raise ValueError("Truncated maze cache entry")
+
+    return (CachedMaze(
+        MazeGrid.from_cells(width, height, bytearray(data[start:end])),
+        data[end:].decode("ascii")
+    ))
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import mmap
+
+from functools import cached_property
+from types import TracebackType
+from typing import Iterable, Iterator
+
+from srcs.maze_config.maze import Point
+from srcs.maze_generator.mask import (
+    PATTERN_HEIGHT, PATTERN_WIDTH, mask_42_cells
+)
+from srcs.maze_generator.maze_grid import (
+    ALL_WALLS, BLOCKED, WALL_MASK, MazeGrid
+)
+
+
+HEX_DIGITS : bytes = b"0123456789ABCDEF"
+
+# Inverse of HEX_TABLE: hex digit (either case) -> wall code, anything
+# else -> INVALID_CODE
+INVALID_CODE : int = 0xFF
+DECODE_TABLE : bytes = bytes(
+    int(chr(byte), 16) if chr(byte) in "0123456789abcdefABCDEF"
+    else INVALID_CODE
+    for byte in range(256)
+)
+
+# bytes.translate() table turning a raw cell byte (walls + flags) into
+# the hex digit of its walls
+HEX_TABLE : bytes = bytes(
+    HEX_DIGITS[code & WALL_MASK] for code in range(256)
+)
+
+# Rows are grouped so each write() hands the OS roughly this many bytes
+WRITE_CHUNK_BYTES : int = 1 << 20
+
+
+def encode_rows(grid: MazeGrid) -> Iterator[bytes]:
+    """
+    Yield the hex wall rows of the grid, newline included.
+
+    Rows are grouped into chunks of about WRITE_CHUNK_BYTES and every
+    chunk is encoded with a single bytes.translate() call, so only one
+    chunk of text exists at any time.
+
+    :param grid: The grid to encode
+    :type grid: MazeGrid
+    :return: Encoded chunks of whole rows
+    :rtype: Iterator[bytes]
+    """
+
+    width : int = grid.width
+    cells : memoryview = memoryview(grid.cells)
+    rows_per_chunk : int = max(1, WRITE_CHUNK_BYTES // (width + 1))
+    chunk_size : int = rows_per_chunk * width
+
+    for start in range(0, len(cells), chunk_size):
+        text : bytes = bytes(cells[start:start + chunk_size]).translate(
+            HEX_TABLE
+        )
+        yield (
+            b"\n".join(
+                text[offset:offset + width]
+                for offset in range(0, len(text), width)
+            )
+            + b"\n"
+        )
+
+
+def write_hex_maze(
+    path: str,
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    directions: str
+) -> int:
+    """
+    Write a maze in the hexadecimal output format.
+
+    The file holds one line of hex wall codes per row, a blank line,
+    the entry and exit as "x,y" and the path as a string of N/E/S/W
+    steps.
+
+    :param path: Destination file path
+    :type path: str
+    :param grid: The maze grid
+    :type grid: MazeGrid
+    :param entry: Entry point
+    :type entry: Point
+    :param exit: Exit point
+    :type exit: Point
+    :param directions: Entry -> exit path as N/E/S/W letters
+    :type directions: str
+    :return: Number of bytes written
+    :rtype: int
+    """
+
+    written : int = 0
+
+    with open(path, "wb", buffering=WRITE_CHUNK_BYTES) as file:
+        for chunk in encode_rows(grid):
+            written += file.write(chunk)
+        written += file.write(_footer(entry, exit, directions))
+
+    return (written)
+
+
+def encode_hex_maze(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    directions: str
+) -> bytes:
+    """
+    Encode a maze in the hexadecimal output format, in memory.
+
+    Same bytes as write_hex_maze() writes to a file.
+
+    :param grid: The maze grid
+    :type grid: MazeGrid
+    :param entry: Entry point
+    :type entry: Point
+    :param exit: Exit point
+    :type exit: Point
+    :param directions: Entry -> exit path as N/E/S/W letters
+    :type directions: str
+    :return: The encoded maze
+    :rtype: bytes
+    """
+
+    return (b"".join(encode_rows(grid)) + _footer(entry, exit, directions))
+
+
+def write_hex_rows(
+    path: str,
+    rows: Iterable[bytes | bytearray],
+    entry: Point,
+    exit: Point,
+    directions: str = ""
+) -> int:
+    """
+    Write a maze in the hexadecimal format from a stream of rows.
+
+    Each row of raw cell bytes is encoded and handed to the buffered
+    file as soon as it arrives, so only one row is held at a time.
+
+    :param path: Destination file path
+    :type path: str
+    :param rows: Raw cell bytes of each row, top to bottom
+    :type rows: Iterable[bytes | bytearray]
+    :param entry: Entry point
+    :type entry: Point
+    :param exit: Exit point
+    :type exit: Point
+    :param directions: Entry -> exit path as N/E/S/W letters, may be
+        left empty and appended later with append_directions()
+    :type directions: str
+    :return: Number of bytes written
+    :rtype: int
+    """
+
+    written : int = 0
+
+    with open(path, "wb", buffering=WRITE_CHUNK_BYTES) as file:
+        for row in rows:
+            written += file.write(row.translate(HEX_TABLE) + b"\n")
+        written += file.write(_footer(entry, exit, directions))
+
+    return (written)
+
+
+def append_directions(path: str, directions: str) -> int:
+    """
+    Fill in the path line of a file written with an empty path.
+
+    :param path: Hex maze file whose last line is empty
+    :type path: str
+    :param directions: Entry -> exit path as N/E/S/W letters
+    :type directions: str
+    :return: Number of bytes written
+    :rtype: int
+    """
+
+    with open(path, "r+b") as file:
+        file.seek(-1, 2)
+        return (file.write(directions.encode("ascii") + b"\n"))
+
+
+def restore_mask(width: int, height: int, cells: bytearray) -> None:
+    """
+    Flag the fully walled cells of the centred 42 pattern as blocked.
+
+    Output files only hold walls, so the blocked flag is rebuilt on
+    load from the pattern position, as it was when the file was
+    written.
+
+    :param width: Maze width in cells
+    :type width: int
+    :param height: Maze height in cells
+    :type height: int
+    :param cells: Decoded wall codes, updated in place
+    :type cells: bytearray
+    :return:
+    :rtype: None
+    """
+
+    if width < PATTERN_WIDTH or height < PATTERN_HEIGHT:
+        return
+
+    for x, y in mask_42_cells(width, height):
+        idx : int = y * width + x
+        if cells[idx] == ALL_WALLS:
+            cells[idx] |= BLOCKED
+
+
+def _footer(entry: Point, exit: Point, directions: str) -> bytes:
+    return (
+        f"\n{entry.x},{entry.y}\n{exit.x},{exit.y}\n{directions}\n"
+    ).encode("ascii")
+
+
+class HexMaze:
+    """
+    Memory-mapped view of a maze written in the hexadecimal format.
+
+    Opening only maps the file and locates the blank line that ends the
+    wall rows; the grid is decoded on first access with one
+    bytes.translate() call, and the entry, exit and path lines are
+    parsed only when asked for.
+    """
+
+    path : str
+    width : int
+    height : int
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        with open(path, "rb") as file:
+            self.__map : mmap.mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        try:
+            self.__parse_layout()
+        except ValueError:
+            self.close()
+            raise
+
+
+    def __parse_layout(self) -> None:
+        """
+        Find the grid dimensions from the newline positions.
+
+        :return:
+        :rtype: None
+        :raises ValueError: If the rows are missing or ragged
+        """
+
+        width : int = self.__map.find(b"\n")
+        grid_end : int = self.__map.find(b"\n\n")
+
+        if width <= 0 or grid_end < 0:
+            raise ValueError(f"Not a hex maze file: {self.path}")
+
+        rows_size : int = grid_end + 1
+
+        if rows_size % (width + 1):
+            raise ValueError(f"Rows of unequal length in {self.path}")
+
+        self.width = width
+        self.height = rows_size // (width + 1)
+        self.__rows_size : int = rows_size
+
+
+    @cached_property
+    def grid(self) -> MazeGrid:
+        """
+        Decode the wall rows into a compact grid.
+
+        Cells of the centred 42 pattern that are fully walled get the
+        blocked flag back, see restore_mask().
+
+        :return: The decoded grid
+        :rtype: MazeGrid
+        :raises ValueError: If a row contains a non-hex character or has
+            the wrong length
+        """
+
+        cells : bytearray = bytearray(
+            self.__map[:self.__rows_size].translate(DECODE_TABLE, b"\n")
+        )
+
+        if len(cells) != self.width * self.height:
+            raise ValueError(f"Rows of unequal length in {self.path}")
+
+        if cells.find(INVALID_CODE) >= 0:
+            raise ValueError(f"Invalid wall code in {self.path}")
+
+        restore_mask(self.width, self.height, cells)
+        return (MazeGrid.from_cells(self.width, self.height, cells))
+
+
+    @cached_property
+    def __footer(self) -> list[str]:
+        lines : list[str] = (
+            self.__map[self.__rows_size + 1:].decode("ascii").splitlines()
+        )
+
+        if len(lines) < 2:
+            raise ValueError(f"Missing entry/exit lines in {self.path}")
+
+        return (lines)
+
+
+    @cached_property
+    def entry(self) -> Point:
+        return (_parse_point(self.__footer[0]))
+
+
+    @cached_property
+    def exit(self) -> Point:
+        return (_parse_point(self.__footer[1]))
+
+
+    @cached_property
+    def directions(self) -> str:
+        """
+        Return the stored entry -> exit path as N/E/S/W letters.
+
+        :return: The path string, empty if the file has none
+        :rtype: str
+        """
+
+        return (self.__footer[2] if len(self.__footer) > 2 else "")
+
+
+    def close(self) -> None:
+        self.__map.close()
+
+
+    def __enter__(self) -> HexMaze:
+        return (self)
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def load_maze(path: str) -> HexMaze:
+    """
+    Open a maze previously written with write_hex_maze().
+
+    :param path: Path of the hex maze file
+    :type path: str
+    :return: Lazily decoded maze
+    :rtype: HexMaze
+    :raises ValueError: If the file is not in the hex maze format
+    """
+
+    return (HexMaze(path))
+
+
+def _parse_point(raw: str) -> Point:
+    x, sep, y = raw.partition(",")
+
+    if not sep:
+        raise ValueError(f"Invalid point format: {raw}")
+
+    return (Point(int(x), int(y)))
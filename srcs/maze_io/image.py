@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+
+from typing import BinaryIO
+
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_io.render import MASK, OPEN, PATH, WALL, canvas_rows
+
+IMAGE_FORMATS : tuple[str, ...] = ("pgm", "ppm", "png")
+
+# Colour of each canvas byte kind, RGB; grey levels are their luminance
+COLORS : dict[int, tuple[int, int, int]] = {
+    OPEN: (255, 255, 255),
+    WALL: (0, 0, 0),
+    PATH: (220, 40, 40),
+    MASK: (60, 110, 200),
+}
+
+# Compressed PNG data is flushed in IDAT chunks of about this size
+PNG_CHUNK_BYTES : int = 1 << 20
+
+_PNG_SIGNATURE : bytes = b"\x89PNG\r\n\x1a\n"
+_PNG_FILTER_NONE : bytes = b"\x00"
+_PNG_FILTER_UP : bytes = b"\x02"
+
+# PNGs are palette images indexed by canvas kind, so canvas bytes are
+# the pixels as they are
+_PALETTE_TABLE : bytes = bytes(range(256))
+
+
+def _channel_tables(channels: int, show_mask: bool) -> list[bytes]:
+    """
+    Build one bytes.translate() table per colour channel.
+
+    :param channels: 1 for grey levels, 3 for RGB
+    :type channels: int
+    :param show_mask: Whether the 42 mask gets its own colour
+    :type show_mask: bool
+    :return: Canvas kind -> channel value tables
+    :rtype: list[bytes]
+    """
+
+    colors : dict[int, tuple[int, ...]] = dict(COLORS)
+    if not show_mask:
+        colors[MASK] = colors[WALL]
+
+    if channels == 1:
+        colors = {
+            kind: ((299 * r + 587 * g + 114 * b) // 1000,)
+            for kind, (r, g, b) in colors.items()
+        }
+
+    return ([
+        bytes(
+            colors.get(kind, (0,) * channels)[channel] for kind in range(256)
+        )
+        for channel in range(channels)
+    ])
+
+
+def _image_size(grid: MazeGrid, scale: int) -> tuple[int, int]:
+    return ((2 * grid.width + 1) * scale, (2 * grid.height + 1) * scale)
+
+
+def _pixel_row(
+    row: bytearray,
+    tables: list[bytes],
+    scale: int
+) -> bytearray:
+    """
+    Turn one canvas row into one scanline.
+
+    Every channel is produced with bytes.translate() and spread over
+    the scanline with strided slice assignments, one per channel and
+    horizontal repeat, so there is no per-pixel Python loop.
+
+    :param row: Canvas row
+    :type row: bytearray
+    :param tables: Per-channel colour tables
+    :type tables: list[bytes]
+    :param scale: Pixels per canvas unit
+    :type scale: int
+    :return: Interleaved pixel bytes
+    :rtype: bytearray
+    """
+
+    step : int = len(tables) * scale
+    pixels : bytearray = bytearray(len(row) * step)
+
+    for channel, table in enumerate(tables):
+        values : bytearray = row.translate(table)
+        for repeat in range(scale):
+            pixels[repeat * len(tables) + channel::step] = values
+
+    return (pixels)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data)) + kind + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+def _write_png(
+    file: BinaryIO,
+    grid: MazeGrid,
+    path: list[int] | None,
+    scale: int,
+    show_mask: bool,
+    level: int
+) -> None:
+    width, height = _image_size(grid, scale)
+    red, green, blue = _channel_tables(3, show_mask)
+    palette : bytes = bytes(
+        value
+        for kind in range(max(COLORS) + 1)
+        for value in (red[kind], green[kind], blue[kind])
+    )
+    tables : list[bytes] = [_PALETTE_TABLE]
+
+    file.write(_PNG_SIGNATURE)
+    file.write(_png_chunk(
+        b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)
+    ))
+    file.write(_png_chunk(b"PLTE", palette))
+
+    # Vertical repeats are "Up"-filtered, i.e. all zeros, which costs
+    # almost nothing to compress
+    repeat : bytes = _PNG_FILTER_UP + bytes(width)
+    compressor = zlib.compressobj(level)
+    pending : list[bytes] = []
+    pending_size : int = 0
+
+    for row in canvas_rows(grid, path):
+        scanlines : list[bytes] = [
+            _PNG_FILTER_NONE + _pixel_row(row, tables, scale)
+        ]
+        scanlines.extend([repeat] * (scale - 1))
+
+        for scanline in scanlines:
+            data : bytes = compressor.compress(scanline)
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+
+        if pending_size >= PNG_CHUNK_BYTES:
+            file.write(_png_chunk(b"IDAT", b"".join(pending)))
+            pending, pending_size = [], 0
+
+    pending.append(compressor.flush())
+    file.write(_png_chunk(b"IDAT", b"".join(pending)))
+    file.write(_png_chunk(b"IEND", b""))
+
+
+def _write_pnm(
+    file: BinaryIO,
+    grid: MazeGrid,
+    path: list[int] | None,
+    scale: int,
+    show_mask: bool,
+    channels: int
+) -> None:
+    width, height = _image_size(grid, scale)
+    tables : list[bytes] = _channel_tables(channels, show_mask)
+
+    magic : bytes = b"P5" if channels == 1 else b"P6"
+    file.write(magic + f"\n{width} {height}\n255\n".encode("ascii"))
+
+    for row in canvas_rows(grid, path):
+        pixels : bytearray = _pixel_row(row, tables, scale)
+        for _ in range(scale):
+            file.write(pixels)
+
+
+def export_image(
+    output_file: str,
+    grid: MazeGrid,
+    path: list[int] | None = None,
+    scale: int = 2,
+    show_mask: bool = True,
+    image_format: str | None = None,
+    level: int = 1
+) -> int:
+    """
+    Export a maze as a PGM, PPM or PNG image.
+
+    The maze is drawn on the same lattice as the text renderer: every
+    cell, wall and corner is a scale x scale block of pixels. Walls are
+    black, passages white, the path red and the 42 mask blue (grey
+    levels in PGM). Scanlines are produced one canvas row at a time and
+    PNG data (an 8-bit palette image) is compressed as it streams, so
+    memory does not grow with the maze height. Maze images are very
+    regular, so the fastest zlib level already compresses them well.
+
+    :param output_file: Destination image file
+    :type output_file: str
+    :param grid: The grid to draw
+    :type grid: MazeGrid
+    :param path: Optional cell indices to overlay, in path order
+    :type path: list[int] | None
+    :param scale: Pixels per cell (and per wall)
+    :type scale: int
+    :param show_mask: Whether the 42 mask gets its own colour
+    :type show_mask: bool
+    :param image_format: One of IMAGE_FORMATS, defaults to the file
+        extension
+    :type image_format: str | None
+    :param level: zlib compression level for PNG, 0 to 9
+    :type level: int
+    :return: Number of bytes written
+    :rtype: int
+    :raises ValueError: If the format or the scale is not supported
+    """
+
+    if image_format is None:
+        image_format = os.path.splitext(output_file)[1].lstrip(".").lower()
+
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+
+    if scale < 1:
+        raise ValueError(f"Image scale must be positive: {scale}")
+
+    with open(output_file, "wb") as file:
+        if image_format == "png":
+            _write_png(file, grid, path, scale, show_mask, level)
+        else:
+            _write_pnm(
+                file, grid, path, scale, show_mask,
+                1 if image_format == "pgm" else 3
+            )
+        return (file.tell())
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import sys
+
+from typing import Iterator
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+from srcs.maze_io import RENDER_MODES
+
+# The canvas has one byte per glyph: a (2h + 1) x (2w + 1) lattice where
+# cell (x, y) sits at (2x + 1, 2y + 1), walls and passages between them
+# and wall corners on even/even positions. Every row ends with NEWLINE.
+OPEN : int = 0
+WALL : int = 1
+PATH : int = 2
+MASK : int = 3
+NEWLINE : int = 4
+
+# Box-drawing glyph of a wall by its wall neighbours, bit 0 up, bit 1
+# right, bit 2 down, bit 3 left
+_BOX : str = " ╵╶└╷│┌├╴┘─┴┐┤┬┼"
+
+
+def _closed_table(wall: int) -> bytes:
+    return (bytes(
+        WALL if code & (wall | BLOCKED) else OPEN for code in range(256)
+    ))
+
+
+# bytes.translate() tables turning a row of raw cell bytes into a row
+# of canvas bytes
+_NORTH_TABLE : bytes = _closed_table(NORTH)
+_SOUTH_TABLE : bytes = _closed_table(SOUTH)
+_WEST_TABLE : bytes = _closed_table(WEST)
+_EAST_TABLE : bytes = _closed_table(EAST)
+_INTERIOR_TABLE : bytes = bytes(
+    MASK if code & BLOCKED else OPEN for code in range(256)
+)
+_IS_WALL_TABLE : bytes = bytes(
+    1 if code == WALL else 0 for code in range(256)
+)
+
+
+def canvas_rows(
+    grid: MazeGrid,
+    path: list[int] | None = None
+) -> Iterator[bytearray]:
+    """
+    Yield the glyph canvas of a grid one canvas row at a time.
+
+    Each cell row is laid out with a handful of strided slice
+    assignments fed by bytes.translate() over the raw cell bytes, so
+    the work per row runs in C and only two canvas rows exist at any
+    time. The path, if any, is drawn over the cells it visits and the
+    passages between them.
+
+    :param grid: The grid to draw
+    :type grid: MazeGrid
+    :param path: Optional cell indices to overlay, in path order
+    :type path: list[int] | None
+    :return: 2h + 1 rows of 2w + 1 OPEN/WALL/PATH/MASK bytes
+    :rtype: Iterator[bytearray]
+    """
+
+    width : int = grid.width
+    cells : bytearray = grid.cells
+    span : int = 2 * width
+    blank : bytes = bytes([WALL]) * (span + 1)
+
+    # Canvas row -> canvas columns covered by the path
+    overlay : dict[int, list[int]] = {}
+    previous : tuple[int, int] | None = None
+    for idx in path or ():
+        y, x = divmod(idx, width)
+        here : tuple[int, int] = (2 * y + 1, 2 * x + 1)
+        overlay.setdefault(here[0], []).append(here[1])
+        if previous is not None:
+            overlay.setdefault((previous[0] + here[0]) >> 1, []).append(
+                (previous[1] + here[1]) >> 1
+            )
+        previous = here
+
+    def painted(index: int, row: bytearray) -> bytearray:
+        for column in overlay.get(index, ()):
+            row[column] = PATH
+        return (row)
+
+    for y in range(grid.height):
+        cell_row : bytearray = cells[y * width:(y + 1) * width]
+
+        top : bytearray = bytearray(blank)
+        top[1:span:2] = cell_row.translate(_NORTH_TABLE)
+        yield (painted(2 * y, top))
+
+        mid : bytearray = bytearray(blank)
+        mid[0:span - 1:2] = cell_row.translate(_WEST_TABLE)
+        mid[1:span:2] = cell_row.translate(_INTERIOR_TABLE)
+        mid[span] = _EAST_TABLE[cell_row[-1]]
+        yield (painted(2 * y + 1, mid))
+
+    bottom : bytearray = bytearray(blank)
+    if grid.height:
+        bottom[1:span:2] = cells[-width:].translate(_SOUTH_TABLE)
+    yield (painted(2 * grid.height, bottom))
+
+
+def build_canvas(
+    grid: MazeGrid,
+    path: list[int] | None = None
+) -> bytearray:
+    """
+    Build the whole glyph canvas of a grid, see canvas_rows().
+
+    :param grid: The grid to draw
+    :type grid: MazeGrid
+    :param path: Optional cell indices to overlay, in path order
+    :type path: list[int] | None
+    :return: OPEN/WALL/PATH/MASK/NEWLINE canvas, 2w + 2 bytes per row
+    :rtype: bytearray
+    """
+
+    newline : bytes = bytes([NEWLINE])
+    return (bytearray(
+        newline.join(canvas_rows(grid, path)) + newline
+    ))
+
+
+def _glyph_lanes(glyphs: list[str]) -> list[bytes]:
+    """
+    Split a code -> glyph table into one translate table per UTF-8 byte.
+
+    Shorter glyphs are padded with NUL bytes, which are stripped once
+    the lanes are interleaved.
+
+    :param glyphs: Glyph of every code, 256 entries
+    :type glyphs: list[str]
+    :return: One bytes.translate() table per output byte
+    :rtype: list[bytes]
+    """
+
+    encoded : list[bytes] = [glyph.encode("utf-8") for glyph in glyphs]
+    lanes : int = max(len(data) for data in encoded)
+
+    return ([
+        bytes(data[lane] if lane < len(data) else 0 for data in encoded)
+        for lane in range(lanes)
+    ])
+
+
+def _emit(codes: bytes | bytearray, lanes: list[bytes]) -> bytes:
+    if len(lanes) == 1:
+        return (bytes(codes.translate(lanes[0])))
+
+    out : bytearray = bytearray(len(codes) * len(lanes))
+    for offset, table in enumerate(lanes):
+        out[offset::len(lanes)] = codes.translate(table)
+
+    return (bytes(out.replace(b"\x00", b"")))
+
+
+def _ascii_lanes(show_mask: bool) -> list[bytes]:
+    glyphs : list[str] = ["?"] * 256
+    glyphs[OPEN] = " "
+    glyphs[WALL] = "#"
+    glyphs[PATH] = "."
+    glyphs[MASK] = "@" if show_mask else "#"
+    glyphs[NEWLINE] = "\n"
+    return (_glyph_lanes(glyphs))
+
+
+def _unicode_lanes(show_mask: bool) -> list[bytes]:
+    # Code is kind << 4 | wall neighbours
+    glyphs : list[str] = ["?"] * 256
+    for neighbours in range(16):
+        glyphs[OPEN << 4 | neighbours] = " "
+        glyphs[WALL << 4 | neighbours] = _BOX[neighbours]
+        glyphs[PATH << 4 | neighbours] = "•"
+        glyphs[MASK << 4 | neighbours] = "▓" if show_mask else " "
+        glyphs[NEWLINE << 4 | neighbours] = "\n"
+    return (_glyph_lanes(glyphs))
+
+
+def _halfblock_lanes(show_mask: bool) -> list[bytes]:
+    # Code is top kind | bottom kind << 3; walls win over the path and
+    # the mask is drawn as walls unless shown
+    glyphs : list[str] = ["?"] * 256
+    kinds : tuple[int, ...] = (OPEN, WALL, PATH, MASK)
+
+    for top in kinds:
+        for bottom in kinds:
+            upper : int = WALL if top == MASK and not show_mask else top
+            lower : int = WALL if bottom == MASK and not show_mask else bottom
+
+            if MASK in (upper, lower):
+                glyph : str = "▓"
+            elif upper == WALL and lower == WALL:
+                glyph = "█"
+            elif upper == WALL:
+                glyph = "▀"
+            elif lower == WALL:
+                glyph = "▄"
+            elif PATH in (upper, lower):
+                glyph = "░"
+            else:
+                glyph = " "
+            glyphs[top | bottom << 3] = glyph
+
+    for other in range(NEWLINE + 1):
+        glyphs[NEWLINE | other << 3] = "\n"
+    return (_glyph_lanes(glyphs))
+
+
+def _unicode_codes(canvas: bytearray, stride: int) -> bytes:
+    """
+    Tag every canvas byte with its 4-bit wall neighbour mask.
+
+    The canvas is reduced to a 0/1 wall lane and the four shifted
+    copies are combined as big integers (one byte per glyph), the same
+    byte-lane trick closed_inner_walls() uses.
+
+    :param canvas: Glyph canvas
+    :type canvas: bytearray
+    :param stride: Bytes per canvas row
+    :type stride: int
+    :return: kind << 4 | up | right << 1 | down << 2 | left << 3 for
+        every byte
+    :rtype: bytes
+    """
+
+    size : int = len(canvas)
+    walls : int = int.from_bytes(canvas.translate(_IS_WALL_TABLE), "little")
+    row_shift : int = 8 * stride
+
+    codes : int = (
+        int.from_bytes(canvas, "little") << 4
+        | walls << row_shift
+        | (walls >> 8) << 1
+        | (walls >> row_shift) << 2
+        | walls << 11
+    )
+
+    # The up and left copies spill past the last byte; cut them off
+    return (codes.to_bytes(size + stride + 1, "little")[:size])
+
+
+def render_maze(
+    grid: MazeGrid,
+    path: list[int] | None = None,
+    mode: str = "ascii",
+    show_mask: bool = False
+) -> bytes:
+    """
+    Render a grid as UTF-8 text.
+
+    "ascii" draws walls as '#', "unicode" with box-drawing lines and
+    "halfblock" packs two canvas rows into each text row with block
+    elements. The canvas is turned into text with one bytes.translate()
+    per output byte, so rendering stays linear and C-bound.
+
+    :param grid: The grid to render
+    :type grid: MazeGrid
+    :param path: Optional cell indices to overlay, in path order
+    :type path: list[int] | None
+    :param mode: One of RENDER_MODES
+    :type mode: str
+    :param show_mask: Whether to draw the 42 mask differently from walls
+    :type show_mask: bool
+    :return: The rendered maze, newline-terminated rows
+    :rtype: bytes
+    :raises ValueError: If the mode is not supported
+    """
+
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unsupported render mode: {mode}")
+
+    canvas : bytearray = build_canvas(grid, path)
+    stride : int = 2 * grid.width + 2
+
+    if mode == "ascii":
+        return (_emit(canvas, _ascii_lanes(show_mask)))
+
+    if mode == "unicode":
+        return (_emit(
+            _unicode_codes(canvas, stride), _unicode_lanes(show_mask)
+        ))
+
+    kinds : int = int.from_bytes(canvas, "little")
+    pairs : bytes = (kinds | (kinds >> 8 * stride) << 3).to_bytes(
+        len(canvas), "little"
+    )
+    return (_emit(
+        b"".join(
+            pairs[top:top + stride]
+            for top in range(0, len(pairs), 2 * stride)
+        ),
+        _halfblock_lanes(show_mask)
+    ))
+
+
+def write_rendered(data: bytes, output_file: str | None = None) -> int:
+    """
+    Write a rendered maze with a single write() call.
+
+    :param data: Output of render_maze()
+    :type data: bytes
+    :param output_file: Destination file, standard output if None
+    :type output_file: str | None
+    :return: Number of bytes written
+    :rtype: int
+    """
+
+    if output_file is not None:
+        with open(output_file, "wb") as file:
+            return (file.write(data))
+
+    sys.stdout.flush()
+    written : int = sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+    return (written)
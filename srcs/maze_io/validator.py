@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import re
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable
+
+from srcs.maze_config.maze import Point
+from srcs.maze_generator.mask import (
+    PATTERN_HEIGHT, PATTERN_WIDTH, mask_42_cells
+)
+from srcs.maze_generator.maze_grid import (
+    ALL_WALLS, BLOCKED, EAST, NORTH, SOUTH, WALL_MASK, WEST, MazeGrid
+)
+from srcs.maze_io.binary_format import open_maze
+from srcs.maze_solver.astar import UNREACHED
+from srcs.maze_solver.distance import distance_field
+
+# Offending cells listed per failed check
+MAX_REPORTED : int = 5
+
+_ONE : re.Pattern[bytes] = re.compile(b"\x01")
+
+_STEPS : dict[str, tuple[int, int, int]] = {
+    "N": (NORTH, 0, -1),
+    "E": (EAST, 1, 0),
+    "S": (SOUTH, 0, 1),
+    "W": (WEST, -1, 0),
+}
+
+
+def _lane_table(wall: int, closed: bool) -> bytes:
+    return (bytes(
+        1 if bool(code & wall) == closed else 0 for code in range(256)
+    ))
+
+
+# bytes.translate() tables reducing a cell byte to a 0/1 lane
+_CLOSED : dict[int, bytes] = {
+    wall: _lane_table(wall, True) for wall in (NORTH, EAST, SOUTH, WEST)
+}
+_OPEN : dict[int, bytes] = {
+    wall: _lane_table(wall, False) for wall in (NORTH, EAST, SOUTH, WEST)
+}
+_BLOCKED_TABLE : bytes = bytes(
+    1 if code & BLOCKED else 0 for code in range(256)
+)
+
+
+@dataclass
+class ValidationReport:
+    checks: dict[str, bool] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return (not self.errors)
+
+    def record(self, check: str, problems: list[str]) -> None:
+        self.checks[check] = not problems
+        self.errors.extend(f"{check}: {problem}" for problem in problems)
+
+
+def _lane(cells: bytes | bytearray, table: bytes) -> int:
+    return (int.from_bytes(cells.translate(table), "little"))
+
+
+def _cells_in(lane: int, size: int, grid: MazeGrid) -> list[tuple[int, int]]:
+    """
+    Coordinates of the first MAX_REPORTED set bytes of a lane.
+
+    :param lane: 0/1 byte lane as a big integer
+    :type lane: int
+    :param size: Number of bytes of the lane to look at
+    :type size: int
+    :param grid: Grid the lane was built from
+    :type grid: MazeGrid
+    :return: (x, y) of the offending cells
+    :rtype: list[tuple[int, int]]
+    """
+
+    found : list[tuple[int, int]] = []
+    data : bytes = (lane & ((1 << 8 * size) - 1)).to_bytes(size, "little")
+
+    for match in _ONE.finditer(data):
+        found.append(grid.coords(match.start()))
+        if len(found) == MAX_REPORTED:
+            break
+
+    return (found)
+
+
+def _column_mask(grid: MazeGrid, columns: int) -> int:
+    """
+    Lane with a 1 in the first `columns` cells of every row.
+
+    :param grid: Grid the lane is for
+    :type grid: MazeGrid
+    :param columns: Number of leading columns to set
+    :type columns: int
+    :return: Byte lane as a big integer
+    :rtype: int
+    """
+
+    row : bytes = b"\x01" * columns + b"\x00" * (grid.width - columns)
+    return (int.from_bytes(row * grid.height, "little"))
+
+
+def check_shared_walls(grid: MazeGrid) -> list[str]:
+    """
+    Neighbouring cells must agree on the wall between them.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    size : int = len(cells)
+
+    horizontal : int = (
+        (_lane(cells, _CLOSED[EAST]) ^ (_lane(cells, _CLOSED[WEST]) >> 8))
+        & _column_mask(grid, width - 1)
+    )
+    vertical : int = (
+        _lane(cells, _CLOSED[SOUTH])
+        ^ (_lane(cells, _CLOSED[NORTH]) >> 8 * width)
+    )
+
+    return (
+        [f"east/west wall mismatch at {cell}"
+         for cell in _cells_in(horizontal, size, grid)]
+        + [f"south/north wall mismatch at {cell}"
+           for cell in _cells_in(vertical, size - width, grid)]
+    )
+
+
+def check_border(grid: MazeGrid) -> list[str]:
+    """
+    Every wall on the outer border must be closed.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    last_x : int = width - 1
+    last_y : int = grid.height - 1
+    problems : list[str] = []
+
+    # (side, wall, border cells, offset along the side -> (x, y))
+    sides : tuple[tuple[
+        str, int, bytearray, Callable[[int], tuple[int, int]]
+    ], ...] = (
+        ("north", NORTH, cells[:width], lambda i: (i, 0)),
+        ("south", SOUTH, cells[-width:], lambda i: (i, last_y)),
+        ("west", WEST, cells[::width], lambda i: (0, i)),
+        ("east", EAST, cells[last_x::width], lambda i: (last_x, i)),
+    )
+
+    for name, wall, line, position in sides:
+        opened : int = line.translate(_OPEN[wall]).find(1)
+        if opened >= 0:
+            problems.append(f"open {name} border wall at {position(opened)}")
+
+    return (problems)
+
+
+def check_mask(grid: MazeGrid) -> list[str]:
+    """
+    Cells of the 42 pattern must be fully walled.
+
+    Skipped when the maze is too small to hold the pattern.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    if grid.width < PATTERN_WIDTH or grid.height < PATTERN_HEIGHT:
+        return ([])
+
+    return ([
+        f"42 pattern cell {(x, y)} is not fully walled"
+        for x, y in mask_42_cells(grid.width, grid.height)
+        if grid.cells[grid.index(x, y)] & WALL_MASK != ALL_WALLS
+    ][:MAX_REPORTED])
+
+
+def check_open_areas(grid: MazeGrid) -> list[str]:
+    """
+    No 3x3 block of cells may be free of inner walls.
+
+    The east-open and south-open lanes are ANDed with shifted copies of
+    themselves (two cells across, three cells down and the other way
+    round), which leaves a 1 at the top-left cell of every open 3x3.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    row : int = 8 * width
+
+    if width < 3 or grid.height < 3:
+        return ([])
+
+    east : int = _lane(cells, _OPEN[EAST])
+    east &= east >> 8
+    east &= (east >> row) & (east >> 2 * row)
+
+    south : int = _lane(cells, _OPEN[SOUTH])
+    south &= south >> row
+    south &= (south >> 8) & (south >> 16)
+
+    corners : int = east & south & _column_mask(grid, width - 2)
+
+    return ([
+        f"open 3x3 area at {cell}"
+        for cell in _cells_in(corners, (grid.height - 2) * width, grid)
+    ])
+
+
+def check_reachable(
+    grid: MazeGrid,
+    dist: array[int]
+) -> list[str]:
+    """
+    Every non-blocked cell must be reachable from the entry.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :param dist: distance_field() of the grid from the entry
+    :type dist: array[int]
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    blocked : int = grid.cells.translate(_BLOCKED_TABLE).count(1)
+    unreachable : int = dist.count(UNREACHED) - blocked
+
+    if not unreachable:
+        return ([])
+
+    cells : list[tuple[int, int]] = []
+    for idx, distance in enumerate(dist):
+        if distance == UNREACHED and not grid.cells[idx] & BLOCKED:
+            cells.append(grid.coords(idx))
+            if len(cells) == MAX_REPORTED:
+                break
+
+    return ([f"{unreachable} unreachable cell(s), e.g. {cells}"])
+
+
+def check_path(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    directions: str,
+    dist: array[int]
+) -> list[str]:
+    """
+    The path must lead from entry to exit through open walls only, and
+    be a shortest one.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :param entry: Entry cell
+    :type entry: Point
+    :param exit: Exit cell
+    :type exit: Point
+    :param directions: Path as N/E/S/W letters
+    :type directions: str
+    :param dist: distance_field() of the grid from the entry
+    :type dist: array[int]
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    cells : bytearray = grid.cells
+    x, y = entry.x, entry.y
+
+    for step, letter in enumerate(directions):
+        if letter not in _STEPS:
+            return ([f"invalid direction {letter!r} at step {step}"])
+
+        wall, dx, dy = _STEPS[letter]
+        if cells[grid.index(x, y)] & wall:
+            return ([f"step {step} ({letter}) from {(x, y)} crosses a wall"])
+
+        x, y = x + dx, y + dy
+        if not (0 <= x < grid.width and 0 <= y < grid.height):
+            return ([f"step {step} ({letter}) leaves the maze"])
+
+    if (x, y) != (exit.x, exit.y):
+        return ([f"path ends at {(x, y)} instead of the exit"])
+
+    shortest : int = dist[grid.index(exit.x, exit.y)]
+    if len(directions) != shortest:
+        return ([
+            f"path has {len(directions)} steps, the shortest has {shortest}"
+        ])
+
+    return ([])
+
+
+def check_perfect(
+    grid: MazeGrid,
+    dist: array[int],
+    perfect: bool
+) -> list[str]:
+    """
+    A connected maze is perfect when it has one passage less than cells.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :param dist: distance_field() of the grid from the entry
+    :type dist: array[int]
+    :param perfect: Whether the maze should be perfect
+    :type perfect: bool
+    :return: Problems found, empty if none
+    :rtype: list[str]
+    """
+
+    cells : bytearray = grid.cells
+    passages : int = (
+        cells[:-grid.width].translate(_OPEN[SOUTH]).count(1)
+        + cells.translate(_OPEN[EAST]).count(1)
+        - cells[grid.width - 1::grid.width].translate(_OPEN[EAST]).count(1)
+    )
+    is_perfect : bool = passages == len(dist) - dist.count(UNREACHED) - 1
+
+    if is_perfect == perfect:
+        return ([])
+
+    return ([
+        "the maze has loops" if perfect else "the maze has no loops"
+    ])
+
+
+def validate_grid(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    directions: str | None = None,
+    perfect: bool | None = None
+) -> ValidationReport:
+    """
+    Check that a maze is consistent.
+
+    Wall agreement, borders and open areas are checked over whole byte
+    lanes of the grid (bytes.translate() plus big-integer shifts), the
+    reachability and shortest-path checks share one distance_field()
+    pass (skipped when the border is open), and the path is walked once.
+
+    :param grid: Grid to check
+    :type grid: MazeGrid
+    :param entry: Entry cell
+    :type entry: Point
+    :param exit: Exit cell
+    :type exit: Point
+    :param directions: Optional entry -> exit path as N/E/S/W letters;
+        an empty string means no path was recorded (streamed files) and
+        skips the path check, since entry and exit always differ
+    :type directions: str | None
+    :param perfect: If set, also check that the maze is (True) or is
+        not (False) a perfect maze
+    :type perfect: bool | None
+    :return: Result of every check
+    :rtype: ValidationReport
+    """
+
+    report : ValidationReport = ValidationReport()
+
+    report.record("shared_walls", check_shared_walls(grid))
+    report.record("border", check_border(grid))
+    report.record("mask_42", check_mask(grid))
+    report.record("open_areas", check_open_areas(grid))
+
+    problems : list[str] = []
+    for name, point in (("entry", entry), ("exit", exit)):
+        if not (0 <= point.x < grid.width and 0 <= point.y < grid.height):
+            problems.append(f"{name} {point} is outside the maze")
+        elif grid.is_blocked(grid.index(point.x, point.y)):
+            problems.append(f"{name} {point} is a 42 pattern cell")
+    report.record("entry_exit", problems)
+
+    # An open border wall would let the search wrap around rows
+    if problems or not report.checks["border"]:
+        return (report)
+
+    dist : array[int] = distance_field(grid, grid.index(entry.x, entry.y))
+    report.record("reachable", check_reachable(grid, dist))
+
+    if directions:
+        report.record(
+            "path", check_path(grid, entry, exit, directions, dist)
+        )
+
+    if perfect is not None:
+        report.record("perfect", check_perfect(grid, dist, perfect))
+
+    return (report)
+
+
+def validate_file(path: str, perfect: bool | None = None) -> ValidationReport:
+    """
+    Check a maze file written in either output format.
+
+    :param path: Hex or binary maze file
+    :type path: str
+    :param perfect: If set, also check the maze is (not) perfect
+    :type perfect: bool | None
+    :return: Result of every check
+    :rtype: ValidationReport
+    :raises ValueError: If the file is in neither maze format
+    """
+
+    with open_maze(path) as maze:
+        return (validate_grid(
+            maze.grid, maze.entry, maze.exit, maze.directions, perfect
+        ))
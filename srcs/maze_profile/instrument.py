@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Callable, Iterator
+
+# Called with (stage name, elapsed seconds) every time a stage ends
+StageHook = Callable[[str, float], None]
+
+_NO_STAGE : AbstractContextManager[None] = nullcontext()
+
+
+class Instrumentation:
+    """
+    Opt-in per-stage timings and counters.
+
+    Code under measurement wraps each stage in `with probe.stage(name)`
+    and reports work done with `probe.count(name, n)`. Stage times and
+    counters accumulate over the life of the object; hooks registered
+    with add_hook() are called as each stage ends, e.g. to feed a
+    metrics system. Code that is not being measured gets DISABLED,
+    whose methods do nothing.
+    """
+
+    enabled : bool = True
+
+    def __init__(self) -> None:
+        self.stages : dict[str, float] = {}
+        self.counters : dict[str, int] = {}
+        self.hooks : list[StageHook] = []
+
+
+    def add_hook(self, hook: StageHook) -> None:
+        self.hooks.append(hook)
+
+
+    @contextmanager
+    def __timed(self, name: str) -> Iterator[None]:
+        started : float = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed : float = time.perf_counter() - started
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            for hook in self.hooks:
+                hook(name, elapsed)
+
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """
+        Time a block of code as one stage.
+
+        :param name: Stage name, times of equal names add up
+        :type name: str
+        :return: Context manager timing its block
+        :rtype: AbstractContextManager[None]
+        """
+
+        return (self.__timed(name))
+
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Add to a counter.
+
+        :param name: Counter name
+        :type name: str
+        :param value: Amount to add
+        :type value: int
+        :return:
+        :rtype: None
+        """
+
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+    def report(self) -> dict[str, object]:
+        """
+        Return the measurements as a JSON-serialisable dict.
+
+        :return: {"stages": name -> seconds, "counters": name -> value,
+            "total_seconds": sum of the stage times}
+        :rtype: dict[str, object]
+        """
+
+        return ({
+            "stages": dict(self.stages),
+            "counters": dict(self.counters),
+            "total_seconds": sum(self.stages.values()),
+        })
+
+
+class _Disabled(Instrumentation):
+
+    enabled = False
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return (_NO_STAGE)
+
+
+    def count(self, name: str, value: int = 1) -> None:
+        return
+
+
+# Shared do-nothing instance, the default wherever instrumentation is
+# optional
+DISABLED : Instrumentation = _Disabled()
+
+
+@contextmanager
+def profiled(dump_file: str | None) -> Iterator[None]:
+    """
+    Run a block under cProfile and dump the stats for pstats.
+
+    With no dump file the block runs unprofiled.
+
+    :param dump_file: Destination of the pstats dump, or None
+    :type dump_file: str | None
+    :return: Context manager profiling its block
+    :rtype: Iterator[None]
+    """
+
+    if dump_file is None:
+        yield
+        return
+
+    # Only profiled runs pay for loading the profiler
+    import cProfile
+
+    profiler : cProfile.Profile = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(dump_file)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import math
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of a list of samples.
+
+    :param samples: Measured values, at least one
+    :type samples: list[float]
+    :param fraction: Percentile as a fraction, e.g. 0.95
+    :type fraction: float
+    :return: The smallest sample with at least that share of samples
+        below or equal to it
+    :rtype: float
+    """
+
+    ordered : list[float] = sorted(samples)
+    rank : int = max(1, math.ceil(fraction * len(ordered)))
+    return (ordered[rank - 1])
@@ -0,0 +1,3 @@
+# Mazes kept ready per config by default
+
+DEFAULT_CAPACITY : int = 16
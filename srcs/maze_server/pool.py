@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+from srcs.maze_batch.batch import task_seed
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_io.hex_format import encode_hex_maze
+from srcs.maze_profile.stats import percentile
+from srcs.maze_server import DEFAULT_CAPACITY
+
+# Latency percentiles and the refill rate are measured over this many
+# of the most recent requests and refills
+METRICS_WINDOW : int = 1024
+
+# A refill task waits BACKOFF_SECONDS after a failed generation, twice
+# as long after each further failure in a row, and the pool gives up
+# (take() raises) after FAILURE_LIMIT failures in a row
+BACKOFF_SECONDS : float = 0.1
+FAILURE_LIMIT : int = 5
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    name: str
+    depth: int
+    capacity: int
+    in_flight: int
+    served: int
+    misses: int
+    refilled: int
+    failures: int
+    refill_rate: float
+    mean_refill_seconds: float
+    p50_ms: float
+    p99_ms: float
+    error: str | None
+
+
+def generate_payload(task: tuple[dict[str, str], int]) -> bytes:
+    """
+    Worker entry point: generate and solve one maze in memory.
+
+    :param task: Config dict and seed
+    :type task: tuple[dict[str, str], int]
+    :return: The maze in the hexadecimal output format
+    :rtype: bytes
+    """
+
+    config, seed = task
+    maze : Maze = Maze(config)
+    pipeline : MazePipeline = MazePipeline(maze, seed)
+
+    return (encode_hex_maze(
+        pipeline.grid, maze.entry, maze.exit, pipeline.directions()
+    ))
+
+
+class MazePool:
+    """
+    Warm pool of pre-generated mazes for one config.
+
+    Mazes are generated in an executor (normally a process pool shared
+    by every pool of a server) and kept encoded in the hex output
+    format, so taking one is a queue pop. A slot semaphore bounds queued
+    plus in-flight mazes by the capacity: each taken maze frees a slot,
+    and one of the refill tasks immediately starts its replacement.
+
+    Maze i of the pool is seeded with task_seed(seed, i), like the
+    tasks of a batch, so a fresh server replays the same sequence.
+
+    Failed generations are retried with exponential backoff; after
+    FAILURE_LIMIT failures in a row the pool is marked failed, its
+    refill tasks stop, and take() raises once the ready mazes are gone
+    instead of waiting forever.
+    """
+
+    name : str
+    config : dict[str, str]
+    capacity : int
+    seed : int
+
+    def __init__(
+        self,
+        name: str,
+        config: dict[str, str],
+        capacity: int = DEFAULT_CAPACITY,
+        seed: int = 0
+    ) -> None:
+        """
+        Prepare the pool; nothing is generated before start().
+
+        :param name: Name clients use to ask for this config
+        :type name: str
+        :param config: Parsed configuration, as returned by load_config()
+        :type config: dict[str, str]
+        :param capacity: Mazes kept ready or being generated
+        :type capacity: int
+        :param seed: Seed of the whole pool
+        :type seed: int
+        :raises ValueError: If the config is invalid or the capacity is
+            not positive
+        """
+
+        if capacity <= 0:
+            raise ValueError(f"Pool capacity must be positive: {capacity}")
+
+        # Fail on a bad config now, not in a worker
+        Maze(config)
+
+        self.name = name
+        self.config = config
+        self.capacity = capacity
+        self.seed = seed
+
+        self.__ready : asyncio.Queue[bytes] = asyncio.Queue()
+        self.__slots : asyncio.Semaphore = asyncio.Semaphore(capacity)
+        self.__tasks : list[asyncio.Task[None]] = []
+        self.__next_index : int = 0
+        self.__in_flight : int = 0
+        self.__served : int = 0
+        self.__misses : int = 0
+        self.__failures : int = 0
+        self.__failures_in_row : int = 0
+        self.__error : str | None = None
+        self.__failed : asyncio.Event = asyncio.Event()
+        self.__refill_seconds : float = 0.0
+        self.__refilled_at : deque[float] = deque(maxlen=METRICS_WINDOW)
+        self.__refilled : int = 0
+        self.__latencies : deque[float] = deque(maxlen=METRICS_WINDOW)
+
+    def start(self, executor: Executor, workers: int) -> None:
+        """
+        Start the background refill tasks.
+
+        :param executor: Executor the mazes are generated in
+        :type executor: Executor
+        :param workers: Generations run concurrently for this pool
+        :type workers: int
+        :return:
+        :rtype: None
+        """
+
+        for _ in range(max(1, min(workers, self.capacity))):
+            self.__tasks.append(
+                asyncio.create_task(self.__refill(executor))
+            )
+
+    async def stop(self) -> None:
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks.clear()
+
+    async def take(self) -> bytes:
+        """
+        Take one ready maze, waiting for a refill if the pool is empty.
+
+        :return: The maze in the hexadecimal output format
+        :rtype: bytes
+        :raises RuntimeError: If the pool failed and has no maze left
+        """
+
+        started : float = time.perf_counter()
+
+        if self.__ready.empty():
+            self.__misses += 1
+
+        payload : bytes = await self.__next_payload()
+        self.__slots.release()
+
+        self.__served += 1
+        self.__latencies.append(time.perf_counter() - started)
+        return (payload)
+
+    def stats(self) -> PoolStats:
+        """
+        Snapshot of the queue depth, refill rate and request latency.
+
+        :return: Current pool metrics
+        :rtype: PoolStats
+        """
+
+        refills : deque[float] = self.__refilled_at
+        span : float = refills[-1] - refills[0] if len(refills) > 1 else 0.0
+        latencies : list[float] = list(self.__latencies)
+
+        return (PoolStats(
+            name=self.name,
+            depth=self.__ready.qsize(),
+            capacity=self.capacity,
+            in_flight=self.__in_flight,
+            served=self.__served,
+            misses=self.__misses,
+            refilled=self.__refilled,
+            failures=self.__failures,
+            refill_rate=(len(refills) - 1) / span if span > 0 else 0.0,
+            mean_refill_seconds=(
+                self.__refill_seconds / self.__refilled
+                if self.__refilled else 0.0
+            ),
+            p50_ms=percentile(latencies, 0.5) * 1e3 if latencies else 0.0,
+            p99_ms=percentile(latencies, 0.99) * 1e3 if latencies else 0.0,
+            error=self.__error,
+        ))
+
+    async def __next_payload(self) -> bytes:
+        """
+        Pop a ready maze, waiting for one unless the pool has failed.
+
+        :return: The maze in the hexadecimal output format
+        :rtype: bytes
+        :raises RuntimeError: If the pool failed and has no maze left
+        """
+
+        if not self.__ready.empty():
+            return (self.__ready.get_nowait())
+
+        if self.__error is not None:
+            raise RuntimeError(self.__error)
+
+        getter : asyncio.Task[bytes] = asyncio.create_task(
+            self.__ready.get()
+        )
+        failed : asyncio.Task[bool] = asyncio.create_task(
+            self.__failed.wait()
+        )
+
+        try:
+            await asyncio.wait(
+                (getter, failed), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            failed.cancel()
+            if not getter.done():
+                getter.cancel()
+
+        if getter.done() and not getter.cancelled():
+            return (getter.result())
+
+        raise RuntimeError(self.__error)
+
+    async def __refill(self, executor: Executor) -> None:
+        """
+        Refill task: generate a maze whenever a slot is free.
+
+        A failed generation is counted and its slot handed back, so one
+        bad run does not shrink the pool; the task then backs off, and
+        marks the whole pool failed after FAILURE_LIMIT failures in a
+        row.
+
+        :param executor: Executor the mazes are generated in
+        :type executor: Executor
+        :return:
+        :rtype: None
+        """
+
+        loop : asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while self.__error is None:
+            if self.__failures_in_row:
+                await asyncio.sleep(
+                    BACKOFF_SECONDS * 2 ** (self.__failures_in_row - 1)
+                )
+
+            await self.__slots.acquire()
+
+            if self.__error is not None:
+                self.__slots.release()
+                return
+
+            seed : int = task_seed(self.seed, self.__next_index)
+            self.__next_index += 1
+            self.__in_flight += 1
+            started : float = time.perf_counter()
+
+            try:
+                payload : bytes = await loop.run_in_executor(
+                    executor, generate_payload, (self.config, seed)
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.__failures += 1
+                self.__failures_in_row += 1
+                self.__slots.release()
+
+                if self.__failures_in_row >= FAILURE_LIMIT:
+                    self.__error = (
+                        f"Pool {self.name} failed {FAILURE_LIMIT} "
+                        f"generations in a row: {e}"
+                    )
+                    self.__failed.set()
+                continue
+            finally:
+                self.__in_flight -= 1
+
+            self.__failures_in_row = 0
+            now : float = time.perf_counter()
+            self.__refill_seconds += now - started
+            self.__refilled += 1
+            self.__refilled_at.append(now)
+            self.__ready.put_nowait(payload)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Any, Callable
+
+from srcs.maze_config.parse_config import load_config
+from srcs.maze_server import DEFAULT_CAPACITY
+from srcs.maze_server.pool import MazePool
+
+UNIX_PREFIX : str = "unix:"
+DEFAULT_HOST : str = "127.0.0.1"
+
+# Longest accepted request line
+MAX_REQUEST_BYTES : int = 1 << 16
+
+
+def parse_address(address: str) -> tuple[str | None, int, str | None]:
+    """
+    Split a listen address into (host, port, unix socket path).
+
+    Accepted forms are "unix:PATH", "HOST:PORT" and "PORT" (on
+    DEFAULT_HOST).
+
+    :param address: Listen address
+    :type address: str
+    :return: Host and port for TCP, or the socket path for Unix sockets
+    :rtype: tuple[str | None, int, str | None]
+    :raises ValueError: If the port is not a number
+    """
+
+    if address.startswith(UNIX_PREFIX):
+        return (None, 0, address[len(UNIX_PREFIX):])
+
+    host, sep, port = address.rpartition(":")
+
+    try:
+        return (host if sep else DEFAULT_HOST, int(port), None)
+    except ValueError:
+        raise ValueError(f"Invalid listen address: {address}")
+
+
+def config_name(path: str) -> str:
+    """
+    Name clients use for a config file: "configs/big.txt" -> "big".
+
+    :param path: Path of the configuration file
+    :type path: str
+    :return: The file name without its extension
+    :rtype: str
+    """
+
+    return (os.path.splitext(os.path.basename(path))[0])
+
+
+class MazeServer:
+    """
+    Long-running server handing out mazes from warm in-memory pools.
+
+    One MazePool per config, all refilled by a shared process pool, so
+    a request costs a queue pop and a write instead of a process start,
+    imports, config parsing and a full generation.
+
+    The protocol is JSON lines: every request is one JSON object on one
+    line, answered by one JSON object on one line.
+
+        {"op": "maze", "config": "default"}
+            -> {"ok": true, "config": "default", "maze": "<hex format>"}
+        {"op": "metrics"}
+            -> {"ok": true, "uptime": 12.5, "pools": [{...}, ...]}
+        {"op": "configs"}
+            -> {"ok": true, "configs": ["default", ...]}
+
+    "config" may be left out when the server has a single config.
+    Failures are answered with {"ok": false, "error": "..."}.
+    """
+
+    pools : dict[str, MazePool]
+    jobs : int
+
+    def __init__(
+        self,
+        config_files: list[str],
+        capacity: int = DEFAULT_CAPACITY,
+        jobs: int | None = None,
+        seed: int = 0
+    ) -> None:
+        """
+        Load every config and prepare its pool.
+
+        :param config_files: Configuration files to serve
+        :type config_files: list[str]
+        :param capacity: Mazes kept ready per config
+        :type capacity: int
+        :param jobs: Worker processes, defaults to the number of CPUs
+        :type jobs: int | None
+        :param seed: Base seed of every pool
+        :type seed: int
+        :raises ValueError: If a config is invalid or two configs share
+            a name
+        """
+
+        self.pools = {}
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+
+        for path in config_files:
+            name : str = config_name(path)
+            if name in self.pools:
+                raise ValueError(f"Duplicate config name: {name}")
+            self.pools[name] = MazePool(
+                name, load_config(path), capacity, seed
+            )
+
+        self.__started : float = time.perf_counter()
+        self.__handlers : dict[str, Callable[[dict[str, Any]], Any]] = {
+            "maze": self.__maze,
+            "metrics": self.__metrics,
+            "configs": self.__configs,
+        }
+
+    async def serve(
+        self,
+        address: str,
+        ready: Callable[[str], None] | None = None
+    ) -> None:
+        """
+        Fill the pools and answer requests until cancelled.
+
+        :param address: Listen address, see parse_address()
+        :type address: str
+        :param ready: Called with the address once the server listens
+        :type ready: Callable[[str], None] | None
+        :return:
+        :rtype: None
+        """
+
+        host, port, unix_path = parse_address(address)
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            for pool in self.pools.values():
+                pool.start(executor, self.jobs)
+
+            server : asyncio.AbstractServer = await (
+                asyncio.start_unix_server(
+                    self.__handle, unix_path, limit=MAX_REQUEST_BYTES
+                )
+                if unix_path is not None
+                else asyncio.start_server(
+                    self.__handle, host, port, limit=MAX_REQUEST_BYTES
+                )
+            )
+
+            try:
+                if ready is not None:
+                    ready(address)
+                async with server:
+                    await server.serve_forever()
+            finally:
+                for pool in self.pools.values():
+                    await pool.stop()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the requests of one connection, one line at a time.
+
+        :param reader: Incoming request lines
+        :type reader: asyncio.StreamReader
+        :param writer: Outgoing response lines
+        :type writer: asyncio.StreamWriter
+        :return:
+        :rtype: None
+        """
+
+        try:
+            while line := await reader.readline():
+                response : dict[str, Any] = await self.__dispatch(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # Client went away, or sent a line longer than the limit
+            pass
+        finally:
+            writer.close()
+
+    async def __dispatch(self, line: bytes) -> dict[str, Any]:
+        try:
+            request : Any = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+
+            op : Any = request.get("op", "maze")
+            if not isinstance(op, str) or op not in self.__handlers:
+                raise ValueError(f"Unsupported op: {op}")
+
+            result : Any = self.__handlers[op](request)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return ({"ok": True, **result})
+        except (ValueError, RuntimeError) as e:
+            return ({"ok": False, "error": str(e)})
+
+    async def __maze(self, request: dict[str, Any]) -> dict[str, Any]:
+        name : Any = request.get("config")
+
+        if name is None and len(self.pools) == 1:
+            name = next(iter(self.pools))
+
+        if not isinstance(name, str) or name not in self.pools:
+            raise ValueError(f"Unknown config: {name}")
+
+        payload : bytes = await self.pools[name].take()
+        return ({"config": name, "maze": payload.decode("ascii")})
+
+    def __metrics(self, request: dict[str, Any]) -> dict[str, Any]:
+        return ({
+            "uptime": time.perf_counter() - self.__started,
+            "pools": [asdict(pool.stats()) for pool in self.pools.values()],
+        })
+
+    def __configs(self, request: dict[str, Any]) -> dict[str, Any]:
+        return ({"configs": list(self.pools)})
+
+
+def run_server(
+    config_files: list[str],
+    address: str,
+    capacity: int = DEFAULT_CAPACITY,
+    jobs: int | None = None,
+    seed: int = 0,
+    ready: Callable[[str], None] | None = None
+) -> None:
+    """
+    Run a MazeServer until interrupted.
+
+    :param config_files: Configuration files to serve
+    :type config_files: list[str]
+    :param address: Listen address, see parse_address()
+    :type address: str
+    :param capacity: Mazes kept ready per config
+    :type capacity: int
+    :param jobs: Worker processes, defaults to the number of CPUs
+    :type jobs: int | None
+    :param seed: Base seed of every pool
+    :type seed: int
+    :param ready: Called with the address once the server listens
+    :type ready: Callable[[str], None] | None
+    :return:
+    :rtype: None
+    :raises ValueError: If a config or the address is invalid
+    """
+
+    server : MazeServer = MazeServer(config_files, capacity, jobs, seed)
+
+    try:
+        asyncio.run(server.serve(address, ready))
+    except KeyboardInterrupt:
+        pass
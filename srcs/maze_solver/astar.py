@@ -1,136 +1,231 @@
-from typing import Set
-from srcs.maze_generator.cell import Cell
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
 
 import heapq
 
+if TYPE_CHECKING:
+    # Annotations only: solving never needs concurrent.futures loaded
+    from concurrent.futures import Executor, Future
+
+UNREACHED : int = -1
+NO_PARENT : int = -1
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    path: list[int]
+    expanded: int
+    pushes: int = 0
+    pops: int = 0
+
+
 def solve_astar(
-    grid: list[list[Cell]],
-    start: Cell,
-    goal: Cell
-) -> list[Cell]:
-    
+    grid: MazeGrid,
+    start: int,
+    goal: int
+) -> list[int]:
+
     """
     Solve the maze using the A* algorithm.
-    
-    :param grid: The grid of cells representing the maze
-    :type grid: list[list[Cell]]
-    :param start: The starting cell
-    :type start: Cell
-    :param goal: The goal cell
-    :type goal: Cell
-    :return: The path from start to goal as a list of cells
-    :rtype: list[Cell]
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :return: The path from start to goal as a list of cell indices
+    :rtype: list[int]
     """
 
-    open_heap: list[tuple[int, Cell]] = []
-    already_check_set: Set[Cell] = set()
+    return (search_astar(grid, start, goal).path)
+
 
-    start.g = 0
-    start.h = heuristic(start, goal)
-    start.f = start.g + start.h
-    start.parent = None
+def search_astar(
+    grid: MazeGrid,
+    start: int,
+    goal: int
+) -> SearchResult:
+
+    """
+    Search the maze using the A* algorithm.
+
+    Cells are flat grid indices (y * width + x). The search state (best
+    distance, parent and closed flag per cell) lives in flat arrays
+    allocated for this call only, and the grid is only read, so any
+    number of solves may run on the same grid, one after the other or
+    from several threads at once.
+
+    Heap entries are (f, index) tuples, so ties on f are broken by row
+    then column. Stale heap entries are skipped, so the search stays
+    correct on mazes with loops. Heap traffic is derived at the end
+    (every pop is an expansion, a stale entry or the goal, every push
+    is popped or still queued), keeping counters out of the hot loop.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :return: The path (empty if the goal is unreachable), the number
+        of expanded cells and the heap pushes and pops
+    :rtype: SearchResult
+    """
 
-    heapq.heappush(open_heap, (start))
+    cells : bytes | bytearray = grid.cells
+    width : int = grid.width
+    goal_y, goal_x = divmod(goal, width)
+
+    dist : array[int] = array("l", [UNREACHED]) * len(cells)
+    parent : array[int] = array("l", [NO_PARENT]) * len(cells)
+    closed : bytearray = bytearray(len(cells))
+    open_heap: list[tuple[int, int]] = []
+
+    steps : tuple[tuple[int, int], ...] = (
+        (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+    )
+
+    expanded : int = 0
+    stale : int = 0
+
+    dist[start] = 0
+    heapq.heappush(open_heap, (heuristic(grid, start, goal), start))
 
     while open_heap:
 
-        current : Cell = heapq.heappop(open_heap)
+        _, current = heapq.heappop(open_heap)
 
         if current == goal:
-            return (reconstruct_path(goal))
+            pops : int = expanded + stale + 1
+            return (SearchResult(
+                reconstruct_path(parent, goal), expanded,
+                pops + len(open_heap), pops
+            ))
 
-        already_check_set.add(current)
+        if closed[current]:
+            stale += 1
+            continue
 
-        for neighbor in neighbors(current, grid):
+        closed[current] = 1
+        expanded += 1
+        code : int = cells[current]
+        tentative_g : int = dist[current] + 1
 
-            if neighbor.blocked:
-                continue
+        for wall, step in steps:
 
-            if neighbor in already_check_set:
+            if code & wall:
                 continue
 
-            tentative_g : int = current.g + 1
+            neighbor : int = current + step
+
+            if closed[neighbor] or cells[neighbor] & BLOCKED:
+                continue
 
-            if tentative_g < neighbor.g:
-                neighbor.parent = current
-                neighbor.g = tentative_g
-                neighbor.h = heuristic(neighbor, goal)
-                neighbor.f = neighbor.g + neighbor.h
+            known : int = dist[neighbor]
 
-                heapq.heappush(open_heap, neighbor)
+            if known == UNREACHED or tentative_g < known:
+                parent[neighbor] = current
+                dist[neighbor] = tentative_g
 
-    return ([])
+                ny, nx = divmod(neighbor, width)
+                heapq.heappush(
+                    open_heap,
+                    (tentative_g + abs(nx - goal_x) + abs(ny - goal_y),
+                     neighbor)
+                )
 
+    return (SearchResult([], expanded, expanded + stale, expanded + stale))
 
 
-def neighbors(cell: Cell, grid: list[list[Cell]]) -> list[Cell]:
-    result: list[Cell] = []
+def solve_many(
+    grid: MazeGrid,
+    queries: Iterable[tuple[int, int]],
+    executor: Executor | None = None
+) -> list[list[int]]:
     """
-    Find all neighbors of a cell in the grid.
-
-    :param cell: The cell to find neighbors for
-    :type cell: Cell
-    :param grid: The grid of cells
-    :type grid: list[list[Cell]]
-    :return: A list of neighboring cells
-    :rtype: list[Cell]
+    Answer many (start, goal) path queries against one grid.
+
+    Since solve_astar() keeps no state on the grid, the queries can be
+    answered serially or handed to an executor (for example a
+    ThreadPoolExecutor) without copying or regenerating the maze.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param queries: (start, goal) cell index pairs
+    :type queries: Iterable[tuple[int, int]]
+    :param executor: Optional executor the solves are submitted to
+    :type executor: Executor | None
+    :return: One path per query, in query order
+    :rtype: list[list[int]]
     """
 
-    x = cell.x
-    y = cell.y
-
-    if not cell.north:
-        result.append(grid[y - 1][x])
-    if not cell.south:
-        result.append(grid[y + 1][x])
-    if not cell.west:
-        result.append(grid[y][x - 1])
-    if not cell.east:
-        result.append(grid[y][x + 1])
+    if executor is None:
+        return ([solve_astar(grid, start, goal) for start, goal in queries])
 
-    return (result)
+    futures : list[Future[list[int]]] = [
+        executor.submit(solve_astar, grid, start, goal)
+        for start, goal in queries
+    ]
+    return ([future.result() for future in futures])
 
 
-def heuristic(a: Cell, b: Cell) -> int:
+def heuristic(grid: MazeGrid, a: int, b: int) -> int:
     """
     Calculate the Manhattan distance between two cells.
 
-    :param a: Base cell
-    :type a: Cell
-    :param b: Target cell
-    :type b: Cell
+    :param grid: The grid both cells belong to
+    :type grid: MazeGrid
+    :param a: Index of the base cell
+    :type a: int
+    :param b: Index of the target cell
+    :type b: int
     :return: Manhattan distance between the two cells
     :rtype: int
     """
 
-    return (abs(a.x - b.x) + abs(a.y - b.y))
+    ay, ax = divmod(a, grid.width)
+    by, bx = divmod(b, grid.width)
 
+    return (abs(ax - bx) + abs(ay - by))
 
-def reconstruct_path(end: Cell) -> list[Cell]:
-    """
-    Reconstruct the path from start to end by following parent pointers.
 
-    :param end: The end cell
-    :type end: Cell
-    :return: The reconstructed path as a list of cells
-    :rtype: list[Cell]
+def reconstruct_path(parent: array[int], end: int) -> list[int]:
     """
-    path: list[Cell] = []
-    cur: Cell | None = end
+    Reconstruct the path from start to end by following parent links.
+
+    :param parent: Parent index of each reached cell, NO_PARENT otherwise
+    :type parent: array[int]
+    :param end: Index of the end cell
+    :type end: int
+    :return: The reconstructed path as a list of cell indices
+    :rtype: list[int]
+    """
+    path: list[int] = []
+    cur: int = end
 
-    while cur is not None:
+    while cur != NO_PARENT:
         path.append(cur)
-        cur = cur.parent
+        cur = parent[cur]
 
     path.reverse()
     return (path)
 
-def path_to_dir(path: list[Cell]) -> list[str]:
+def path_to_dir(path: list[int], width: int) -> list[str]:
     """
     Convert a path of cells into a list of directions.
 
-    :param path: The path as a list of cells
-    :type path: list[Cell]
+    :param path: The path as a list of cell indices
+    :type path: list[int]
+    :param width: Width of the maze the indices belong to
+    :type width: int
     :return: The path as a list of directions
     :rtype: list[str]
     """
@@ -138,21 +233,13 @@ def path_to_dir(path: list[Cell]) -> list[str]:
     if not path or len(path) < 2:
         return ([])
 
+    steps: dict[int, str] = {-width: "N", width: "S", -1: "W", 1: "E"}
     directions: list[str] = []
 
     for i in range(1, len(path)):
-        prev = path[i - 1]
-        curr = path[i]
-
-        if curr.x == prev.x:
-            if curr.y == prev.y - 1:
-                directions.append("N")
-            elif curr.y == prev.y + 1:
-                directions.append("S")
-        elif curr.y == prev.y:
-            if curr.x == prev.x - 1:
-                directions.append("W")
-            elif curr.x == prev.x + 1:
-                directions.append("E")
-
-    return (directions)
\ No newline at end of file
+        step = steps.get(path[i] - path[i - 1])
+
+        if step is not None:
+            directions.append(step)
+
+    return (directions)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import re
+
+from array import array
+from dataclasses import dataclass
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WALL_MASK, WEST, MazeGrid
+)
+from srcs.maze_solver.astar import UNREACHED
+
+# bytes.translate() table: raw cell byte -> number of open sides, 0 for
+# blocked cells
+DEGREE_TABLE : bytes = bytes(
+    0 if code & BLOCKED else 4 - bin(code & WALL_MASK).count("1")
+    for code in range(256)
+)
+
+_BLOCKED_TABLE : bytes = bytes(
+    1 if code & BLOCKED else 0 for code in range(256)
+)
+
+_DEAD_END : re.Pattern[bytes] = re.compile(b"\x01")
+
+
+@dataclass(frozen=True)
+class MazeMetrics:
+    source: int
+    reachable: int
+    eccentricity: int
+    farthest: int
+    diameter: int
+    diameter_ends: tuple[int, int]
+    dead_ends: int
+    mean_dead_end_depth: float
+    junctions: int
+    branching_factor: float
+
+
+def distance_field(grid: MazeGrid, source: int) -> array[int]:
+    """
+    Compute the passage distance from one cell to every cell.
+
+    A single breadth-first pass, one frontier (distance level) at a
+    time, over the raw wall bytes. The result is a compact int32 array
+    with UNREACHED for blocked and unreachable cells.
+
+    A bitset frontier (one big-int shift per direction and level) was
+    considered, but a maze has about as many levels as cells, which
+    makes that quadratic; the sparse frontier keeps the pass linear.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param source: Index of the cell distances are measured from
+    :type source: int
+    :return: Distance of every cell, indexed like grid.cells
+    :rtype: array[int]
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    steps : tuple[tuple[int, int], ...] = (
+        (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+    )
+
+    dist : array[int] = array("i", [UNREACHED]) * len(cells)
+    dist[source] = 0
+    frontier : list[int] = [source]
+    level : int = 0
+
+    while frontier:
+        level += 1
+        following : list[int] = []
+
+        for current in frontier:
+            code : int = cells[current]
+
+            for wall, step in steps:
+                if code & wall:
+                    continue
+
+                neighbor : int = current + step
+
+                if dist[neighbor] != UNREACHED or cells[neighbor] & BLOCKED:
+                    continue
+
+                dist[neighbor] = level
+                following.append(neighbor)
+
+        frontier = following
+
+    return (dist)
+
+
+def farthest_cell(dist: array[int]) -> tuple[int, int]:
+    """
+    Return the farthest reached cell of a distance field.
+
+    :param dist: Output of distance_field()
+    :type dist: array[int]
+    :return: (cell index, distance), the lowest index on ties
+    :rtype: tuple[int, int]
+    """
+
+    longest : int = max(dist)
+    return (dist.index(longest), longest)
+
+
+def maze_metrics(grid: MazeGrid, source: int) -> MazeMetrics:
+    """
+    Derive structure and difficulty metrics from distance fields.
+
+    - eccentricity / farthest: longest distance from the source and
+      the cell it reaches
+    - diameter: longest shortest path, by a double BFS sweep (farthest
+      cell from the source, then farthest from that one); exact for
+      perfect mazes, a lower bound when the maze has loops
+    - dead ends: reachable cells with a single opening, and their mean
+      distance from the source
+    - junctions: reachable cells with three or more openings
+    - branching factor: mean number of ways on (openings - 1) over the
+      reachable cells that are not dead ends
+
+    Degrees come from one bytes.translate() over the grid and are
+    tallied with bytes.count(), so only the two BFS passes loop over
+    cells in Python.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param source: Index of the reference cell, usually the entry
+    :type source: int
+    :return: The metrics
+    :rtype: MazeMetrics
+    """
+
+    dist : array[int] = distance_field(grid, source)
+    farthest, eccentricity = farthest_cell(dist)
+    other_end, diameter = farthest_cell(distance_field(grid, farthest))
+
+    # Degrees of reachable cells only; blocked cells are already 0, so
+    # the slow pass only runs when some open cell cannot be reached
+    degrees : bytearray = grid.cells.translate(DEGREE_TABLE)
+    reachable : int = len(dist) - dist.count(UNREACHED)
+    blocked : int = grid.cells.translate(_BLOCKED_TABLE).count(1)
+    if reachable != len(dist) - blocked:
+        for idx, distance in enumerate(dist):
+            if distance == UNREACHED:
+                degrees[idx] = 0
+
+    dead_end_depths : list[int] = [
+        dist[match.start()] for match in _DEAD_END.finditer(degrees)
+    ]
+    tally : list[int] = [degrees.count(value) for value in range(5)]
+    inner : int = tally[2] + tally[3] + tally[4]
+    ways_on : int = tally[2] + 2 * tally[3] + 3 * tally[4]
+
+    return (MazeMetrics(
+        source=source,
+        reachable=reachable,
+        eccentricity=eccentricity,
+        farthest=farthest,
+        diameter=diameter,
+        diameter_ends=(farthest, other_end),
+        dead_ends=len(dead_end_depths),
+        mean_dead_end_depth=(
+            sum(dead_end_depths) / len(dead_end_depths)
+            if dead_end_depths else 0.0
+        ),
+        junctions=tally[3] + tally[4],
+        branching_factor=ways_on / inner if inner > 0 else 0.0,
+    ))
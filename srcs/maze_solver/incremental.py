@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import heapq
+
+from array import array
+from collections import deque
+from typing import Callable
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+from srcs.maze_solver.astar import NO_PARENT, UNREACHED, reconstruct_path
+
+WALLS : tuple[int, ...] = (NORTH, SOUTH, WEST, EAST)
+
+
+class MazeEditor:
+    """
+    Mutable maze whose entry -> exit path is repaired after every edit.
+
+    The editor keeps a shortest-path tree rooted at the entry: the
+    passage distance and the parent of every cell reachable from it.
+    One BFS builds the tree, then each edit only relabels the cells
+    whose distance it can change:
+
+    - opening a wall lets distances shrink, so a BFS wave starts at the
+      far side of the new passage and stops where it brings no
+      improvement;
+    - closing a wall of the tree first tries to hang the cut-off cell
+      on another neighbour at the same distance; only if there is none
+      is its subtree detached and relabelled from its border with the
+      rest of the tree (a Dijkstra pass over the subtree only).
+
+    Walls that are not tree edges change no distance at all. The path
+    is read from the parent links, so it is rebuilt only when a
+    relabelled cell lies on it. Connectivity comes with the tree: a
+    cell is connected to the entry exactly when it has a distance.
+
+    Blocked cells keep all four walls closed: block() closes them and
+    unblock() leaves an isolated cell, to be opened with open_wall().
+    """
+
+    grid : MazeGrid
+    entry : int
+    exit : int
+    edits : int
+
+    def __init__(
+        self,
+        grid: MazeGrid,
+        entry: int,
+        exit: int,
+        on_change: Callable[[], None] | None = None
+    ) -> None:
+        """
+        Build the shortest-path tree of the grid, edited in place.
+
+        :param grid: The carved grid to edit
+        :type grid: MazeGrid
+        :param entry: Index of the entry cell, root of the tree
+        :type entry: int
+        :param exit: Index of the exit cell
+        :type exit: int
+        :param on_change: Called after every edit that changes the grid,
+            so owners can drop results derived from it
+        :type on_change: Callable[[], None] | None
+        :raises ValueError: If the entry or the exit is blocked
+        """
+
+        if grid.is_blocked(entry) or grid.is_blocked(exit):
+            raise ValueError("Entry and exit cannot be blocked cells")
+
+        self.grid = grid
+        self.entry = entry
+        self.exit = exit
+        self.edits = 0
+
+        width : int = grid.width
+        self.__steps : tuple[tuple[int, int], ...] = (
+            (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+        )
+        self.__on_change : Callable[[], None] | None = on_change
+        self.__dist : array[int] = array("l", [UNREACHED]) * len(grid)
+        self.__parent : array[int] = array("l", [NO_PARENT]) * len(grid)
+        self.__reached : int = 1
+        self.__path : list[int] | None = None
+        self.__on_path : bytearray = bytearray(len(grid))
+        self.__flagged : list[int] = []
+
+        self.__dist[entry] = 0
+        self.__relax(entry)
+
+
+    @property
+    def reached(self) -> int:
+        """Number of cells connected to the entry, entry included."""
+
+        return (self.__reached)
+
+
+    @property
+    def connected(self) -> bool:
+        """Whether the exit is connected to the entry."""
+
+        return (self.__dist[self.exit] != UNREACHED)
+
+
+    def distance(self, idx: int) -> int:
+        """
+        Return the passage distance of a cell from the entry.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Number of steps, UNREACHED if the cell is not connected
+        :rtype: int
+        """
+
+        return (self.__dist[idx])
+
+
+    def path(self) -> list[int]:
+        """
+        Return a shortest entry -> exit path of the edited maze.
+
+        The path is memoized until an edit relabels one of its cells.
+
+        :return: The path as a list of cell indices, empty if the exit
+            is not connected to the entry
+        :rtype: list[int]
+        """
+
+        if self.__path is None:
+            on_path : bytearray = self.__on_path
+            for idx in self.__flagged:
+                on_path[idx] = 0
+
+            self.__path = (
+                reconstruct_path(self.__parent, self.exit)
+                if self.connected else []
+            )
+
+            # The exit is flagged too, so reconnecting it drops an
+            # empty path
+            self.__flagged = self.__path or [self.exit]
+            for idx in self.__flagged:
+                on_path[idx] = 1
+
+        return (self.__path)
+
+
+    def open_wall(self, idx: int, direction: int) -> int:
+        """
+        Open the wall between a cell and its neighbour.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :param direction: Wall bit to open (NORTH, EAST, SOUTH or WEST)
+        :type direction: int
+        :return: Number of cells whose distance changed
+        :rtype: int
+        :raises ValueError: If the wall is on the maze border or belongs
+            to a blocked cell
+        """
+
+        cells : bytearray = self.grid.cells
+        neighbor : int = self.grid.neighbor(idx, direction)
+
+        if (cells[idx] | cells[neighbor]) & BLOCKED:
+            raise ValueError("Cannot open a wall of a blocked cell")
+
+        if not cells[idx] & direction:
+            return (0)
+
+        self.grid.remove_wall(idx, direction)
+
+        dist : array[int] = self.__dist
+        near : int = idx
+        far : int = neighbor
+
+        if dist[near] == UNREACHED or (
+            dist[far] != UNREACHED and dist[far] < dist[near]
+        ):
+            near, far = far, near
+
+        relabelled : list[int] = []
+
+        if dist[near] != UNREACHED and (
+            dist[far] == UNREACHED or dist[far] > dist[near] + 1
+        ):
+            if dist[far] == UNREACHED:
+                self.__reached += 1
+            dist[far] = dist[near] + 1
+            self.__parent[far] = near
+            relabelled = [far] + self.__relax(far)
+
+        return (self.__edited(relabelled))
+
+
+    def close_wall(self, idx: int, direction: int) -> int:
+        """
+        Close the wall between a cell and its neighbour.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :param direction: Wall bit to close (NORTH, EAST, SOUTH or WEST)
+        :type direction: int
+        :return: Number of cells whose distance was recomputed
+        :rtype: int
+        :raises ValueError: If the wall is on the maze border
+        """
+
+        cells : bytearray = self.grid.cells
+        neighbor : int = self.grid.neighbor(idx, direction)
+
+        if cells[idx] & direction:
+            return (0)
+
+        self.grid.add_wall(idx, direction)
+
+        parent : array[int] = self.__parent
+        roots : list[int] = (
+            [neighbor] if parent[neighbor] == idx
+            else [idx] if parent[idx] == neighbor
+            else []
+        )
+
+        return (self.__edited(self.__detach(roots)))
+
+
+    def block(self, idx: int) -> int:
+        """
+        Close every wall of a cell and mark it as blocked.
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Number of cells whose distance was recomputed
+        :rtype: int
+        :raises ValueError: If the cell is the entry or the exit
+        """
+
+        if idx in (self.entry, self.exit):
+            raise ValueError("Cannot block the entry or the exit")
+
+        grid : MazeGrid = self.grid
+
+        if grid.is_blocked(idx):
+            return (0)
+
+        parent : array[int] = self.__parent
+        children : list[int] = []
+
+        for wall in WALLS:
+            if not grid.cells[idx] & wall:
+                neighbor : int = grid.add_wall(idx, wall)
+                if parent[neighbor] == idx:
+                    children.append(neighbor)
+        grid.block(idx)
+
+        relabelled : list[int] = []
+
+        if self.__dist[idx] != UNREACHED:
+            self.__dist[idx] = UNREACHED
+            parent[idx] = NO_PARENT
+            self.__reached -= 1
+            relabelled = [idx]
+
+        return (self.__edited(relabelled + self.__detach(children)))
+
+
+    def unblock(self, idx: int) -> int:
+        """
+        Clear the blocked flag of a cell.
+
+        The cell keeps its four walls and stays disconnected until one
+        of them is opened with open_wall().
+
+        :param idx: Flat cell index
+        :type idx: int
+        :return: Number of cells whose distance changed, always 0
+        :rtype: int
+        """
+
+        if not self.grid.is_blocked(idx):
+            return (0)
+
+        self.grid.cells[idx] &= ~BLOCKED
+        return (self.__edited([]))
+
+
+    def __edited(self, relabelled: list[int]) -> int:
+        """
+        Drop the path if it crosses a relabelled cell, notify the owner.
+
+        :param relabelled: Cells whose distance or parent changed
+        :type relabelled: list[int]
+        :return: Number of relabelled cells
+        :rtype: int
+        """
+
+        on_path : bytearray = self.__on_path
+
+        if self.__path is not None and any(
+            on_path[idx] for idx in relabelled
+        ):
+            self.__path = None
+
+        self.edits += 1
+        if self.__on_change is not None:
+            self.__on_change()
+
+        return (len(relabelled))
+
+
+    def __relax(self, source: int) -> list[int]:
+        """
+        Spread a distance decrease from one cell, breadth first.
+
+        Every cell in the queue got its final distance, so a neighbour
+        is relabelled when it was unreached or one step too far, and
+        the wave stops at cells it cannot improve. Newly reached cells
+        are counted in self.reached.
+
+        :param source: Cell whose distance was just lowered
+        :type source: int
+        :return: Cells relabelled by the wave, source excluded
+        :rtype: list[int]
+        """
+
+        cells : bytearray = self.grid.cells
+        dist : array[int] = self.__dist
+        parent : array[int] = self.__parent
+        queue : deque[int] = deque([source])
+        relabelled : list[int] = []
+
+        while queue:
+            current : int = queue.popleft()
+            code : int = cells[current]
+            following : int = dist[current] + 1
+
+            for wall, step in self.__steps:
+                if code & wall:
+                    continue
+
+                neighbor : int = current + step
+                known : int = dist[neighbor]
+
+                if known == UNREACHED:
+                    if cells[neighbor] & BLOCKED:
+                        continue
+                    self.__reached += 1
+                elif known <= following:
+                    continue
+
+                dist[neighbor] = following
+                parent[neighbor] = current
+                relabelled.append(neighbor)
+                queue.append(neighbor)
+
+        return (relabelled)
+
+
+    def __detach(self, roots: list[int]) -> list[int]:
+        """
+        Relabel the subtrees cut off the tree at the given cells.
+
+        A single root that still touches a cell one step closer to the
+        entry is simply hung on it. Otherwise the subtrees lose their
+        distances, each of their cells is seeded from its neighbours
+        still in the tree, and a Dijkstra pass confined to the subtrees
+        settles them; cells it cannot reach are disconnected.
+
+        :param roots: Cells whose tree edge to their parent was closed
+        :type roots: list[int]
+        :return: Cells whose distance or parent changed
+        :rtype: list[int]
+        """
+
+        if not roots:
+            return ([])
+
+        cells : bytearray = self.grid.cells
+        dist : array[int] = self.__dist
+        parent : array[int] = self.__parent
+        steps : tuple[tuple[int, int], ...] = self.__steps
+
+        if len(roots) == 1:
+            root : int = roots[0]
+            code : int = cells[root]
+
+            for wall, step in steps:
+                if not code & wall and dist[root + step] == dist[root] - 1:
+                    parent[root] = root + step
+                    return ([root])
+
+        subtree : list[int] = list(roots)
+        detached : set[int] = set(roots)
+
+        for current in subtree:
+            code = cells[current]
+            for wall, step in steps:
+                if not code & wall and parent[current + step] == current:
+                    subtree.append(current + step)
+                    detached.add(current + step)
+
+        for current in subtree:
+            dist[current] = UNREACHED
+            parent[current] = NO_PARENT
+
+        frontier : list[tuple[int, int]] = []
+
+        for current in subtree:
+            code = cells[current]
+            for wall, step in steps:
+                neighbor : int = current + step
+                if code & wall or neighbor in detached:
+                    continue
+                known : int = dist[neighbor]
+                if known != UNREACHED and (
+                    dist[current] == UNREACHED or known + 1 < dist[current]
+                ):
+                    dist[current] = known + 1
+                    parent[current] = neighbor
+            if dist[current] != UNREACHED:
+                frontier.append((dist[current], current))
+
+        heapq.heapify(frontier)
+
+        while frontier:
+            distance, current = heapq.heappop(frontier)
+
+            if distance > dist[current]:
+                continue
+
+            code = cells[current]
+            for wall, step in steps:
+                neighbor = current + step
+                if code & wall or neighbor not in detached:
+                    continue
+                known = dist[neighbor]
+                if known == UNREACHED or distance + 1 < known:
+                    dist[neighbor] = distance + 1
+                    parent[neighbor] = current
+                    heapq.heappush(frontier, (distance + 1, neighbor))
+
+        self.__reached -= sum(
+            1 for current in subtree if dist[current] == UNREACHED
+        )
+        return (subtree)
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import heapq
+import time
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+from srcs.maze_solver.astar import (
+    NO_PARENT, UNREACHED, SearchResult, reconstruct_path, search_astar
+)
+
+# engine(grid, start, goal) -> path and work counters
+Engine = Callable[[MazeGrid, int, int], SearchResult]
+
+
+@dataclass(frozen=True)
+class SearchReport:
+    engine: str
+    result: SearchResult
+    seconds: float
+
+
+def search_bfs(grid: MazeGrid, start: int, goal: int) -> SearchResult:
+    """
+    Find a shortest path with breadth-first search.
+
+    Every passage has the same length, so the first time the goal is
+    dequeued its path is a shortest one, with or without loops in the
+    maze. A cell is marked when it is queued (its parent is set), so it
+    is queued and expanded at most once. The grid is only read.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :return: The path (empty if the goal is unreachable), the number
+        of expanded cells and the queue pushes and pops
+    :rtype: SearchResult
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    steps : tuple[tuple[int, int], ...] = (
+        (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+    )
+
+    parent : array[int] = array("l", [NO_PARENT]) * len(cells)
+    parent[start] = start
+    queue : deque[int] = deque([start])
+    expanded : int = 0
+
+    while queue:
+        current : int = queue.popleft()
+        expanded += 1
+
+        if current == goal:
+            parent[start] = NO_PARENT
+            return (SearchResult(
+                reconstruct_path(parent, goal), expanded,
+                expanded + len(queue), expanded
+            ))
+
+        code : int = cells[current]
+
+        for wall, step in steps:
+            if code & wall:
+                continue
+
+            neighbor : int = current + step
+
+            if parent[neighbor] != NO_PARENT or cells[neighbor] & BLOCKED:
+                continue
+
+            parent[neighbor] = current
+            queue.append(neighbor)
+
+    return (SearchResult([], expanded, expanded, expanded))
+
+
+def search_bidirectional(
+    grid: MazeGrid,
+    start: int,
+    goal: int
+) -> SearchResult:
+    """
+    Find a shortest path with bidirectional breadth-first search.
+
+    Two BFS fronts grow from start and from goal; each round expands one
+    whole level of the smaller front. The first level where the fronts
+    touch contains a shortest path, so that level is finished and the
+    best meeting point kept. On long corridors this expands roughly
+    half the cells of a one-sided BFS.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :return: The path (empty if the goal is unreachable), the number
+        of expanded cells and the queue pushes and pops
+    :rtype: SearchResult
+    """
+
+    if start == goal:
+        return (SearchResult([start], 1, 1, 1))
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    steps : tuple[tuple[int, int], ...] = (
+        (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+    )
+
+    # One (parent, distance, frontier) triple per side
+    parents : tuple[array[int], array[int]] = (
+        array("l", [NO_PARENT]) * len(cells),
+        array("l", [NO_PARENT]) * len(cells),
+    )
+    dists : tuple[array[int], array[int]] = (
+        array("l", [UNREACHED]) * len(cells),
+        array("l", [UNREACHED]) * len(cells),
+    )
+    fronts : list[list[int]] = [[start], [goal]]
+    dists[0][start] = 0
+    dists[1][goal] = 0
+    expanded : int = 0
+    pushes : int = 2
+
+    best : int = -1
+    meet : tuple[int, int] = (NO_PARENT, NO_PARENT)
+
+    while fronts[0] and fronts[1] and best < 0:
+        side : int = 0 if len(fronts[0]) <= len(fronts[1]) else 1
+        parent : array[int] = parents[side]
+        dist : array[int] = dists[side]
+        other : array[int] = dists[1 - side]
+        level : list[int] = []
+
+        for current in fronts[side]:
+            expanded += 1
+            code : int = cells[current]
+
+            for wall, step in steps:
+                if code & wall:
+                    continue
+
+                neighbor : int = current + step
+
+                if cells[neighbor] & BLOCKED:
+                    continue
+
+                if other[neighbor] != UNREACHED:
+                    length : int = dist[current] + 1 + other[neighbor]
+                    if best < 0 or length < best:
+                        best = length
+                        meet = (
+                            (current, neighbor) if side == 0
+                            else (neighbor, current)
+                        )
+                    continue
+
+                if dist[neighbor] != UNREACHED:
+                    continue
+
+                dist[neighbor] = dist[current] + 1
+                parent[neighbor] = current
+                level.append(neighbor)
+
+        pushes += len(level)
+        fronts[side] = level
+
+    if best < 0:
+        return (SearchResult([], expanded, pushes, expanded))
+
+    # meet is an edge (near start, near goal); walk out from both ends
+    path : list[int] = reconstruct_path(parents[0], meet[0])
+    cur : int = meet[1]
+    while cur != NO_PARENT:
+        path.append(cur)
+        cur = parents[1][cur]
+
+    return (SearchResult(path, expanded, pushes, expanded))
+
+
+def search_astar_packed(
+    grid: MazeGrid,
+    start: int,
+    goal: int
+) -> SearchResult:
+    """
+    Find a shortest path with A* on integer-packed heap keys.
+
+    Each heap entry is one int, f << 2B | h << B | index with B the bit
+    width of a cell index, so the heap compares plain ints instead of
+    tuples. Ties on f prefer the cell closer to the goal (smaller h),
+    which keeps the search on the corridor it is following. The path
+    is a shortest one, but on mazes with loops it may differ from the
+    one search_astar() picks.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :return: The path (empty if the goal is unreachable), the number
+        of expanded cells and the heap pushes and pops
+    :rtype: SearchResult
+    """
+
+    cells : bytearray = grid.cells
+    width : int = grid.width
+    goal_y, goal_x = divmod(goal, width)
+
+    bits : int = max(1, (len(cells) - 1).bit_length())
+    index_mask : int = (1 << bits) - 1
+    f_shift : int = 2 * bits
+
+    dist : array[int] = array("l", [UNREACHED]) * len(cells)
+    parent : array[int] = array("l", [NO_PARENT]) * len(cells)
+    closed : bytearray = bytearray(len(cells))
+
+    steps : tuple[tuple[int, int, int, int], ...] = (
+        (NORTH, -width, 0, -1), (SOUTH, width, 0, 1),
+        (WEST, -1, -1, 0), (EAST, 1, 1, 0)
+    )
+
+    start_y, start_x = divmod(start, width)
+    start_h : int = abs(start_x - goal_x) + abs(start_y - goal_y)
+    open_heap : list[int] = [start_h << f_shift | start_h << bits | start]
+    dist[start] = 0
+    expanded : int = 0
+    stale : int = 0
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while open_heap:
+        current : int = heappop(open_heap) & index_mask
+
+        if current == goal:
+            pops : int = expanded + stale + 1
+            return (SearchResult(
+                reconstruct_path(parent, goal), expanded,
+                pops + len(open_heap), pops
+            ))
+
+        if closed[current]:
+            stale += 1
+            continue
+
+        closed[current] = 1
+        expanded += 1
+        code : int = cells[current]
+        tentative_g : int = dist[current] + 1
+        y, x = divmod(current, width)
+
+        for wall, step, dx, dy in steps:
+            if code & wall:
+                continue
+
+            neighbor : int = current + step
+
+            if closed[neighbor] or cells[neighbor] & BLOCKED:
+                continue
+
+            known : int = dist[neighbor]
+
+            if known == UNREACHED or tentative_g < known:
+                parent[neighbor] = current
+                dist[neighbor] = tentative_g
+                h : int = abs(x + dx - goal_x) + abs(y + dy - goal_y)
+                heappush(
+                    open_heap,
+                    (tentative_g + h) << f_shift | h << bits | neighbor
+                )
+
+    return (SearchResult([], expanded, expanded + stale, expanded + stale))
+
+
+ENGINES : Dict[str, Engine] = {
+    "astar": search_astar,
+    "astar_packed": search_astar_packed,
+    "bfs": search_bfs,
+    "bidirectional": search_bidirectional,
+}
+
+
+def get_engine(name: str) -> Engine:
+    """
+    Return the search engine registered under the given name.
+
+    :param name: Engine name, a key of ENGINES
+    :type name: str
+    :return: The search function
+    :rtype: Engine
+    :raises ValueError: If no engine is registered under that name
+    """
+
+    if name not in ENGINES:
+        raise ValueError(f"Unsupported solver engine: {name}")
+
+    return (ENGINES[name])
+
+
+def search(
+    grid: MazeGrid,
+    start: int,
+    goal: int,
+    engine: str = "astar"
+) -> SearchReport:
+    """
+    Run one search with the chosen engine and time it.
+
+    :param grid: The compact grid representing the maze
+    :type grid: MazeGrid
+    :param start: Index of the starting cell
+    :type start: int
+    :param goal: Index of the goal cell
+    :type goal: int
+    :param engine: Engine name, a key of ENGINES
+    :type engine: str
+    :return: Engine name, search result and elapsed seconds
+    :rtype: SearchReport
+    :raises ValueError: If the engine is not supported
+    """
+
+    run : Engine = get_engine(engine)
+    started : float = time.perf_counter()
+    result : SearchResult = run(grid, start, goal)
+
+    return (SearchReport(engine, result, time.perf_counter() - started))
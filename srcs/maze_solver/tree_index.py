@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from array import array
+
+from srcs.maze_generator.maze_grid import (
+    BLOCKED, EAST, NORTH, SOUTH, WEST, MazeGrid
+)
+
+UNREACHED : int = -1
+NO_PARENT : int = -1
+
+
+class TreeIndex:
+    """
+    Path index for perfect mazes.
+
+    A perfect maze is a spanning tree, so the path between two cells is
+    unique: it climbs from both cells to their lowest common ancestor.
+    The index roots the tree once (DFS preorder, parent and depth of
+    every cell) and answers path queries by walking parent links, with
+    no heap and no per-cell priority comparison.
+
+    A binary-lifting table (2^k-th ancestors) is built on the first
+    lca() / distance() call, so those queries take O(log n) without
+    materialising the path.
+    """
+
+    __slots__ = ("grid", "root", "order", "parent", "depth", "_up")
+
+    grid : MazeGrid
+    root : int
+    order : array[int]
+    parent : array[int]
+    depth : array[int]
+    _up : list[array[int]]
+
+    def __init__(self, grid: MazeGrid, root: int) -> None:
+        self.grid = grid
+        self.root = root
+        self._up = []
+        self.__build()
+
+
+    def __build(self) -> None:
+        """
+        Root the maze at self.root with an iterative DFS.
+
+        :return:
+        :rtype: None
+        :raises ValueError: If the carved passages contain a cycle
+        """
+
+        cells : bytearray = self.grid.cells
+        width : int = self.grid.width
+        steps : tuple[tuple[int, int], ...] = (
+            (NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1)
+        )
+
+        parent : array[int] = array("l", [NO_PARENT]) * len(cells)
+        depth : array[int] = array("l", [UNREACHED]) * len(cells)
+        order : array[int] = array("l")
+        stack : list[int] = [self.root]
+
+        depth[self.root] = 0
+
+        while stack:
+            current : int = stack.pop()
+            order.append(current)
+            code : int = cells[current]
+            next_depth : int = depth[current] + 1
+
+            for wall, step in steps:
+                if code & wall:
+                    continue
+
+                neighbor : int = current + step
+
+                if neighbor == parent[current] or cells[neighbor] & BLOCKED:
+                    continue
+
+                if depth[neighbor] != UNREACHED:
+                    raise ValueError(
+                        "Maze is not perfect: passages contain a cycle"
+                    )
+
+                parent[neighbor] = current
+                depth[neighbor] = next_depth
+                stack.append(neighbor)
+
+        self.order = order
+        self.parent = parent
+        self.depth = depth
+
+
+    def __lifting_table(self) -> list[array[int]]:
+        """
+        Build (once) the binary-lifting table of 2^k-th ancestors.
+
+        Level 0 is the parent array with the root pointing at itself,
+        each further level is the previous one applied twice.
+
+        :return: Ancestor arrays, one per power of two
+        :rtype: list[array[int]]
+        """
+
+        if self._up:
+            return (self._up)
+
+        base : list[int] = self.parent.tolist()
+        for idx in self.order:
+            if base[idx] == NO_PARENT:
+                base[idx] = idx
+
+        levels : list[array[int]] = [array("l", base)]
+        max_depth : int = max(self.depth) if self.order else 0
+
+        while (1 << len(levels)) <= max_depth:
+            previous : list[int] = base
+            base = [previous[p] if p >= 0 else p for p in previous]
+            levels.append(array("l", base))
+
+        self._up = levels
+        return (levels)
+
+
+    def lca(self, a: int, b: int) -> int:
+        """
+        Return the lowest common ancestor of two cells.
+
+        :param a: Index of the first cell
+        :type a: int
+        :param b: Index of the second cell
+        :type b: int
+        :return: Index of the common ancestor
+        :rtype: int
+        :raises ValueError: If a cell is not connected to the root
+        """
+
+        depth : array[int] = self.depth
+
+        if depth[a] == UNREACHED or depth[b] == UNREACHED:
+            raise ValueError("Cell is not connected to the index root")
+
+        up : list[array[int]] = self.__lifting_table()
+
+        if depth[a] < depth[b]:
+            a, b = b, a
+
+        diff : int = depth[a] - depth[b]
+        level : int = 0
+        while diff:
+            if diff & 1:
+                a = up[level][a]
+            diff >>= 1
+            level += 1
+
+        if a == b:
+            return (a)
+
+        for level in range(len(up) - 1, -1, -1):
+            if up[level][a] != up[level][b]:
+                a = up[level][a]
+                b = up[level][b]
+
+        return (up[0][a])
+
+
+    def distance(self, a: int, b: int) -> int:
+        """
+        Return the number of steps on the path between two cells.
+
+        :param a: Index of the first cell
+        :type a: int
+        :param b: Index of the second cell
+        :type b: int
+        :return: Path length in steps
+        :rtype: int
+        """
+
+        ancestor : int = self.lca(a, b)
+        return (self.depth[a] + self.depth[b] - 2 * self.depth[ancestor])
+
+
+    def path(self, start: int, goal: int) -> list[int]:
+        """
+        Return the unique path between two cells.
+
+        Both cells climb towards the root, deepest first, until they
+        meet; the cost is proportional to the path length.
+
+        :param start: Index of the starting cell
+        :type start: int
+        :param goal: Index of the goal cell
+        :type goal: int
+        :return: The path from start to goal as a list of cell indices,
+            empty if either cell is not connected to the root
+        :rtype: list[int]
+        """
+
+        depth : array[int] = self.depth
+        parent : array[int] = self.parent
+
+        if depth[start] == UNREACHED or depth[goal] == UNREACHED:
+            return ([])
+
+        head : list[int] = [start]
+        tail : list[int] = [goal]
+        a : int = start
+        b : int = goal
+
+        while depth[a] > depth[b]:
+            a = parent[a]
+            head.append(a)
+        while depth[b] > depth[a]:
+            b = parent[b]
+            tail.append(b)
+        while a != b:
+            a = parent[a]
+            b = parent[b]
+            head.append(a)
+            tail.append(b)
+
+        tail.pop()
+        tail.reverse()
+        return (head + tail)
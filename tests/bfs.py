@@ -0,0 +1,34 @@
+from collections import deque
+
+from srcs.maze_generator.maze_grid import MazeGrid
+
+UNREACHED : int = -1
+
+
+def bfs_distances(grid: MazeGrid, source: int) -> list[int]:
+    """
+    Passage distance of every cell from the source, by plain BFS.
+
+    Deliberately naive: the solvers under test are checked against it.
+    """
+
+    dist : list[int] = [UNREACHED] * len(grid)
+    dist[source] = 0
+    queue : deque[int] = deque([source])
+
+    while queue:
+        current : int = queue.popleft()
+        for neighbor in grid.open_neighbors(current):
+            if dist[neighbor] == UNREACHED:
+                dist[neighbor] = dist[current] + 1
+                queue.append(neighbor)
+
+    return (dist)
+
+
+def is_walkable(grid: MazeGrid, path: list[int]) -> bool:
+    """Whether every step of the path goes through an open wall."""
+
+    return (all(
+        b in grid.open_neighbors(a) for a, b in zip(path, path[1:])
+    ))
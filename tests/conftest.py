@@ -0,0 +1,30 @@
+import pathlib
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+
+
+@pytest.fixture
+def make_maze(tmp_path: pathlib.Path) -> Callable[..., Maze]:
+    """
+    Factory of seeded 20x15 perfect maze configs writing into tmp_path.
+
+    Keyword arguments override config keys, e.g.
+    make_maze(output_format="binary"); the entry and exit default to
+    the top-left and bottom-right corners.
+    """
+
+    def factory(**extra: str) -> Maze:
+        return (Maze({
+            "width": "20",
+            "height": "15",
+            "perfect": "True",
+            "seed": "42",
+            "output_file": str(tmp_path / "maze.txt"),
+            **extra,
+        }))
+
+    return (factory)
@@ -0,0 +1,62 @@
+import random
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_solver.astar import solve_astar, solve_many
+
+from tests.bfs import bfs_distances, is_walkable
+
+
+def open_cells(grid: MazeGrid) -> list[int]:
+    return ([idx for idx in range(len(grid)) if not grid.is_blocked(idx)])
+
+
+def test_interleaved_solves_are_shortest_and_independent(
+    make_maze: Callable[..., Maze]
+) -> None:
+    grid : MazeGrid = MazePipeline(
+        make_maze(width="30", height="20", perfect="False")
+    ).generate()
+    cells : bytes = bytes(grid.cells)
+    rng : random.Random = random.Random(3)
+    queries : list[tuple[int, int]] = [
+        (rng.choice(open_cells(grid)), rng.choice(open_cells(grid)))
+        for _ in range(60)
+    ]
+
+    paths : list[list[int]] = solve_many(grid, queries)
+
+    for (start, goal), path in zip(queries, paths):
+        assert path[0] == start and path[-1] == goal
+        assert is_walkable(grid, path)
+        assert len(path) - 1 == bfs_distances(grid, start)[goal]
+
+    # Same answers backwards, one query at a time, and from 4 threads
+    assert [
+        solve_astar(grid, start, goal) for start, goal in reversed(queries)
+    ] == paths[::-1]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert solve_many(grid, queries, executor) == paths
+    assert grid.cells == cells
+
+
+def test_same_seed_gives_the_same_grid_across_interleaved_calls(
+    make_maze: Callable[..., Maze]
+) -> None:
+    maze : Maze = make_maze(perfect="False")
+    first : MazePipeline = MazePipeline(maze, seed=7)
+    other : MazePipeline = MazePipeline(maze, seed=8)
+
+    first.generate()
+    other.solve()
+    first.solve()
+    second : MazePipeline = MazePipeline(maze, seed=7)
+    other.solve()
+
+    assert second.generate().cells == first.generate().cells
+    assert second.solve() == first.solve()
+    assert other.generate().cells != first.generate().cells
@@ -0,0 +1,38 @@
+import pathlib
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_batch.batch import task_seed
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_io.binary_format import BinaryMaze, load_binary_maze
+from srcs.maze_io.validator import validate_file
+
+
+@pytest.mark.parametrize("seed", [
+    42,
+    -1,
+    (1 << 63) - 1,
+    1 << 63,
+    -(1 << 80),
+    task_seed(1 << 31, 7),
+])
+def test_any_seed_round_trips(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path, seed: int
+) -> None:
+    output : str = str(tmp_path / "maze.amzb")
+    maze : Maze = make_maze(
+        output_file=output, output_format="binary", compression="zlib"
+    )
+    pipeline : MazePipeline = MazePipeline(maze, seed)
+    pipeline.write()
+
+    loaded : BinaryMaze = load_binary_maze(output)
+    try:
+        assert loaded.info.seed == seed
+        assert loaded.directions == pipeline.directions()
+    finally:
+        loaded.close()
+    assert validate_file(output).ok
@@ -0,0 +1,96 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+from typing import Callable
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_io.binary_format import MAGIC
+from srcs.maze_io.cache import MazeCache
+
+
+ENTRY_POINT : pathlib.Path = (
+    pathlib.Path(__file__).resolve().parent.parent / "a_maze_ing.py"
+)
+
+
+def test_binary_output_survives_cache_hit(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    output : str = str(tmp_path / "maze.amzb")
+    maze : Maze = make_maze(output_file=output, output_format="binary")
+    cache : MazeCache = MazeCache(str(tmp_path / "cache"))
+
+    for expected_hits in (0, 1):
+        if os.path.exists(output):
+            os.remove(output)
+        cache.get_or_generate(maze)
+        assert cache.hits == expected_hits
+        with open(output, "rb") as file:
+            assert file.read(len(MAGIC)) == MAGIC
+
+
+def test_truncated_entry_is_evicted_as_a_miss(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    maze : Maze = make_maze()
+    directory : str = str(tmp_path / "cache")
+    MazeCache(directory).get_or_generate(maze)
+
+    entry : str = os.path.join(directory, os.listdir(directory)[0])
+    with open(entry, "r+b") as file:
+        file.truncate(5)
+
+    cache : MazeCache = MazeCache(directory)
+    assert cache.get(maze) is None
+    assert not os.path.exists(entry)
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 1, 1)
+
+    cache.get_or_generate(maze)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.get(maze) is not None
+    assert cache.hits == 1
+
+
+def test_get_counts_hits_misses_and_bypasses(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    cache : MazeCache = MazeCache(str(tmp_path / "cache"))
+    maze : Maze = make_maze()
+    unseeded : Maze = Maze({"output_file": str(tmp_path / "other.txt")})
+
+    assert cache.get(maze) is None
+    cache.get_or_generate(maze)
+    assert cache.get(maze) is not None
+    assert cache.get(unseeded) is None
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["bypasses"] == 1
+
+
+def test_cli_serves_the_second_run_from_the_cache(
+    tmp_path: pathlib.Path
+) -> None:
+    output : str = str(tmp_path / "maze.txt")
+    config : str = str(tmp_path / "config.txt")
+    with open(config, "w", encoding="utf-8") as file:
+        file.write(f"WIDTH=20\nHEIGHT=15\nSEED=42\nOUTPUT_FILE={output}\n")
+
+    written : list[bytes] = []
+    counters : list[dict[str, int]] = []
+    for _ in range(2):
+        process : subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, str(ENTRY_POINT), config,
+             "--cache", str(tmp_path / "cache")],
+            capture_output=True, text=True, check=True
+        )
+        counters.append(json.loads(process.stderr)["cache"])
+        with open(output, "rb") as file:
+            written.append(file.read())
+
+    assert (counters[0]["misses"], counters[0]["stores"]) == (1, 1)
+    assert (counters[1]["hits"], counters[1]["misses"]) == (1, 0)
+    assert written[0] == written[1]
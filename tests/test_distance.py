@@ -0,0 +1,75 @@
+from typing import Callable
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_grid import EAST, SOUTH, MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_solver.astar import UNREACHED
+from srcs.maze_solver.distance import (
+    MazeMetrics, distance_field, maze_metrics
+)
+
+from tests.bfs import bfs_distances
+
+
+def known_maze() -> MazeGrid:
+    """
+    3x3 tree with cell 5 walled off:
+
+        0 - 1 - 2
+            |
+        3 - 4   5
+            |
+        6 - 7 - 8
+    """
+
+    grid : MazeGrid = MazeGrid(3, 3)
+    for idx, direction in (
+        (0, EAST), (1, EAST), (1, SOUTH), (3, EAST), (4, SOUTH), (6, EAST),
+        (7, EAST),
+    ):
+        grid.remove_wall(idx, direction)
+    return (grid)
+
+
+def test_distance_field_of_the_known_maze() -> None:
+    assert distance_field(known_maze(), 0).tolist() == [
+        0, 1, 2, 3, 2, UNREACHED, 4, 3, 4
+    ]
+
+
+def test_metrics_of_the_known_maze() -> None:
+    assert maze_metrics(known_maze(), 0) == MazeMetrics(
+        source=0,
+        reachable=8,
+        eccentricity=4,
+        farthest=6,
+        diameter=4,
+        diameter_ends=(6, 0),
+        dead_ends=5,
+        mean_dead_end_depth=2.6,
+        junctions=3,
+        branching_factor=2.0,
+    )
+
+
+def test_pipeline_metrics_match_brute_force(
+    make_maze: Callable[..., Maze]
+) -> None:
+    pipeline : MazePipeline = MazePipeline(make_maze())
+    grid : MazeGrid = pipeline.grid
+    cells : list[int] = [
+        idx for idx in range(len(grid)) if not grid.is_blocked(idx)
+    ]
+    fields : dict[int, list[int]] = {
+        idx: bfs_distances(grid, idx) for idx in cells
+    }
+    metrics : MazeMetrics = pipeline.metrics()
+
+    assert pipeline.distance_field().tolist() == fields[0]
+    assert metrics.reachable == len(cells)
+    assert metrics.eccentricity == max(fields[0])
+    # Perfect maze: the double sweep finds the exact diameter
+    assert metrics.diameter == max(max(field) for field in fields.values())
+    assert metrics.dead_ends == sum(
+        len(grid.open_neighbors(idx)) == 1 for idx in cells
+    )
@@ -0,0 +1,105 @@
+import pathlib
+import struct
+import zlib
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_io.image import export_image
+from srcs.maze_io.render import PATH
+
+
+def read_png(path: pathlib.Path) -> tuple[int, int, bytes, bytes]:
+    """Return the width, height, palette and unfiltered pixel rows."""
+
+    data : bytes = path.read_bytes()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+
+    chunks : dict[bytes, list[bytes]] = {}
+    offset : int = 8
+    while offset < len(data):
+        length, kind = struct.unpack_from(">I4s", data, offset)
+        body : bytes = data[offset + 8:offset + 8 + length]
+        crc : int = struct.unpack_from(">I", data, offset + 8 + length)[0]
+        assert crc == zlib.crc32(kind + body)
+        chunks.setdefault(kind, []).append(body)
+        offset += 12 + length
+
+    width, height, depth, color_type = struct.unpack_from(
+        ">IIBB", chunks[b"IHDR"][0]
+    )
+    assert (depth, color_type) == (8, 3)
+    assert b"IEND" in chunks
+
+    raw : bytes = zlib.decompress(b"".join(chunks[b"IDAT"]))
+    assert len(raw) == height * (width + 1)
+
+    pixels : bytearray = bytearray()
+    previous : bytes = bytes(width)
+    for y in range(height):
+        start : int = y * (width + 1)
+        row_filter : int = raw[start]
+        line : bytes = raw[start + 1:start + 1 + width]
+        if row_filter == 2:
+            line = bytes((a + b) & 0xFF for a, b in zip(line, previous))
+        else:
+            assert row_filter == 0
+        pixels += line
+        previous = line
+
+    return (width, height, chunks[b"PLTE"][0], bytes(pixels))
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_png_matches_ppm_pixel_for_pixel(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path, scale: int
+) -> None:
+    pipeline : MazePipeline = MazePipeline(make_maze(width="9", height="7"))
+    png : pathlib.Path = tmp_path / "maze.png"
+    ppm : pathlib.Path = tmp_path / "maze.ppm"
+
+    written : int = export_image(
+        str(png), pipeline.grid, pipeline.path, scale
+    )
+    export_image(str(ppm), pipeline.grid, pipeline.path, scale)
+    width, height, palette, indices = read_png(png)
+
+    assert written == png.stat().st_size
+    assert (width, height) == (19 * scale, 15 * scale)
+    assert PATH in indices
+
+    header : bytes = f"P6\n{width} {height}\n255\n".encode("ascii")
+    assert ppm.read_bytes() == header + b"".join(
+        palette[3 * index:3 * index + 3] for index in indices
+    )
+
+
+def test_pgm_size_and_corners(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    pipeline : MazePipeline = MazePipeline(make_maze(width="9", height="7"))
+    pgm : pathlib.Path = tmp_path / "maze.pgm"
+
+    export_image(str(pgm), pipeline.grid, None, 2)
+    header : bytes = b"P5\n38 30\n255\n"
+    pixels : bytes = pgm.read_bytes()[len(header):]
+
+    assert pgm.read_bytes().startswith(header)
+    assert len(pixels) == 38 * 30
+    # Outer corners are walls (black), the entry cell is a passage
+    assert pixels[0] == pixels[-1] == 0
+    assert pixels[2 * 38 + 2] == 255
+
+
+def test_unknown_format_and_bad_scale_are_rejected(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    pipeline : MazePipeline = MazePipeline(make_maze())
+
+    with pytest.raises(ValueError):
+        export_image(str(tmp_path / "maze.gif"), pipeline.grid)
+    with pytest.raises(ValueError):
+        export_image(str(tmp_path / "maze.png"), pipeline.grid, scale=0)
@@ -0,0 +1,124 @@
+import random
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_grid import EAST, NORTH, SOUTH, WEST, MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_solver.incremental import MazeEditor
+
+from tests.bfs import UNREACHED, bfs_distances, is_walkable
+
+
+def random_edit(editor: MazeEditor, rng: random.Random) -> None:
+    grid : MazeGrid = editor.grid
+    idx : int = rng.randrange(len(grid))
+    x, y = grid.coords(idx)
+    directions : list[int] = [
+        direction for direction, inside in (
+            (NORTH, y > 0), (SOUTH, y < grid.height - 1),
+            (WEST, x > 0), (EAST, x < grid.width - 1),
+        )
+        if inside
+    ]
+    operation : float = rng.random()
+
+    try:
+        if operation < 0.4:
+            editor.open_wall(idx, rng.choice(directions))
+        elif operation < 0.8:
+            editor.close_wall(idx, rng.choice(directions))
+        elif operation < 0.9:
+            editor.block(idx)
+        else:
+            editor.unblock(idx)
+    except ValueError:
+        # Entry / exit blocks and walls of blocked cells are refused
+        pass
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("perfect", ["True", "False"])
+def test_random_edits_keep_the_shortest_path_tree(
+    make_maze: Callable[..., Maze], seed: int, perfect: str
+) -> None:
+    pipeline : MazePipeline = MazePipeline(make_maze(
+        width="15", height="11", perfect=perfect, seed=str(seed)
+    ))
+    editor : MazeEditor = pipeline.edit()
+    rng : random.Random = random.Random(seed)
+
+    for _ in range(200):
+        random_edit(editor, rng)
+        expected : list[int] = bfs_distances(editor.grid, editor.entry)
+        path : list[int] = editor.path()
+
+        assert [
+            editor.distance(idx) for idx in range(len(editor.grid))
+        ] == expected
+        assert editor.reached == len(expected) - expected.count(UNREACHED)
+        assert editor.connected == (expected[editor.exit] != UNREACHED)
+
+        if editor.connected:
+            assert path[0] == editor.entry and path[-1] == editor.exit
+            assert len(path) - 1 == expected[editor.exit]
+            assert is_walkable(editor.grid, path)
+        else:
+            assert path == []
+
+
+def test_entry_and_blocked_cells_are_protected(
+    make_maze: Callable[..., Maze]
+) -> None:
+    editor : MazeEditor = MazePipeline(make_maze()).edit()
+    blocked : int = next(
+        idx for idx in range(len(editor.grid))
+        if editor.grid.is_blocked(idx)
+    )
+
+    with pytest.raises(ValueError):
+        editor.block(editor.entry)
+    with pytest.raises(ValueError):
+        editor.open_wall(blocked, NORTH)
+    assert editor.edits == 0
+
+
+def test_edits_invalidate_every_pipeline_result(
+    make_maze: Callable[..., Maze]
+) -> None:
+    maze : Maze = make_maze()
+    pipeline : MazePipeline = MazePipeline(maze)
+    path : list[int] = pipeline.solve()
+    directions : str = pipeline.directions()
+    render : bytes = pipeline.render(show_path=True)
+    pipeline.write()
+    with open(maze.output_file, "rb") as file:
+        written : bytes = file.read()
+
+    # Perfect maze: blocking a cell of the only path disconnects the exit
+    editor : MazeEditor = pipeline.edit()
+    middle : int = path[len(path) // 2]
+    editor.block(middle)
+
+    assert pipeline.solve() == editor.path() == []
+    assert pipeline.directions() == ""
+    assert pipeline.render(show_path=True) != render
+    pipeline.write()
+    with open(maze.output_file, "rb") as file:
+        assert file.read() != written
+
+    # Reopening the two passages restores the original maze
+    width : int = editor.grid.width
+    towards : dict[int, int] = {-width: NORTH, width: SOUTH, -1: WEST, 1: EAST}
+    editor.unblock(middle)
+    for neighbor in path[len(path) // 2 - 1:len(path) // 2 + 2:2]:
+        editor.open_wall(middle, towards[neighbor - middle])
+
+    assert pipeline.solve() == editor.path() == path
+    assert pipeline.directions() == directions
+    assert pipeline.render(show_path=True) == render
+    pipeline.write()
+    with open(maze.output_file, "rb") as file:
+        assert file.read() == written
@@ -0,0 +1,70 @@
+import random
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.loops import add_loops, closed_inner_walls
+from srcs.maze_generator.maze_grid import EAST, SOUTH, MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+
+from tests.bfs import UNREACHED, bfs_distances
+
+
+def perfect_grid(make_maze: Callable[..., Maze]) -> MazeGrid:
+    return (MazePipeline(make_maze(width="24", height="18")).generate())
+
+
+def open_cells(grid: MazeGrid) -> list[int]:
+    return ([idx for idx in range(len(grid)) if not grid.is_blocked(idx)])
+
+
+def open_areas(grid: MazeGrid) -> list[tuple[int, int]]:
+    """Top-left corner of every 3x3 block with no inner wall."""
+
+    return ([
+        (left, top)
+        for top in range(grid.height - 2)
+        for left in range(grid.width - 2)
+        if all(
+            not grid.cells[grid.index(left + col, top + row)] & EAST
+            and not grid.cells[grid.index(left + row, top + col)] & SOUTH
+            for row in range(3)
+            for col in range(2)
+        )
+    ])
+
+
+def test_closed_inner_walls_matches_a_cell_scan(
+    make_maze: Callable[..., Maze]
+) -> None:
+    grid : MazeGrid = perfect_grid(make_maze)
+    expected : list[int] = []
+
+    for idx in open_cells(grid):
+        x, y = grid.coords(idx)
+        if (x < grid.width - 1 and grid.cells[idx] & EAST
+                and not grid.is_blocked(idx + 1)):
+            expected.append(idx << 1)
+        if (y < grid.height - 1 and grid.cells[idx] & SOUTH
+                and not grid.is_blocked(idx + grid.width)):
+            expected.append(idx << 1 | 1)
+
+    assert closed_inner_walls(grid) == expected
+
+
+@pytest.mark.parametrize("fraction", [0.1, 0.5, 1.0])
+def test_loops_keep_the_maze_connected_without_open_areas(
+    make_maze: Callable[..., Maze], fraction: float
+) -> None:
+    grid : MazeGrid = perfect_grid(make_maze)
+    before : int = len(closed_inner_walls(grid))
+
+    opened : int = add_loops(grid, fraction, random.Random(5))
+
+    assert opened > 0
+    assert len(closed_inner_walls(grid)) == before - opened
+    assert open_areas(grid) == []
+    distances : list[int] = bfs_distances(grid, 0)
+    assert all(distances[idx] != UNREACHED for idx in open_cells(grid))
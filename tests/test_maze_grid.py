@@ -0,0 +1,99 @@
+import pytest
+
+from srcs.maze_generator.cell import Cell
+from srcs.maze_generator.maze_grid import (
+    ALL_WALLS, BLOCKED, EAST, NORTH, OPPOSITE, SOUTH, VISITED, WEST,
+    MazeGrid
+)
+
+
+def test_index_and_coords_round_trip() -> None:
+    grid : MazeGrid = MazeGrid(7, 4)
+
+    assert len(grid) == 28
+    assert grid.index(0, 0) == 0
+    assert grid.index(6, 0) == 6
+    assert grid.index(0, 1) == 7
+    assert grid.index(6, 3) == 27
+    for idx in range(len(grid)):
+        assert grid.index(*grid.coords(idx)) == idx
+
+
+def test_new_grid_has_every_wall_closed() -> None:
+    grid : MazeGrid = MazeGrid(3, 3)
+
+    assert all(grid.walls(idx) == ALL_WALLS for idx in range(len(grid)))
+    assert grid.wall_codes() == bytearray([ALL_WALLS]) * 9
+    assert grid.open_neighbors(4) == []
+
+
+def test_neighbor_stays_inside_the_maze() -> None:
+    grid : MazeGrid = MazeGrid(3, 2)
+
+    assert grid.neighbor(4, NORTH) == 1
+    assert grid.neighbor(1, SOUTH) == 4
+    assert grid.neighbor(4, WEST) == 3
+    assert grid.neighbor(4, EAST) == 5
+    for idx, direction in ((1, NORTH), (4, SOUTH), (3, WEST), (2, EAST)):
+        with pytest.raises(ValueError):
+            grid.neighbor(idx, direction)
+
+
+@pytest.mark.parametrize("direction", [NORTH, EAST, SOUTH, WEST])
+def test_walls_change_on_both_sides(direction: int) -> None:
+    grid : MazeGrid = MazeGrid(3, 3)
+    neighbor : int = grid.remove_wall(4, direction)
+
+    assert neighbor == grid.neighbor(4, direction)
+    assert grid.walls(4) == ALL_WALLS & ~direction
+    assert grid.walls(neighbor) == ALL_WALLS & ~OPPOSITE[direction]
+    assert grid.open_neighbors(4) == [neighbor]
+    assert grid.open_neighbors(neighbor) == [4]
+
+    assert grid.add_wall(4, direction) == neighbor
+    assert grid.cells == MazeGrid(3, 3).cells
+
+
+def test_border_walls_cannot_be_opened() -> None:
+    grid : MazeGrid = MazeGrid(2, 2)
+
+    with pytest.raises(ValueError):
+        grid.remove_wall(0, NORTH)
+    assert grid.cells == MazeGrid(2, 2).cells
+
+
+def test_block_keeps_walls_and_flags_apart() -> None:
+    grid : MazeGrid = MazeGrid(2, 2)
+    grid.cells[1] |= VISITED
+    grid.block(2)
+
+    assert grid.is_blocked(2) and not grid.is_visited(2)
+    assert grid.is_visited(1) and not grid.is_blocked(1)
+    assert grid.cells[2] == ALL_WALLS | BLOCKED
+    assert grid.wall_codes() == bytearray([ALL_WALLS]) * 4
+
+
+def test_cell_views_write_through_to_the_grid() -> None:
+    grid : MazeGrid = MazeGrid(3, 2)
+    cell : Cell = Cell(2, 1, grid)
+
+    cell.north = False
+    cell.blocked = True
+
+    assert grid.cells[5] == ALL_WALLS & ~NORTH | BLOCKED
+    assert Cell(2, 1, grid).encode_walls() == "E"
+    assert cell == Cell(2, 1)
+
+
+def test_standalone_cells_keep_the_old_behaviour() -> None:
+    near : Cell = Cell(3, 0)
+    far : Cell = Cell(0, 1)
+
+    assert near.encode_walls() == "F"
+    assert not near.visited and not near.blocked
+    assert near.parent is None and near.g == float("inf")
+
+    near.f, far.f = 2.0, 1.0
+    assert far < near
+    far.f = 2.0
+    assert near < far
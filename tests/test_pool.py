@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import json
+import pathlib
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from srcs.maze_server import pool as pool_module
+from srcs.maze_server.pool import FAILURE_LIMIT, MazePool, PoolStats
+from srcs.maze_server.server import MazeServer
+
+
+CONFIG : dict[str, str] = {
+    "width": "20",
+    "height": "15",
+    "entry": "0,0",
+    "exit": "19,14",
+    "perfect": "True",
+    "output_file": "unused.txt",
+}
+
+
+def always_fail(task: tuple[dict[str, str], int]) -> bytes:
+    raise ValueError("generation failed")
+
+
+@pytest.fixture
+def failing_generation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pool_module, "generate_payload", always_fail)
+    monkeypatch.setattr(pool_module, "BACKOFF_SECONDS", 0.001)
+
+
+def test_pool_fails_after_repeated_failures(
+    failing_generation: None
+) -> None:
+
+    async def scenario() -> PoolStats:
+        pool : MazePool = MazePool("failing", CONFIG, capacity=2)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pool.start(executor, 2)
+            try:
+                with pytest.raises(RuntimeError):
+                    await asyncio.wait_for(pool.take(), timeout=5)
+                return (pool.stats())
+            finally:
+                await pool.stop()
+
+    stats : PoolStats = asyncio.run(scenario())
+
+    assert stats.error is not None
+    assert FAILURE_LIMIT <= stats.failures < FAILURE_LIMIT + 2
+
+
+def test_server_replies_with_an_error(
+    failing_generation: None, tmp_path: pathlib.Path
+) -> None:
+    config_file : str = str(tmp_path / "failing.txt")
+    socket_path : str = str(tmp_path / "maze.sock")
+    with open(config_file, "w", encoding="utf-8") as file:
+        file.writelines(f"{key}={value}\n" for key, value in CONFIG.items())
+
+    async def request(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        line: bytes
+    ) -> dict[str, Any]:
+        writer.write(line + b"\n")
+        await writer.drain()
+        response : dict[str, Any] = json.loads(
+            await asyncio.wait_for(reader.readline(), timeout=5)
+        )
+        return (response)
+
+    async def scenario() -> list[dict[str, Any]]:
+        server : MazeServer = MazeServer([config_file], capacity=2, jobs=1)
+        listening : asyncio.Event = asyncio.Event()
+        serving : asyncio.Task[None] = asyncio.create_task(server.serve(
+            f"unix:{socket_path}", lambda address: listening.set()
+        ))
+
+        try:
+            await asyncio.wait_for(listening.wait(), timeout=5)
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            try:
+                return ([
+                    await request(reader, writer, b'{"op": "maze"}'),
+                    await request(reader, writer, b'{"op": "metrics"}'),
+                ])
+            finally:
+                writer.close()
+        finally:
+            serving.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await serving
+
+    maze, metrics = asyncio.run(scenario())
+
+    assert maze["ok"] is False
+    assert "generation failed" in maze["error"]
+    assert metrics["ok"] is True
+    assert "generation failed" in metrics["pools"][0]["error"]
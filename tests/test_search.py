@@ -0,0 +1,62 @@
+import random
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_solver.astar import SearchResult
+from srcs.maze_solver.search import ENGINES, SearchReport, search
+
+from tests.bfs import bfs_distances, is_walkable
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("perfect", ["True", "False"])
+def test_engines_find_shortest_paths(
+    make_maze: Callable[..., Maze], engine: str, perfect: str
+) -> None:
+    grid : MazeGrid = MazePipeline(make_maze(
+        width="31", height="23", perfect=perfect, loop_fraction="0.2"
+    )).generate()
+    cells : list[int] = [
+        idx for idx in range(len(grid)) if not grid.is_blocked(idx)
+    ]
+    rng : random.Random = random.Random(engine)
+
+    for _ in range(30):
+        start : int = rng.choice(cells)
+        goal : int = rng.choice(cells)
+        result : SearchResult = ENGINES[engine](grid, start, goal)
+
+        assert result.path[0] == start and result.path[-1] == goal
+        assert len(result.path) - 1 == bfs_distances(grid, start)[goal]
+        assert is_walkable(grid, result.path)
+        assert 0 < result.expanded <= len(cells)
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_unreachable_goal_gives_an_empty_path(
+    make_maze: Callable[..., Maze], engine: str
+) -> None:
+    grid : MazeGrid = MazePipeline(make_maze()).generate()
+    blocked : int = next(
+        idx for idx in range(len(grid)) if grid.is_blocked(idx)
+    )
+
+    assert ENGINES[engine](grid, 0, blocked).path == []
+
+
+def test_search_reports_the_engine_and_rejects_unknown_ones(
+    make_maze: Callable[..., Maze]
+) -> None:
+    grid : MazeGrid = MazePipeline(make_maze()).generate()
+    report : SearchReport = search(grid, 0, len(grid) - 1, "bidirectional")
+
+    assert report.engine == "bidirectional"
+    assert report.seconds >= 0
+    assert report.result.path == search(grid, 0, len(grid) - 1).result.path
+    with pytest.raises(ValueError):
+        search(grid, 0, 1, "dijkstra")
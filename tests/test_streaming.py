@@ -0,0 +1,43 @@
+import pathlib
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.streaming import generate_streaming
+from srcs.maze_io.validator import ValidationReport, validate_file
+
+
+def test_streamed_and_solved_maze_is_valid(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    output : str = str(tmp_path / "maze.txt")
+
+    generate_streaming(make_maze(output_file=output), solve=True)
+    report : ValidationReport = validate_file(output, perfect=True)
+
+    assert report.ok, report.errors
+
+
+@pytest.mark.parametrize("extra", [
+    {"perfect": "False"},
+    {"output_format": "binary"},
+])
+def test_streaming_rejects_unsupported_configs(
+    make_maze: Callable[..., Maze], extra: dict[str, str]
+) -> None:
+    with pytest.raises(ValueError):
+        generate_streaming(make_maze(**extra))
+
+
+def test_streamed_maze_without_path_is_valid(
+    make_maze: Callable[..., Maze], tmp_path: pathlib.Path
+) -> None:
+    output : str = str(tmp_path / "maze.txt")
+
+    generate_streaming(make_maze(output_file=output))
+    report : ValidationReport = validate_file(output, perfect=True)
+
+    assert report.ok, report.errors
+    assert "path" not in report.checks
@@ -0,0 +1,56 @@
+import random
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze, Point
+from srcs.maze_generator.mask import mask_42_cells
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_generator.tiled import carve_tiled
+from srcs.maze_io.validator import ValidationReport, validate_grid
+
+WIDTH : int = 37
+HEIGHT : int = 29
+
+
+def carve(algorithm: str, jobs: int) -> MazeGrid:
+    grid : MazeGrid = MazeGrid(WIDTH, HEIGHT)
+    for x, y in mask_42_cells(WIDTH, HEIGHT):
+        grid.block(grid.index(x, y))
+    carve_tiled(grid, algorithm, 8, random.Random(11), jobs)
+    return (grid)
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "kruskal", "sidewinder"])
+def test_tiled_maze_is_perfect_and_independent_of_jobs(
+    algorithm: str
+) -> None:
+    grid : MazeGrid = carve(algorithm, 1)
+    report : ValidationReport = validate_grid(
+        grid, Point(0, 0), Point(WIDTH - 1, HEIGHT - 1), perfect=True
+    )
+
+    assert report.ok, report.errors
+    assert {"reachable", "perfect"} <= set(report.checks)
+    assert carve(algorithm, 3).cells == grid.cells
+
+
+def test_pipeline_carves_tiles_when_configured(
+    make_maze: Callable[..., Maze]
+) -> None:
+    maze : Maze = make_maze(width="30", height="25", tile_size="7")
+    pipeline : MazePipeline = MazePipeline(maze)
+    report : ValidationReport = validate_grid(
+        pipeline.grid, maze.entry, maze.exit, pipeline.directions(),
+        perfect=True
+    )
+
+    assert report.ok, report.errors
+    assert MazePipeline(maze).grid.cells == pipeline.grid.cells
+
+
+def test_tile_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        carve_tiled(MazeGrid(9, 7), "dfs", 0)
@@ -0,0 +1,69 @@
+import random
+
+from typing import Callable
+
+import pytest
+
+from srcs.maze_config.maze import Maze
+from srcs.maze_generator.maze_grid import MazeGrid
+from srcs.maze_generator.pipeline import MazePipeline
+from srcs.maze_solver.tree_index import TreeIndex
+
+from tests.bfs import bfs_distances, is_walkable
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "kruskal", "wilson"])
+def test_distance_lca_and_path_match_bfs(
+    make_maze: Callable[..., Maze], algorithm: str
+) -> None:
+    grid : MazeGrid = MazePipeline(
+        make_maze(width="25", height="18", algorithm=algorithm)
+    ).generate()
+    root : int = 0
+    index : TreeIndex = TreeIndex(grid, root)
+    from_root : list[int] = bfs_distances(grid, root)
+    cells : list[int] = [
+        idx for idx in range(len(grid)) if not grid.is_blocked(idx)
+    ]
+    rng : random.Random = random.Random(algorithm)
+
+    for _ in range(40):
+        a : int = rng.choice(cells)
+        b : int = rng.choice(cells)
+        from_a : list[int] = bfs_distances(grid, a)
+        from_b : list[int] = bfs_distances(grid, b)
+        lca : int = index.lca(a, b)
+
+        assert index.distance(a, b) == from_a[b]
+        # The common ancestor lies on the a - b path and above both
+        assert from_a[lca] + from_b[lca] == from_a[b]
+        assert from_root[lca] + from_a[lca] == from_root[a]
+        assert from_root[lca] + from_b[lca] == from_root[b]
+
+        path : list[int] = index.path(a, b)
+        assert path[0] == a and path[-1] == b
+        assert len(path) - 1 == from_a[b]
+        assert is_walkable(grid, path)
+
+
+def test_blocked_cells_are_not_indexed(
+    make_maze: Callable[..., Maze]
+) -> None:
+    grid : MazeGrid = MazePipeline(make_maze()).generate()
+    blocked : int = next(
+        idx for idx in range(len(grid)) if grid.is_blocked(idx)
+    )
+    index : TreeIndex = TreeIndex(grid, 0)
+
+    assert index.path(0, blocked) == []
+    with pytest.raises(ValueError):
+        index.lca(0, blocked)
+
+
+def test_cycles_are_rejected(make_maze: Callable[..., Maze]) -> None:
+    grid : MazeGrid = MazePipeline(
+        make_maze(perfect="False", loop_fraction="0.3")
+    ).generate()
+
+    with pytest.raises(ValueError):
+        TreeIndex(grid, 0)